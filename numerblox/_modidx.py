@@ -94,14 +94,40 @@ d = { 'settings': { 'branch': 'master',
             'numerblox.evaluation': { 'numerblox.evaluation.BaseEvaluator': ('evaluation.html#baseevaluator', 'numerblox/evaluation.py'),
                                       'numerblox.evaluation.BaseEvaluator.__init__': ( 'evaluation.html#baseevaluator.__init__',
                                                                                        'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._batch_feature_exposures': ( 'evaluation.html#baseevaluator._batch_feature_exposures',
+                                                                                                       'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._corr_frame': ( 'evaluation.html#baseevaluator._corr_frame',
+                                                                                          'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._era_index': ( 'evaluation.html#baseevaluator._era_index',
+                                                                                         'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._feature_neutral_mean_std_sharpe_cols': ( 'evaluation.html#baseevaluator._feature_neutral_mean_std_sharpe_cols',
+                                                                                                                    'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._mean_std_sharpe_cols': ( 'evaluation.html#baseevaluator._mean_std_sharpe_cols',
+                                                                                                    'numerblox/evaluation.py'),
                                       'numerblox.evaluation.BaseEvaluator._neutralize_series': ( 'evaluation.html#baseevaluator._neutralize_series',
                                                                                                  'numerblox/evaluation.py'),
                                       'numerblox.evaluation.BaseEvaluator._normalize_uniform': ( 'evaluation.html#baseevaluator._normalize_uniform',
                                                                                                  'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._numerai_preds': ( 'evaluation.html#baseevaluator._numerai_preds',
+                                                                                             'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._numerai_target': ( 'evaluation.html#baseevaluator._numerai_target',
+                                                                                              'numerblox/evaluation.py'),
                                       'numerblox.evaluation.BaseEvaluator._score_by_date': ( 'evaluation.html#baseevaluator._score_by_date',
                                                                                              'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._segment_mean': ( 'evaluation.html#baseevaluator._segment_mean',
+                                                                                            'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._segment_pearson': ( 'evaluation.html#baseevaluator._segment_pearson',
+                                                                                               'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._segment_uniform': ( 'evaluation.html#baseevaluator._segment_uniform',
+                                                                                               'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._sorted_values': ( 'evaluation.html#baseevaluator._sorted_values',
+                                                                                             'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator._tails_p15': ( 'evaluation.html#baseevaluator._tails_p15',
+                                                                                         'numerblox/evaluation.py'),
                                       'numerblox.evaluation.BaseEvaluator.apy': ( 'evaluation.html#baseevaluator.apy',
                                                                                   'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator.evaluation_all_cols': ( 'evaluation.html#baseevaluator.evaluation_all_cols',
+                                                                                                  'numerblox/evaluation.py'),
                                       'numerblox.evaluation.BaseEvaluator.evaluation_one_col': ( 'evaluation.html#baseevaluator.evaluation_one_col',
                                                                                                  'numerblox/evaluation.py'),
                                       'numerblox.evaluation.BaseEvaluator.example_correlation': ( 'evaluation.html#baseevaluator.example_correlation',
@@ -120,6 +146,10 @@ d = { 'settings': { 'branch': 'master',
                                                                                               'numerblox/evaluation.py'),
                                       'numerblox.evaluation.BaseEvaluator.numerai_corr': ( 'evaluation.html#baseevaluator.numerai_corr',
                                                                                            'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator.per_era_corr_matrix': ( 'evaluation.html#baseevaluator.per_era_corr_matrix',
+                                                                                                  'numerblox/evaluation.py'),
+                                      'numerblox.evaluation.BaseEvaluator.per_era_corr_matrix_from_file': ( 'evaluation.html#baseevaluator.per_era_corr_matrix_from_file',
+                                                                                                            'numerblox/evaluation.py'),
                                       'numerblox.evaluation.BaseEvaluator.per_era_corrs': ( 'evaluation.html#baseevaluator.per_era_corrs',
                                                                                             'numerblox/evaluation.py'),
                                       'numerblox.evaluation.BaseEvaluator.per_era_numerai_corrs': ( 'evaluation.html#baseevaluator.per_era_numerai_corrs',
@@ -149,30 +179,42 @@ d = { 'settings': { 'branch': 'master',
                                'numerblox.key.Key.__str__': ('key.html#key.__str__', 'numerblox/key.py'),
                                'numerblox.key.load_key_from_json': ('key.html#load_key_from_json', 'numerblox/key.py')},
             'numerblox.misc': { 'numerblox.misc.AttrDict': ('misc.html#attrdict', 'numerblox/misc.py'),
-                                'numerblox.misc.AttrDict.__init__': ('misc.html#attrdict.__init__', 'numerblox/misc.py')},
+                                'numerblox.misc.AttrDict.__init__': ('misc.html#attrdict.__init__', 'numerblox/misc.py'),
+                                'numerblox.misc.import_benchmark': ('misc.html#import_benchmark', 'numerblox/misc.py')},
             'numerblox.model': { 'numerblox.model.AwesomeDirectoryModel': ('model.html#awesomedirectorymodel', 'numerblox/model.py'),
                                  'numerblox.model.AwesomeDirectoryModel.__init__': ( 'model.html#awesomedirectorymodel.__init__',
                                                                                      'numerblox/model.py'),
-                                 'numerblox.model.AwesomeDirectoryModel.load_models': ( 'model.html#awesomedirectorymodel.load_models',
-                                                                                        'numerblox/model.py'),
+                                 'numerblox.model.AwesomeDirectoryModel.load_model': ( 'model.html#awesomedirectorymodel.load_model',
+                                                                                       'numerblox/model.py'),
                                  'numerblox.model.AwesomeModel': ('model.html#awesomemodel', 'numerblox/model.py'),
                                  'numerblox.model.AwesomeModel.__init__': ('model.html#awesomemodel.__init__', 'numerblox/model.py'),
                                  'numerblox.model.AwesomeModel.predict': ('model.html#awesomemodel.predict', 'numerblox/model.py'),
                                  'numerblox.model.BaseModel': ('model.html#basemodel', 'numerblox/model.py'),
                                  'numerblox.model.BaseModel.__call__': ('model.html#basemodel.__call__', 'numerblox/model.py'),
                                  'numerblox.model.BaseModel.__init__': ('model.html#basemodel.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.BaseModel._feature_block_view': ( 'model.html#basemodel._feature_block_view',
+                                                                                    'numerblox/model.py'),
+                                 'numerblox.model.BaseModel._feature_chunks': ( 'model.html#basemodel._feature_chunks',
+                                                                                'numerblox/model.py'),
+                                 'numerblox.model.BaseModel._predict_in_chunks': ( 'model.html#basemodel._predict_in_chunks',
+                                                                                   'numerblox/model.py'),
                                  'numerblox.model.BaseModel.get_prediction_col_names': ( 'model.html#basemodel.get_prediction_col_names',
                                                                                          'numerblox/model.py'),
                                  'numerblox.model.BaseModel.predict': ('model.html#basemodel.predict', 'numerblox/model.py'),
                                  'numerblox.model.CatBoostModel': ('model.html#catboostmodel', 'numerblox/model.py'),
                                  'numerblox.model.CatBoostModel.__init__': ('model.html#catboostmodel.__init__', 'numerblox/model.py'),
-                                 'numerblox.model.CatBoostModel.load_models': ( 'model.html#catboostmodel.load_models',
-                                                                                'numerblox/model.py'),
+                                 'numerblox.model.CatBoostModel.load_model': ('model.html#catboostmodel.load_model', 'numerblox/model.py'),
                                  'numerblox.model.ConstantModel': ('model.html#constantmodel', 'numerblox/model.py'),
                                  'numerblox.model.ConstantModel.__init__': ('model.html#constantmodel.__init__', 'numerblox/model.py'),
                                  'numerblox.model.ConstantModel.predict': ('model.html#constantmodel.predict', 'numerblox/model.py'),
                                  'numerblox.model.DirectoryModel': ('model.html#directorymodel', 'numerblox/model.py'),
                                  'numerblox.model.DirectoryModel.__init__': ('model.html#directorymodel.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel._load_cached': ( 'model.html#directorymodel._load_cached',
+                                                                                  'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel._predict_models': ( 'model.html#directorymodel._predict_models',
+                                                                                     'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel.load_model': ( 'model.html#directorymodel.load_model',
+                                                                                'numerblox/model.py'),
                                  'numerblox.model.DirectoryModel.load_models': ( 'model.html#directorymodel.load_models',
                                                                                  'numerblox/model.py'),
                                  'numerblox.model.DirectoryModel.predict': ('model.html#directorymodel.predict', 'numerblox/model.py'),
@@ -191,13 +233,24 @@ d = { 'settings': { 'branch': 'master',
                                  'numerblox.model.ExternalCSVs.predict': ('model.html#externalcsvs.predict', 'numerblox/model.py'),
                                  'numerblox.model.JoblibModel': ('model.html#joblibmodel', 'numerblox/model.py'),
                                  'numerblox.model.JoblibModel.__init__': ('model.html#joblibmodel.__init__', 'numerblox/model.py'),
-                                 'numerblox.model.JoblibModel.load_models': ('model.html#joblibmodel.load_models', 'numerblox/model.py'),
+                                 'numerblox.model.JoblibModel.load_model': ('model.html#joblibmodel.load_model', 'numerblox/model.py'),
                                  'numerblox.model.LGBMModel': ('model.html#lgbmmodel', 'numerblox/model.py'),
                                  'numerblox.model.LGBMModel.__init__': ('model.html#lgbmmodel.__init__', 'numerblox/model.py'),
-                                 'numerblox.model.LGBMModel.load_models': ('model.html#lgbmmodel.load_models', 'numerblox/model.py'),
+                                 'numerblox.model.LGBMModel.load_model': ('model.html#lgbmmodel.load_model', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache': ('model.html#modelcache', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache.__init__': ('model.html#modelcache.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache.__len__': ('model.html#modelcache.__len__', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache._evict': ('model.html#modelcache._evict', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache._key': ('model.html#modelcache._key', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache.clear': ('model.html#modelcache.clear', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache.load': ('model.html#modelcache.load', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache.nbytes': ('model.html#modelcache.nbytes', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache.shared': ('model.html#modelcache.shared', 'numerblox/model.py'),
                                  'numerblox.model.NumerBayCSVs': ('model.html#numerbaycsvs', 'numerblox/model.py'),
                                  'numerblox.model.NumerBayCSVs.__init__': ('model.html#numerbaycsvs.__init__', 'numerblox/model.py'),
                                  'numerblox.model.NumerBayCSVs._get_preds': ('model.html#numerbaycsvs._get_preds', 'numerblox/model.py'),
+                                 'numerblox.model.NumerBayCSVs._numerbay_api': ( 'model.html#numerbaycsvs._numerbay_api',
+                                                                                 'numerblox/model.py'),
                                  'numerblox.model.NumerBayCSVs.api': ('model.html#numerbaycsvs.api', 'numerblox/model.py'),
                                  'numerblox.model.NumerBayCSVs.predict': ('model.html#numerbaycsvs.predict', 'numerblox/model.py'),
                                  'numerblox.model.RandomModel': ('model.html#randommodel', 'numerblox/model.py'),
@@ -207,6 +260,10 @@ d = { 'settings': { 'branch': 'master',
                                  'numerblox.model.SingleModel.__check_valid_suffix': ( 'model.html#singlemodel.__check_valid_suffix',
                                                                                        'numerblox/model.py'),
                                  'numerblox.model.SingleModel.__init__': ('model.html#singlemodel.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.SingleModel._load_catboost_model': ( 'model.html#singlemodel._load_catboost_model',
+                                                                                       'numerblox/model.py'),
+                                 'numerblox.model.SingleModel._load_keras_model': ( 'model.html#singlemodel._load_keras_model',
+                                                                                    'numerblox/model.py'),
                                  'numerblox.model.SingleModel._load_model': ('model.html#singlemodel._load_model', 'numerblox/model.py'),
                                  'numerblox.model.SingleModel.predict': ('model.html#singlemodel.predict', 'numerblox/model.py'),
                                  'numerblox.model.WandbKerasModel': ('model.html#wandbkerasmodel', 'numerblox/model.py'),
@@ -242,12 +299,34 @@ d = { 'settings': { 'branch': 'master',
             'numerblox.numerframe': { 'numerblox.numerframe.NumerFrame': ('numerframe.html#numerframe', 'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.__init__': ( 'numerframe.html#numerframe.__init__',
                                                                                     'numerblox/numerframe.py'),
-                                      'numerblox.numerframe.NumerFrame.__init_meta_attrs': ( 'numerframe.html#numerframe.__init_meta_attrs',
-                                                                                             'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.__set_era_col': ( 'numerframe.html#numerframe.__set_era_col',
                                                                                          'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.__setitem__': ( 'numerframe.html#numerframe.__setitem__',
+                                                                                       'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.__setstate__': ( 'numerframe.html#numerframe.__setstate__',
+                                                                                        'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame._clear_item_cache': ( 'numerframe.html#numerframe._clear_item_cache',
+                                                                                             'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame._constructor': ( 'numerframe.html#numerframe._constructor',
                                                                                         'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame._get_column_groups': ( 'numerframe.html#numerframe._get_column_groups',
+                                                                                              'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame._maybe_cache_changed': ( 'numerframe.html#numerframe._maybe_cache_changed',
+                                                                                                'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame._take_positions': ( 'numerframe.html#numerframe._take_positions',
+                                                                                           'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.aux_cols': ( 'numerframe.html#numerframe.aux_cols',
+                                                                                    'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.build_era_index': ( 'numerframe.html#numerframe.build_era_index',
+                                                                                           'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.era_index': ( 'numerframe.html#numerframe.era_index',
+                                                                                     'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.era_positions': ( 'numerframe.html#numerframe.era_positions',
+                                                                                         'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.era_slice': ( 'numerframe.html#numerframe.era_slice',
+                                                                                     'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.feature_cols': ( 'numerframe.html#numerframe.feature_cols',
+                                                                                        'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_aux_data': ( 'numerframe.html#numerframe.get_aux_data',
                                                                                         'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_column_selection': ( 'numerframe.html#numerframe.get_column_selection',
@@ -268,8 +347,30 @@ d = { 'settings': { 'branch': 'master',
                                                                                                   'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_target_data': ( 'numerframe.html#numerframe.get_target_data',
                                                                                            'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.invalidate_era_index': ( 'numerframe.html#numerframe.invalidate_era_index',
+                                                                                                'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.iter_era_values': ( 'numerframe.html#numerframe.iter_era_values',
+                                                                                           'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.iter_eras': ( 'numerframe.html#numerframe.iter_eras',
+                                                                                     'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.not_aux_cols': ( 'numerframe.html#numerframe.not_aux_cols',
+                                                                                        'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.prediction_cols': ( 'numerframe.html#numerframe.prediction_cols',
+                                                                                           'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.target_cols': ( 'numerframe.html#numerframe.target_cols',
+                                                                                       'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.wrap': ( 'numerframe.html#numerframe.wrap',
+                                                                                'numerblox/numerframe.py'),
+                                      'numerblox.numerframe._read_arrow': ('numerframe.html#_read_arrow', 'numerblox/numerframe.py'),
+                                      'numerblox.numerframe._write_arrow': ('numerframe.html#_write_arrow', 'numerblox/numerframe.py'),
                                       'numerblox.numerframe.create_numerframe': ( 'numerframe.html#create_numerframe',
-                                                                                  'numerblox/numerframe.py')},
+                                                                                  'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.iter_numerframe_eras': ( 'numerframe.html#iter_numerframe_eras',
+                                                                                     'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.load_numerframe_cache': ( 'numerframe.html#load_numerframe_cache',
+                                                                                      'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.write_numerframe_cache': ( 'numerframe.html#write_numerframe_cache',
+                                                                                       'numerblox/numerframe.py')},
             'numerblox.postprocessing': { 'numerblox.postprocessing.AwesomePostProcessor': ( 'postprocessing.html#awesomepostprocessor',
                                                                                              'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.AwesomePostProcessor.__init__': ( 'postprocessing.html#awesomepostprocessor.__init__',
@@ -290,30 +391,60 @@ d = { 'settings': { 'branch': 'master',
                                                                                                              'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.DonateWeightedEnsembler.transform': ( 'postprocessing.html#donateweightedensembler.transform',
                                                                                                           'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.ExposureCache': ( 'postprocessing.html#exposurecache',
+                                                                                      'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.ExposureCache.__contains__': ( 'postprocessing.html#exposurecache.__contains__',
+                                                                                                   'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.ExposureCache.__init__': ( 'postprocessing.html#exposurecache.__init__',
+                                                                                               'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.ExposureCache.__len__': ( 'postprocessing.html#exposurecache.__len__',
+                                                                                              'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.ExposureCache._path': ( 'postprocessing.html#exposurecache._path',
+                                                                                            'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.ExposureCache.clear': ( 'postprocessing.html#exposurecache.clear',
+                                                                                            'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.ExposureCache.get': ( 'postprocessing.html#exposurecache.get',
+                                                                                          'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.ExposureCache.get_or_compute': ( 'postprocessing.html#exposurecache.get_or_compute',
+                                                                                                     'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.ExposureCache.make_key': ( 'postprocessing.html#exposurecache.make_key',
+                                                                                               'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.ExposureCache.put': ( 'postprocessing.html#exposurecache.put',
+                                                                                          'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeatureNeutralizer': ( 'postprocessing.html#featureneutralizer',
                                                                                            'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeatureNeutralizer.__init__': ( 'postprocessing.html#featureneutralizer.__init__',
                                                                                                     'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.FeatureNeutralizer._array_module': ( 'postprocessing.html#featureneutralizer._array_module',
+                                                                                                         'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.FeatureNeutralizer._exposure_basis': ( 'postprocessing.html#featureneutralizer._exposure_basis',
+                                                                                                           'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.FeatureNeutralizer._neutralize_frame': ( 'postprocessing.html#featureneutralizer._neutralize_frame',
+                                                                                                             'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeatureNeutralizer.neutralize': ( 'postprocessing.html#featureneutralizer.neutralize',
                                                                                                       'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeatureNeutralizer.neutralize_cuda': ( 'postprocessing.html#featureneutralizer.neutralize_cuda',
                                                                                                            'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.FeatureNeutralizer.neutralize_era': ( 'postprocessing.html#featureneutralizer.neutralize_era',
+                                                                                                          'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeatureNeutralizer.normalize': ( 'postprocessing.html#featureneutralizer.normalize',
                                                                                                      'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeatureNeutralizer.normalize_and_neutralize': ( 'postprocessing.html#featureneutralizer.normalize_and_neutralize',
                                                                                                                     'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.FeatureNeutralizer.normalize_array': ( 'postprocessing.html#featureneutralizer.normalize_array',
+                                                                                                           'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeatureNeutralizer.transform': ( 'postprocessing.html#featureneutralizer.transform',
                                                                                                      'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeaturePenalizer': ( 'postprocessing.html#featurepenalizer',
                                                                                          'numerblox/postprocessing.py'),
-                                          'numerblox.postprocessing.FeaturePenalizer.__exposures': ( 'postprocessing.html#featurepenalizer.__exposures',
-                                                                                                     'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeaturePenalizer.__init__': ( 'postprocessing.html#featurepenalizer.__init__',
                                                                                                   'numerblox/postprocessing.py'),
-                                          'numerblox.postprocessing.FeaturePenalizer.__train_loop_body': ( 'postprocessing.html#featurepenalizer.__train_loop_body',
-                                                                                                           'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeaturePenalizer._reduce_exposure': ( 'postprocessing.html#featurepenalizer._reduce_exposure',
                                                                                                           'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.FeaturePenalizer._reduce_exposure_tf': ( 'postprocessing.html#featurepenalizer._reduce_exposure_tf',
+                                                                                                             'numerblox/postprocessing.py'),
+                                          'numerblox.postprocessing.FeaturePenalizer._tf_functions': ( 'postprocessing.html#featurepenalizer._tf_functions',
+                                                                                                       'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeaturePenalizer._train_loop': ( 'postprocessing.html#featurepenalizer._train_loop',
                                                                                                      'numerblox/postprocessing.py'),
                                           'numerblox.postprocessing.FeaturePenalizer.reduce_all_exposures': ( 'postprocessing.html#featurepenalizer.reduce_all_exposures',
@@ -354,16 +485,22 @@ d = { 'settings': { 'branch': 'master',
                                                                                               'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.BayesianGMMTargetProcessor': ( 'preprocessing.html#bayesiangmmtargetprocessor',
                                                                                                  'numerblox/preprocessing.py'),
-                                         'numerblox.preprocessing.BayesianGMMTargetProcessor.__get_features_target': ( 'preprocessing.html#bayesiangmmtargetprocessor.__get_features_target',
-                                                                                                                       'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.BayesianGMMTargetProcessor.__init__': ( 'preprocessing.html#bayesiangmmtargetprocessor.__init__',
                                                                                                           'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.BayesianGMMTargetProcessor._fit_bgmm': ( 'preprocessing.html#bayesiangmmtargetprocessor._fit_bgmm',
                                                                                                            'numerblox/preprocessing.py'),
-                                         'numerblox.preprocessing.BayesianGMMTargetProcessor._generate_target': ( 'preprocessing.html#bayesiangmmtargetprocessor._generate_target',
-                                                                                                                  'numerblox/preprocessing.py'),
-                                         'numerblox.preprocessing.BayesianGMMTargetProcessor._get_coefs': ( 'preprocessing.html#bayesiangmmtargetprocessor._get_coefs',
-                                                                                                            'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.BayesianGMMTargetProcessor._generate_targets': ( 'preprocessing.html#bayesiangmmtargetprocessor._generate_targets',
+                                                                                                                   'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.BayesianGMMTargetProcessor._get_gram_matrices': ( 'preprocessing.html#bayesiangmmtargetprocessor._get_gram_matrices',
+                                                                                                                    'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.BayesianGMMTargetProcessor._map_eras': ( 'preprocessing.html#bayesiangmmtargetprocessor._map_eras',
+                                                                                                           'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.BayesianGMMTargetProcessor._sample_betas': ( 'preprocessing.html#bayesiangmmtargetprocessor._sample_betas',
+                                                                                                               'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.BayesianGMMTargetProcessor._solve_coefs': ( 'preprocessing.html#bayesiangmmtargetprocessor._solve_coefs',
+                                                                                                              'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.BayesianGMMTargetProcessor.fake_target_names': ( 'preprocessing.html#bayesiangmmtargetprocessor.fake_target_names',
+                                                                                                                   'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.BayesianGMMTargetProcessor.transform': ( 'preprocessing.html#bayesiangmmtargetprocessor.transform',
                                                                                                            'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.CopyPreProcessor': ( 'preprocessing.html#copypreprocessor',
@@ -380,10 +517,16 @@ d = { 'settings': { 'branch': 'master',
                                                                                                        'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.EraQuantileProcessor': ( 'preprocessing.html#eraquantileprocessor',
                                                                                            'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.EraQuantileProcessor.__getstate__': ( 'preprocessing.html#eraquantileprocessor.__getstate__',
+                                                                                                        'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.EraQuantileProcessor.__init__': ( 'preprocessing.html#eraquantileprocessor.__init__',
                                                                                                     'numerblox/preprocessing.py'),
-                                         'numerblox.preprocessing.EraQuantileProcessor._process_eras': ( 'preprocessing.html#eraquantileprocessor._process_eras',
-                                                                                                         'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.EraQuantileProcessor._quantile_eras': ( 'preprocessing.html#eraquantileprocessor._quantile_eras',
+                                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.EraQuantileProcessor.close': ( 'preprocessing.html#eraquantileprocessor.close',
+                                                                                                 'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.EraQuantileProcessor.pool': ( 'preprocessing.html#eraquantileprocessor.pool',
+                                                                                                'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.EraQuantileProcessor.transform': ( 'preprocessing.html#eraquantileprocessor.transform',
                                                                                                      'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.FeatureSelectionPreProcessor': ( 'preprocessing.html#featureselectionpreprocessor',
@@ -398,44 +541,70 @@ d = { 'settings': { 'branch': 'master',
                                                                                                    'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.KatsuFeatureGenerator.__init__': ( 'preprocessing.html#katsufeaturegenerator.__init__',
                                                                                                      'numerblox/preprocessing.py'),
-                                         'numerblox.preprocessing.KatsuFeatureGenerator._generate_features': ( 'preprocessing.html#katsufeaturegenerator._generate_features',
-                                                                                                               'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.KatsuFeatureGenerator._macd': ( 'preprocessing.html#katsufeaturegenerator._macd',
                                                                                                   'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.KatsuFeatureGenerator._rsi': ( 'preprocessing.html#katsufeaturegenerator._rsi',
                                                                                                  'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.KatsuFeatureGenerator._transform_incremental': ( 'preprocessing.html#katsufeaturegenerator._transform_incremental',
+                                                                                                                   'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.KatsuFeatureGenerator._vectorized_features': ( 'preprocessing.html#katsufeaturegenerator._vectorized_features',
+                                                                                                                 'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.KatsuFeatureGenerator.feature_engineering': ( 'preprocessing.html#katsufeaturegenerator.feature_engineering',
                                                                                                                 'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.KatsuFeatureGenerator.feature_names': ( 'preprocessing.html#katsufeaturegenerator.feature_names',
+                                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.KatsuFeatureGenerator.reset_state': ( 'preprocessing.html#katsufeaturegenerator.reset_state',
+                                                                                                        'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.KatsuFeatureGenerator.transform': ( 'preprocessing.html#katsufeaturegenerator.transform',
                                                                                                       'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.LagPreProcessor': ( 'preprocessing.html#lagpreprocessor',
                                                                                       'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.LagPreProcessor.__init__': ( 'preprocessing.html#lagpreprocessor.__init__',
                                                                                                'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.LagPreProcessor._lag_block': ( 'preprocessing.html#lagpreprocessor._lag_block',
+                                                                                                 'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.LagPreProcessor.reset_state': ( 'preprocessing.html#lagpreprocessor.reset_state',
+                                                                                                  'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.LagPreProcessor.transform': ( 'preprocessing.html#lagpreprocessor.transform',
                                                                                                 'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.PandasTaFeatureGenerator': ( 'preprocessing.html#pandastafeaturegenerator',
                                                                                                'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.PandasTaFeatureGenerator.__init__': ( 'preprocessing.html#pandastafeaturegenerator.__init__',
                                                                                                         'numerblox/preprocessing.py'),
-                                         'numerblox.preprocessing.PandasTaFeatureGenerator._generate_features': ( 'preprocessing.html#pandastafeaturegenerator._generate_features',
-                                                                                                                  'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.PandasTaFeatureGenerator._feature_names': ( 'preprocessing.html#pandastafeaturegenerator._feature_names',
+                                                                                                              'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.PandasTaFeatureGenerator.add_features': ( 'preprocessing.html#pandastafeaturegenerator.add_features',
                                                                                                             'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.PandasTaFeatureGenerator.reset_state': ( 'preprocessing.html#pandastafeaturegenerator.reset_state',
+                                                                                                           'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.PandasTaFeatureGenerator.transform': ( 'preprocessing.html#pandastafeaturegenerator.transform',
                                                                                                          'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.ReduceMemoryProcessor': ( 'preprocessing.html#reducememoryprocessor',
                                                                                             'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.ReduceMemoryProcessor.__init__': ( 'preprocessing.html#reducememoryprocessor.__init__',
                                                                                                      'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ReduceMemoryProcessor._float_dtypes': ( 'preprocessing.html#reducememoryprocessor._float_dtypes',
+                                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ReduceMemoryProcessor._int_dtypes': ( 'preprocessing.html#reducememoryprocessor._int_dtypes',
+                                                                                                        'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ReduceMemoryProcessor._numeric_groups': ( 'preprocessing.html#reducememoryprocessor._numeric_groups',
+                                                                                                            'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ReduceMemoryProcessor._rebuild_blocks': ( 'preprocessing.html#reducememoryprocessor._rebuild_blocks',
+                                                                                                            'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.ReduceMemoryProcessor._reduce_mem_usage': ( 'preprocessing.html#reducememoryprocessor._reduce_mem_usage',
                                                                                                               'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ReduceMemoryProcessor.memory_report': ( 'preprocessing.html#reducememoryprocessor.memory_report',
+                                                                                                          'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.ReduceMemoryProcessor.transform': ( 'preprocessing.html#reducememoryprocessor.transform',
                                                                                                       'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.SignalsTargetProcessor': ( 'preprocessing.html#signalstargetprocessor',
                                                                                              'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.SignalsTargetProcessor.__init__': ( 'preprocessing.html#signalstargetprocessor.__init__',
                                                                                                       'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.SignalsTargetProcessor._bin': ( 'preprocessing.html#signalstargetprocessor._bin',
+                                                                                                  'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.SignalsTargetProcessor._era_rank': ( 'preprocessing.html#signalstargetprocessor._era_rank',
+                                                                                                       'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.SignalsTargetProcessor.transform': ( 'preprocessing.html#signalstargetprocessor.transform',
                                                                                                        'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.TargetSelectionPreProcessor': ( 'preprocessing.html#targetselectionpreprocessor',
@@ -450,12 +619,102 @@ d = { 'settings': { 'branch': 'master',
                                                                                             'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.TickerMapper.transform': ( 'preprocessing.html#tickermapper.transform',
                                                                                              'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerPanelPool': ( 'preprocessing.html#tickerpanelpool',
+                                                                                      'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerPanelPool.__getstate__': ( 'preprocessing.html#tickerpanelpool.__getstate__',
+                                                                                                   'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerPanelPool.__init__': ( 'preprocessing.html#tickerpanelpool.__init__',
+                                                                                               'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerPanelPool._map_panel': ( 'preprocessing.html#tickerpanelpool._map_panel',
+                                                                                                 'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerPanelPool.close': ( 'preprocessing.html#tickerpanelpool.close',
+                                                                                            'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerPanelPool.map': ( 'preprocessing.html#tickerpanelpool.map',
+                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerPanelPool.map_frames': ( 'preprocessing.html#tickerpanelpool.map_frames',
+                                                                                                 'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerPanelPool.pool': ( 'preprocessing.html#tickerpanelpool.pool',
+                                                                                           'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerPanelPool.shared': ( 'preprocessing.html#tickerpanelpool.shared',
+                                                                                             'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.UMAPFeatureGenerator': ( 'preprocessing.html#umapfeaturegenerator',
                                                                                            'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.UMAPFeatureGenerator.__init__': ( 'preprocessing.html#umapfeaturegenerator.__init__',
                                                                                                     'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.UMAPFeatureGenerator._batches': ( 'preprocessing.html#umapfeaturegenerator._batches',
+                                                                                                    'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.UMAPFeatureGenerator._embed_batches': ( 'preprocessing.html#umapfeaturegenerator._embed_batches',
+                                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.UMAPFeatureGenerator._fit': ( 'preprocessing.html#umapfeaturegenerator._fit',
+                                                                                                'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.UMAPFeatureGenerator._sample_positions': ( 'preprocessing.html#umapfeaturegenerator._sample_positions',
+                                                                                                             'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.UMAPFeatureGenerator.fit': ( 'preprocessing.html#umapfeaturegenerator.fit',
+                                                                                               'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.UMAPFeatureGenerator.is_fitted': ( 'preprocessing.html#umapfeaturegenerator.is_fitted',
+                                                                                                     'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.UMAPFeatureGenerator.load': ( 'preprocessing.html#umapfeaturegenerator.load',
+                                                                                                'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.UMAPFeatureGenerator.save': ( 'preprocessing.html#umapfeaturegenerator.save',
+                                                                                                'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.UMAPFeatureGenerator.transform': ( 'preprocessing.html#umapfeaturegenerator.transform',
                                                                                                      'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.UMAPFeatureGenerator.umap_feature_names': ( 'preprocessing.html#umapfeaturegenerator.umap_feature_names',
+                                                                                                              'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._TickerFrameCodec': ( 'preprocessing.html#_tickerframecodec',
+                                                                                        'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._TickerFrameCodec.__init__': ( 'preprocessing.html#_tickerframecodec.__init__',
+                                                                                                 'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._TickerFrameCodec.decode': ( 'preprocessing.html#_tickerframecodec.decode',
+                                                                                               'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._TickerFrameCodec.encode': ( 'preprocessing.html#_tickerframecodec.encode',
+                                                                                               'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._TickerFrameCodec.subset': ( 'preprocessing.html#_tickerframecodec.subset',
+                                                                                               'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._add_columns': ( 'preprocessing.html#_add_columns',
+                                                                                   'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._apply_ticker_segments': ( 'preprocessing.html#_apply_ticker_segments',
+                                                                                             'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._attach_shared_array': ( 'preprocessing.html#_attach_shared_array',
+                                                                                           'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._combine_with_history': ( 'preprocessing.html#_combine_with_history',
+                                                                                            'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._create_shared_array': ( 'preprocessing.html#_create_shared_array',
+                                                                                           'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._equal_run_lengths': ( 'preprocessing.html#_equal_run_lengths',
+                                                                                         'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._era_quantiles': ( 'preprocessing.html#_era_quantiles',
+                                                                                     'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._era_quantiles_worker': ( 'preprocessing.html#_era_quantiles_worker',
+                                                                                            'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._ewm_mean_from_sums': ( 'preprocessing.html#_ewm_mean_from_sums',
+                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._frame_from_blocks': ( 'preprocessing.html#_frame_from_blocks',
+                                                                                         'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._has_pandas_block_api': ( 'preprocessing.html#_has_pandas_block_api',
+                                                                                            'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._history_tail': ( 'preprocessing.html#_history_tail',
+                                                                                    'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._release_shared_arrays': ( 'preprocessing.html#_release_shared_arrays',
+                                                                                             'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._segment_rows': ( 'preprocessing.html#_segment_rows',
+                                                                                    'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._segmented_bfill': ( 'preprocessing.html#_segmented_bfill',
+                                                                                       'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._segmented_ewm_mean': ( 'preprocessing.html#_segmented_ewm_mean',
+                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._segmented_ewm_sums': ( 'preprocessing.html#_segmented_ewm_sums',
+                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._segmented_ffill': ( 'preprocessing.html#_segmented_ffill',
+                                                                                       'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._segmented_pct_change': ( 'preprocessing.html#_segmented_pct_change',
+                                                                                            'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._segmented_rolling': ( 'preprocessing.html#_segmented_rolling',
+                                                                                         'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._segmented_shift': ( 'preprocessing.html#_segmented_shift',
+                                                                                       'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._ticker_panel_worker': ( 'preprocessing.html#_ticker_panel_worker',
+                                                                                           'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.display_processor_info': ( 'preprocessing.html#display_processor_info',
                                                                                              'numerblox/preprocessing.py')},
             'numerblox.submission': { 'numerblox.submission.BaseSubmitter': ('submission.html#basesubmitter', 'numerblox/submission.py'),
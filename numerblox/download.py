@@ -14,9 +14,7 @@ import pandas as pd
 from tqdm.auto import tqdm
 from rich.tree import Tree
 from numerapi import NumerAPI
-from google.cloud import storage
 from rich.console import Console
-from eod import EodHistoricalData
 from datetime import datetime as dt
 from pathlib import Path, PosixPath
 from abc import ABC, abstractmethod
@@ -95,8 +93,9 @@ class BaseIO(ABC):
             f":cloud: :folder: Directory '{self.dir}' uploaded to '{gcs_path}' in bucket {blob.bucket.id} :folder: :cloud:"
         )
 
-    def _get_gcs_blob(self, bucket_name: str, blob_path: str) -> storage.Blob:
+    def _get_gcs_blob(self, bucket_name: str, blob_path: str) -> "storage.Blob":
         """ Create blob that interacts with Google Cloud Storage (GCS). """
+        from google.cloud import storage
         client = storage.Client()
         # https://console.cloud.google.com/storage/browser/[bucket_name]
         bucket = client.get_bucket(bucket_name)
@@ -473,6 +472,7 @@ class EODDownloader(BaseDownloader):
         super().__init__(directory_path=directory_path)
         self.key = key
         self.tickers = tickers
+        from eod import EodHistoricalData
         self.client = EodHistoricalData(self.key)
         self.frequency = frequency
         self.current_time = dt.now()
@@ -507,7 +507,7 @@ class EODDownloader(BaseDownloader):
         start: Starting data in %Y-%m-%d format.
         """
         dataf = self.generate_full_dataf(start=start)
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def generate_full_dataf(self, start: str) -> pd.DataFrame:
         """
@@ -10,13 +10,13 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 from tqdm.auto import tqdm
-import matplotlib.pyplot as plt
-from typing import Tuple, Union
+from typing import Tuple, Union, Optional
 from numerapi import SignalsAPI
 from rich import print as rich_print
 
-from .numerframe import NumerFrame, create_numerframe
-from .postprocessing import FeatureNeutralizer
+from .misc import AttrDict
+from .numerframe import NumerFrame, create_numerframe, iter_numerframe_eras
+from .postprocessing import FeatureNeutralizer, ExposureCache
 from .key import Key
 
 # %% ../nbs/07_evaluation.ipynb 5
@@ -39,7 +39,12 @@ class BaseEvaluator:
     :param era_col: Column name pointing to eras. \n
     Most commonly "era" for Numerai Classic and "friday_date" for Numerai Signals. \n
     :param fast_mode: Will skip compute intensive metrics if set to True,
-    namely max_exposure, feature neutral mean, TB200 and TB500.
+    namely max_exposure, feature neutral mean, TB200 and TB500. \n
+    :param batch_mode: Evaluate all prediction columns together if set to True.
+    Per era target transforms, feature matrices and example predictions are then
+    computed once and shared by all prediction columns. \n
+    :param exposure_cache: ExposureCache for per era factorizations in feature neutral metrics.
+    Pass the cache used in postprocessing to share factorizations. Factorizations are not cached by default.
 
     Note that we calculate the sample standard deviation with ddof=0. 
     It may differ slightly from the standard Pandas calculation, but 
@@ -47,9 +52,12 @@ class BaseEvaluator:
     More info: 
     https://stackoverflow.com/questions/24984178/different-std-in-pandas-vs-numpy
     """
-    def __init__(self, era_col: str = "era", fast_mode=False):
+    def __init__(self, era_col: str = "era", fast_mode=False, batch_mode=False,
+                 exposure_cache: ExposureCache = None):
         self.era_col = era_col
         self.fast_mode = fast_mode
+        self.batch_mode = batch_mode
+        self.exposure_cache = exposure_cache
 
     def full_evaluation(
         self,
@@ -69,6 +77,13 @@ class BaseEvaluator:
             dataf.loc[:, dataf.feature_cols] = dataf.get_feature_data.select_dtypes(exclude=['category'])
         dataf = dataf.fillna(0.5)
         pred_cols = dataf.prediction_cols if not pred_cols else pred_cols
+        if self.batch_mode:
+            return self.evaluation_all_cols(
+                dataf=dataf,
+                pred_cols=pred_cols,
+                target_col=target_col,
+                example_col=example_col,
+            )
         for col in tqdm(pred_cols, desc="Evaluation: "):
             col_stats = self.evaluation_one_col(
                 dataf=dataf,
@@ -148,23 +163,131 @@ class BaseEvaluator:
             col_stats.loc[pred_col, "exposure_dissimilarity"] = ex_diss
         return col_stats
 
+    def evaluation_all_cols(
+        self,
+        dataf: NumerFrame,
+        pred_cols: list,
+        target_col: str,
+        example_col: str,
+    ) -> pd.DataFrame:
+        """
+        Perform evaluation for all prediction columns at once
+        against given target and example prediction column.
+        Yields the same metrics as evaluation_one_col for every prediction column.
+        Era sorting, per era target transforms, feature matrices and
+        example predictions are computed once and shared by all prediction columns.
+        """
+        val_stats = pd.DataFrame(index=pred_cols)
+        era_index = self._era_index(dataf)
+        target = self._sorted_values(dataf, [target_col], era_index, fill_value=None)
+        example = self._sorted_values(dataf, [example_col], era_index)
+        preds = self._sorted_values(dataf, pred_cols, era_index)
+        uniform_preds = self._segment_uniform(preds, era_index, method="first")
+
+        val_numerai_corrs = self._corr_frame(
+            self._segment_pearson(self._numerai_preds(preds, era_index),
+                                  self._numerai_target(target, era_index), era_index),
+            pred_cols, era_index)
+        val_corrs = self._corr_frame(
+            self._segment_pearson(uniform_preds, target, era_index), pred_cols, era_index
+        )
+        example_corrs = self._corr_frame(
+            self._segment_pearson(uniform_preds, example, era_index), pred_cols, era_index
+        )
+        mean, std, sharpe = self._mean_std_sharpe_cols(era_corrs=val_numerai_corrs)
+        legacy_mean, legacy_std, legacy_sharpe = self._mean_std_sharpe_cols(era_corrs=val_corrs)
+
+        val_stats.loc[:, "target"] = target_col
+        val_stats.loc[:, "mean"] = mean
+        val_stats.loc[:, "std"] = std
+        val_stats.loc[:, "sharpe"] = sharpe
+        val_stats.loc[:, "max_drawdown"] = self.max_drawdown(era_corrs=val_numerai_corrs)
+        val_stats.loc[:, "apy"] = self.apy(era_corrs=val_numerai_corrs)
+        val_stats.loc[:, "corr_with_example_preds"] = example_corrs.mean()
+        val_stats.loc[:, "legacy_mean"] = legacy_mean
+        val_stats.loc[:, "legacy_std"] = legacy_std
+        val_stats.loc[:, "legacy_sharpe"] = legacy_sharpe
+
+        # Compute intensive stats
+        if not self.fast_mode:
+            max_feature_exposure, ex_diss = self._batch_feature_exposures(
+                dataf=dataf, preds=preds, example=example, era_index=era_index
+            )
+            fn_mean, fn_std, fn_sharpe = self._feature_neutral_mean_std_sharpe_cols(
+                dataf=dataf, pred_cols=pred_cols, target_col=target_col
+            )
+            val_stats.loc[:, "max_feature_exposure"] = max_feature_exposure
+            val_stats.loc[:, "feature_neutral_mean"] = fn_mean
+            val_stats.loc[:, "feature_neutral_std"] = fn_std
+            val_stats.loc[:, "feature_neutral_sharpe"] = fn_sharpe
+            for tb in [200, 500]:
+                tb_corrs = self._score_by_date(
+                    dataf=dataf, columns=pred_cols, target=target_col, tb=tb
+                )
+                tb_mean, tb_std, tb_sharpe = self._mean_std_sharpe_cols(era_corrs=tb_corrs)
+                val_stats.loc[:, f"tb{tb}_mean"] = tb_mean
+                val_stats.loc[:, f"tb{tb}_std"] = tb_std
+                val_stats.loc[:, f"tb{tb}_sharpe"] = tb_sharpe
+            val_stats.loc[:, "exposure_dissimilarity"] = ex_diss
+        return val_stats
+
     def per_era_corrs(
         self, dataf: pd.DataFrame, pred_col: str, target_col: str
     ) -> pd.Series:
         """Correlation between prediction and target for each era."""
-        return dataf.groupby(dataf[self.era_col]).apply(
-            lambda d: self._normalize_uniform(d[pred_col].fillna(0.5)).corr(
-                d[target_col]
-            )
-        )
+        return self.per_era_corr_matrix(
+            dataf=dataf, pred_cols=[pred_col], target_col=target_col, numerai_corr=False
+        )[pred_col]
     
     def per_era_numerai_corrs(
             self, dataf: pd.DataFrame, pred_col: str, target_col: str
         ) -> pd.Series:
         """Numerai Corr between prediction and target for each era."""
-        return dataf.groupby(dataf[self.era_col]).apply(
-            lambda d: self.numerai_corr(d.fillna(0.5), pred_col, target_col)
-            )
+        return self.per_era_corr_matrix(
+            dataf=dataf, pred_cols=[pred_col], target_col=target_col, numerai_corr=True
+        )[pred_col]
+
+    def per_era_corr_matrix(
+        self, dataf: pd.DataFrame, pred_cols: list, target_col: str, numerai_corr: bool = True
+    ) -> pd.DataFrame:
+        """
+        Per era correlations for multiple prediction columns in one vectorized pass.
+        Data is sorted by era once, after which every era is processed as a contiguous segment.
+        Missing predictions are filled with 0.5. Missing targets are filled with 0.5 for Numerai Corr
+        and left out of the correlation for their era otherwise (like `per_era_numerai_corrs` and `per_era_corrs`). \n
+        :param pred_cols: Prediction columns to compute per era correlations for. \n
+        :param target_col: Column to correlate predictions with. \n
+        :param numerai_corr: Compute Numerai Corr (gaussianized ranks and ^1.5 tails) if True.
+        Otherwise compute Pearson correlation between uniform ranked predictions and target. \n
+        :return: DataFrame with eras as index and a column for each prediction column.
+        """
+        era_index = self._era_index(dataf)
+        preds = self._sorted_values(dataf, pred_cols, era_index)
+        target = self._sorted_values(dataf, [target_col], era_index, fill_value=0.5 if numerai_corr else None)
+        if numerai_corr:
+            preds = self._numerai_preds(preds, era_index)
+            target = self._numerai_target(target, era_index)
+        else:
+            preds = self._segment_uniform(preds, era_index, method="first")
+        corrs = self._segment_pearson(preds, target, era_index)
+        return self._corr_frame(corrs, pred_cols, era_index)
+
+    def per_era_corr_matrix_from_file(
+        self, file_path: str, pred_cols: list, target_col: str, numerai_corr: bool = True,
+        era_chunk_size: int = 20
+    ) -> pd.DataFrame:
+        """
+        `per_era_corr_matrix` for parquet files that are too large to load in memory.
+        The file is streamed with `iter_numerframe_eras` and only prediction, target and era columns are read. \n
+        :param file_path: Path to parquet file with prediction and target columns. \n
+        :param era_chunk_size: Number of eras to load in memory at once. \n
+        Other parameters are the same as for `per_era_corr_matrix`.
+        """
+        chunks = iter_numerframe_eras(file_path, columns=pred_cols + [target_col],
+                                      era_chunk_size=era_chunk_size, era_col=self.era_col)
+        return pd.concat([self.per_era_corr_matrix(dataf=chunk, pred_cols=pred_cols, target_col=target_col,
+                                                   numerai_corr=numerai_corr)
+                          for chunk in chunks])
 
     def mean_std_sharpe(
         self, era_corrs: pd.Series
@@ -178,6 +301,15 @@ class BaseEvaluator:
         sharpe = mean / std
         return mean, std, sharpe
 
+    @staticmethod
+    def _mean_std_sharpe_cols(
+        era_corrs: pd.DataFrame
+    ) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """ mean_std_sharpe for every column of per era correlations. """
+        mean = era_corrs.mean()
+        std = era_corrs.std(ddof=0)
+        return mean, std, mean / std
+
     def numerai_corr(
         self, dataf: pd.DataFrame, pred_col: str, target_col: str
     ) -> np.float64:
@@ -242,11 +374,10 @@ class BaseEvaluator:
         self, dataf: Union[pd.DataFrame, NumerFrame], pred_col: str
     ) -> np.float64:
         """Maximum exposure over all features."""
-        max_per_era = dataf.groupby(self.era_col).apply(
-            lambda d: d[dataf.feature_cols].corrwith(d[pred_col]).abs().max()
-        )
-        max_feature_exposure = max_per_era.mean(skipna=True)
-        return max_feature_exposure
+        era_index = self._era_index(dataf)
+        preds = self._sorted_values(dataf, [pred_col], era_index)
+        max_feature_exposure, _ = self._batch_feature_exposures(dataf=dataf, preds=preds, era_index=era_index)
+        return max_feature_exposure[0]
 
     def feature_neutral_mean_std_sharpe(
         self, dataf: Union[pd.DataFrame, NumerFrame], pred_col: str, target_col: str, feature_names: list = None
@@ -257,7 +388,8 @@ class BaseEvaluator:
         """
         fn = FeatureNeutralizer(pred_name=pred_col,
                                 feature_names=feature_names,
-                                proportion=1.0)
+                                proportion=1.0,
+                                cache=self.exposure_cache)
         neutralized_dataf = fn(dataf=dataf)
         neutral_corrs = self.per_era_numerai_corrs(
             dataf=neutralized_dataf,
@@ -267,6 +399,26 @@ class BaseEvaluator:
         mean, std, sharpe = self.mean_std_sharpe(era_corrs=neutral_corrs)
         return mean, std, sharpe
 
+    def _feature_neutral_mean_std_sharpe_cols(
+        self, dataf: NumerFrame, pred_cols: list, target_col: str, feature_names: list = None
+    ) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """
+        feature_neutral_mean_std_sharpe for all prediction columns at once.
+        Every era exposure matrix is factorized once for all prediction columns.
+        """
+        fn = FeatureNeutralizer(pred_name=pred_cols,
+                                feature_names=feature_names,
+                                proportion=1.0,
+                                cache=self.exposure_cache)
+        neutralized_dataf = fn(dataf=dataf)
+        neutral_corrs = self.per_era_corr_matrix(
+            dataf=neutralized_dataf,
+            pred_cols=fn.new_col_names,
+            target_col=target_col,
+        )
+        neutral_corrs.columns = pred_cols
+        return self._mean_std_sharpe_cols(era_corrs=neutral_corrs)
+
     def tbx_mean_std_sharpe(
         self, dataf: pd.DataFrame, pred_col: str, target_col: str, tb: int = 200
     ) -> Tuple[np.float64, np.float64, np.float64]:
@@ -286,10 +438,12 @@ class BaseEvaluator:
         Model pattern of feature exposure to the example column.
         See TC details forum post: https://forum.numer.ai/t/true-contribution-details/5128/4
         """
-        U = dataf.get_feature_data.corrwith(dataf[pred_col]).values
-        E = dataf.get_feature_data.corrwith(dataf[example_col]).values
-        exp_dis = 1 - np.dot(U, E) / np.dot(E, E)
-        return exp_dis
+        era_index = self._era_index(dataf)
+        preds = self._sorted_values(dataf, [pred_col], era_index)
+        example = self._sorted_values(dataf, [example_col], era_index)
+        _, exp_dis = self._batch_feature_exposures(dataf=dataf, preds=preds, example=example,
+                                                   era_index=era_index, max_exposure=False)
+        return exp_dis[0]
 
 
     @staticmethod
@@ -317,12 +471,15 @@ class BaseEvaluator:
         :param tb: How many of top and bottom predictions to focus on.
         TB200 is the most common situation.
         """
-        unique_eras = dataf[self.era_col].unique()
+        era_index = self._era_index(dataf)
+        all_preds = dataf[columns].to_numpy(dtype=np.float64)
+        all_targets = dataf[target].to_numpy(dtype=np.float64)
         computed = []
-        for u in unique_eras:
-            df_era = dataf[dataf[self.era_col] == u]
-            era_pred = np.float64(df_era[columns].values.T)
-            era_target = np.float64(df_era[target].values.T)
+        for start, count in zip(era_index.starts, era_index.counts):
+            idx = era_index.order[start:start + count]
+            idx = idx[~np.isnan(all_targets[idx])]
+            era_pred = all_preds[idx].T
+            era_target = all_targets[idx]
 
             if tb is None:
                 ccs = np.corrcoef(era_target, era_pred)[0, 1:]
@@ -336,7 +493,7 @@ class BaseEvaluator:
                 ccs = np.array(ccs)
             computed.append(ccs)
         return pd.DataFrame(
-            np.array(computed), columns=columns, index=dataf[self.era_col].unique()
+            np.array(computed), columns=columns, index=era_index.eras
         )
 
     @staticmethod
@@ -345,6 +502,145 @@ class BaseEvaluator:
         x = (df.rank(method=method) - 0.5) / len(df)
         return pd.Series(x, index=df.index)
 
+    def _era_index(self, dataf: pd.DataFrame) -> AttrDict:
+        """
+        Rows sorted by era once with contiguous era segments (see `NumerFrame.era_index`).
+        Uses the cached era index of a NumerFrame when possible.
+        order: Row positions sorted by era. \n
+        starts: Start position of every era segment in sorted data. \n
+        counts: Number of rows for each era. \n
+        eras: Era labels in sorted order.
+        """
+        if isinstance(dataf, NumerFrame) and dataf.meta.era_col == self.era_col:
+            return dataf.era_index
+        return NumerFrame.build_era_index(dataf[self.era_col])
+
+    @staticmethod
+    def _sorted_values(dataf: pd.DataFrame, cols: list, era_index: AttrDict, fill_value: Optional[float] = 0.5) -> np.ndarray:
+        """ 2D float64 array of columns sorted by era. Missing values are filled with fill_value (kept as NaN if None). """
+        values = dataf[cols].to_numpy(dtype=np.float64)[era_index.order]
+        return values if fill_value is None else np.nan_to_num(values, nan=fill_value)
+
+    def _corr_frame(self, corrs: np.ndarray, cols: list, era_index: AttrDict) -> pd.DataFrame:
+        """ Eras x columns DataFrame from per era correlations. """
+        return pd.DataFrame(corrs, columns=cols, index=pd.Index(era_index.eras, name=self.era_col))
+
+    def _numerai_preds(self, preds: np.ndarray, era_index: AttrDict) -> np.ndarray:
+        """ Rank, gaussianize and accentuate tails of era sorted predictions for Numerai Corr. """
+        return self._tails_p15(stats.norm.ppf(self._segment_uniform(preds, era_index, method="average")))
+
+    def _numerai_target(self, target: np.ndarray, era_index: AttrDict) -> np.ndarray:
+        """ Center and accentuate tails of era sorted target for Numerai Corr. """
+        return self._tails_p15(target - self._segment_mean(target, era_index))
+
+    def _batch_feature_exposures(self, dataf: NumerFrame, preds: np.ndarray, era_index: AttrDict,
+                                 example: np.ndarray = None, max_exposure: bool = True
+                                 ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Max feature exposure and exposure dissimilarity for all era sorted prediction columns.
+        Features are read in their stored dtype (e.g. int8) and only one era is upcast to float64 at a time.
+        Global feature correlations for exposure dissimilarity are accumulated
+        from sufficient statistics in the same pass over all eras. \n
+        :param example: Era sorted example predictions. Exposure dissimilarity is only computed if given. \n
+        :param max_exposure: Whether to compute max feature exposure.
+        :return: Tuple of max feature exposure and exposure dissimilarity for every prediction column (None if not computed).
+        """
+        dataf = NumerFrame.wrap(dataf)
+        feature_cols = dataf.feature_cols
+        n_preds = preds.shape[1]
+        scores = preds if example is None else np.hstack([preds, example])
+        n_features, n_scores = len(feature_cols), scores.shape[1]
+        max_exposures = np.empty((len(era_index.starts), n_preds))
+        sum_f, sum_f2 = np.zeros(n_features), np.zeros(n_features)
+        sum_fs = np.zeros((n_features, n_scores))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            era_values = dataf.iter_era_values(feature_cols, era_index=era_index)
+            for i, (start, count, (_, features)) in enumerate(zip(era_index.starts, era_index.counts, era_values)):
+                features = features.astype(np.float64)
+                era_scores = scores[start:start + count]
+                if example is not None:
+                    sum_f += features.sum(axis=0)
+                    sum_f2 += (features ** 2).sum(axis=0)
+                    sum_fs += features.T @ era_scores
+                if max_exposure:
+                    features = features - features.mean(axis=0)
+                    era_preds = era_scores[:, :n_preds] - era_scores[:, :n_preds].mean(axis=0)
+                    exposures = (features.T @ era_preds) / np.outer(np.linalg.norm(features, axis=0),
+                                                                    np.linalg.norm(era_preds, axis=0))
+                    # Features without variance in an era are skipped like NaNs in pd.DataFrame.corrwith
+                    max_exposures[i] = np.where(np.isnan(exposures), -np.inf, np.abs(exposures)).max(axis=0)
+            max_exposures[np.isinf(max_exposures)] = np.nan
+            exposure_dissimilarity = None
+            if example is not None:
+                n = len(scores)
+                mean_f, mean_s = sum_f / n, scores.mean(axis=0)
+                cov = sum_fs / n - np.outer(mean_f, mean_s)
+                std_f = np.sqrt(sum_f2 / n - mean_f ** 2)
+                corrs = cov / np.outer(std_f, scores.std(axis=0))
+                U, E = corrs[:, :n_preds], corrs[:, n_preds]
+                exposure_dissimilarity = 1 - (E @ U) / np.dot(E, E)
+        return (np.nanmean(max_exposures, axis=0) if max_exposure else None), exposure_dissimilarity
+
+    @staticmethod
+    def _segment_mean(x: np.ndarray, era_index: AttrDict) -> np.ndarray:
+        """ Mean of each era broadcasted back to all rows of era sorted 2D array. NaNs are ignored. """
+        valid = ~np.isnan(x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = np.add.reduceat(np.where(valid, x, 0.), era_index.starts, axis=0) / \
+                    np.add.reduceat(valid, era_index.starts, axis=0)
+        return np.repeat(means, era_index.counts, axis=0)
+
+    @staticmethod
+    def _segment_uniform(x: np.ndarray, era_index: AttrDict, method: str = "first") -> np.ndarray:
+        """
+        Uniform ranks within each era for all columns of era sorted 2D array.
+        Equivalent to (rank - 0.5) / n per era, where ties are resolved
+        with Pandas rank methods 'first' or 'average'.
+        """
+        n = len(x)
+        era_ids = np.repeat(np.arange(len(era_index.starts)), era_index.counts)
+        era_starts = np.repeat(era_index.starts, era_index.counts)
+        # Sort values within each era. Stable sorts so ties keep original order.
+        idx = np.argsort(x, axis=0, kind="stable")
+        idx = np.take_along_axis(idx, np.argsort(era_ids[idx], axis=0, kind="stable"), axis=0)
+        positions = np.broadcast_to(np.arange(n)[:, None], x.shape)
+        if method == "first":
+            sorted_ranks = positions - era_starts[:, None] + 1.
+        elif method == "average":
+            sorted_x = np.take_along_axis(x, idx, axis=0)
+            new_group = np.ones(x.shape, dtype=bool)
+            new_group[1:] = (sorted_x[1:] != sorted_x[:-1]) | (era_ids[1:] != era_ids[:-1])[:, None]
+            end_group = np.ones(x.shape, dtype=bool)
+            end_group[:-1] = new_group[1:]
+            group_start = np.maximum.accumulate(np.where(new_group, positions, 0), axis=0)
+            group_end = np.minimum.accumulate(np.where(end_group, positions, n)[::-1], axis=0)[::-1]
+            sorted_ranks = (group_start + group_end) / 2 - era_starts[:, None] + 1.
+        else:
+            raise NotImplementedError(f"Rank method '{method}' is not supported. Use 'first' or 'average'.")
+        ranks = np.empty(x.shape, dtype=np.float64)
+        np.put_along_axis(ranks, idx, sorted_ranks, axis=0)
+        return (ranks - 0.5) / np.repeat(era_index.counts, era_index.counts)[:, None]
+
+    @staticmethod
+    def _tails_p15(x: np.ndarray) -> np.ndarray:
+        """ Accentuate tails by raising to the power of 1.5 while keeping sign. """
+        return np.sign(x) * np.abs(x) ** 1.5
+
+    def _segment_pearson(self, x: np.ndarray, y: np.ndarray, era_index: AttrDict) -> np.ndarray:
+        """
+        Pearson correlation per era between all columns of x and 1 column y.
+        Rows where y is NaN are left out like pairwise deletion in pd.Series.corr.
+        """
+        valid = ~np.isnan(y)
+        x = np.where(valid, x, np.nan)
+        x = np.where(valid, x - self._segment_mean(x, era_index), 0.)
+        y = np.where(valid, y - self._segment_mean(y, era_index), 0.)
+        cov = np.add.reduceat(x * y, era_index.starts, axis=0)
+        var_x = np.add.reduceat(x ** 2, era_index.starts, axis=0)
+        var_y = np.add.reduceat(y ** 2, era_index.starts, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return cov / np.sqrt(var_x * var_y)
+
     def plot_correlations(
         self,
         dataf: NumerFrame,
@@ -363,14 +659,12 @@ class BaseEvaluator:
         :param target_col: Target column name to compute per era correlations against.
         :param roll_mean: How many eras should be averaged to compute a rolling score.
         """
-        validation_by_eras = pd.DataFrame()
+        import matplotlib.pyplot as plt
         pred_cols = dataf.prediction_cols if not pred_cols else pred_cols
-        # Compute per era correlation for each prediction column.
-        for pred_col in pred_cols:
-            per_era_corrs = self.per_era_numerai_corrs(
-                dataf, pred_col=pred_col, target_col=target_col
-            )
-            validation_by_eras.loc[:, pred_col] = per_era_corrs
+        # Compute per era correlations for all prediction columns at once.
+        validation_by_eras = self.per_era_corr_matrix(
+            dataf, pred_cols=pred_cols, target_col=target_col
+        )
 
         # Add prepared per era correlation if any.
         if corr_cols is not None:
@@ -408,11 +702,13 @@ class BaseEvaluator:
         plt.show()
         return
 
-# %% ../nbs/07_evaluation.ipynb 12
+# %% ../nbs/07_evaluation.ipynb 21
 class NumeraiClassicEvaluator(BaseEvaluator):
     """Evaluator for all metrics that are relevant in Numerai Classic."""
-    def __init__(self, era_col: str = "era", fast_mode=False):
-        super().__init__(era_col=era_col, fast_mode=fast_mode)
+    def __init__(self, era_col: str = "era", fast_mode=False, batch_mode=False,
+                 exposure_cache: ExposureCache = None):
+        super().__init__(era_col=era_col, fast_mode=fast_mode, batch_mode=batch_mode,
+                         exposure_cache=exposure_cache)
         self.fncv4_features = FNCV4_FEATURES
         self.fncv3_features = FNCV3_FEATURES
         self.medium_features = MEDIUM_FEATURES
@@ -443,6 +739,24 @@ class NumeraiClassicEvaluator(BaseEvaluator):
             print("WARNING: No suitable feature set defined for FNC. Skipping calculation of FNC.")
             valid_features = []
 
+        if self.batch_mode:
+            # Metrics that can be calculated for both Numerai Classic and Signals
+            val_stats = self.evaluation_all_cols(
+                dataf=dataf,
+                pred_cols=pred_cols,
+                target_col=target_col,
+                example_col=example_col,
+            )
+            # Numerai Classic specific metrics
+            if not self.fast_mode and valid_features:
+                fnc_v3, fn_std_v3, fn_sharpe_v3 = self._feature_neutral_mean_std_sharpe_cols(
+                    dataf=dataf, pred_cols=pred_cols, target_col=target_col, feature_names=valid_features
+                )
+                val_stats.loc[:, "feature_neutral_mean_v3"] = fnc_v3
+                val_stats.loc[:, "feature_neutral_std_v3"] = fn_std_v3
+                val_stats.loc[:, "feature_neutral_sharpe_v3"] = fn_sharpe_v3
+            return val_stats
+
         for col in tqdm(pred_cols, desc="Evaluation: "):
             # Metrics that can be calculated for both Numerai Classic and Signals
             col_stats = self.evaluation_one_col(
@@ -462,11 +776,13 @@ class NumeraiClassicEvaluator(BaseEvaluator):
             val_stats = pd.concat([val_stats, col_stats], axis=0)
         return val_stats
 
-# %% ../nbs/07_evaluation.ipynb 15
+# %% ../nbs/07_evaluation.ipynb 24
 class NumeraiSignalsEvaluator(BaseEvaluator):
     """Evaluator for all metrics that are relevant in Numerai Signals."""
-    def __init__(self, era_col: str = "friday_date", fast_mode=False):
-        super().__init__(era_col=era_col, fast_mode=fast_mode)
+    def __init__(self, era_col: str = "friday_date", fast_mode=False, batch_mode=False,
+                 exposure_cache: ExposureCache = None):
+        super().__init__(era_col=era_col, fast_mode=fast_mode, batch_mode=batch_mode,
+                         exposure_cache=exposure_cache)
 
     def get_neutralized_corr(self, val_dataf: pd.DataFrame, model_name: str, key: Key, timeout_min: int = 2) -> pd.Series:
         """
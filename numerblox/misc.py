@@ -1,11 +1,61 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_misc.ipynb.
 
 # %% auto 0
-__all__ = ['AttrDict']
+__all__ = ['NUMERBLOX_MODULES', 'HEAVY_DEPENDENCIES', 'AttrDict', 'import_benchmark']
 
-# %% ../nbs/00_misc.ipynb 4
+# %% ../nbs/00_misc.ipynb 3
+import sys
+import json
+import subprocess
+
+# %% ../nbs/00_misc.ipynb 5
 class AttrDict(dict):
     """ Access dictionary elements as attributes. """
     def __init__(self, *args, **kwargs):
         super(AttrDict, self).__init__(*args, **kwargs)
         self.__dict__ = self
+
+# %% ../nbs/00_misc.ipynb 8
+NUMERBLOX_MODULES = ["numerblox.misc", "numerblox.numerframe", "numerblox.download", "numerblox.preprocessing",
+                     "numerblox.model", "numerblox.postprocessing", "numerblox.model_pipeline",
+                     "numerblox.evaluation", "numerblox.key", "numerblox.submission"]
+HEAVY_DEPENDENCIES = ["tensorflow", "umap", "pandas_ta", "wandb", "catboost", "lightgbm",
+                      "numerbay", "google.cloud.storage", "eod", "matplotlib"]
+
+_IMPORT_BENCHMARK_SCRIPT = """
+import sys, json, time, resource, importlib
+scale = 1 if sys.platform == "darwin" else 1024
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+import_time = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+heavy = [name for name in sys.argv[2:] if name in sys.modules]
+print(json.dumps({"import_time_s": import_time, "peak_rss_mb": rss_after / 2**20,
+                  "rss_increase_mb": (rss_after - rss_before) / 2**20, "heavy_dependencies_loaded": heavy}))
+"""
+
+def import_benchmark(modules: list = None, repeats: int = 1) -> "pd.DataFrame":
+    """
+    Measure import time and memory usage of modules. Each import runs in a fresh Python process.
+    Memory is measured as peak resident set size (RSS), so this benchmark is only supported on Linux and macOS.
+    :param modules: Modules to benchmark. All numerblox modules by default. \n
+    :param repeats: Number of fresh processes per module. Reported time is the minimum and memory is the maximum over repeats.
+    :return: DataFrame with one row per module containing import time (seconds), peak RSS (MB),
+    RSS increase caused by the import (MB) and heavy optional dependencies that were loaded as a side effect.
+    """
+    import pandas as pd
+    modules = modules if modules else NUMERBLOX_MODULES
+    results = []
+    for module in modules:
+        runs = []
+        for _ in range(repeats):
+            output = subprocess.run([sys.executable, "-c", _IMPORT_BENCHMARK_SCRIPT, module, *HEAVY_DEPENDENCIES],
+                                    capture_output=True, text=True, check=True).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+        results.append({"module": module,
+                        "import_time_s": min(run["import_time_s"] for run in runs),
+                        "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+                        "rss_increase_mb": max(run["rss_increase_mb"] for run in runs),
+                        "heavy_dependencies_loaded": runs[-1]["heavy_dependencies_loaded"]})
+    return pd.DataFrame(results).set_index("module")
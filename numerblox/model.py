@@ -1,46 +1,114 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_model.ipynb.
 
 # %% auto 0
-__all__ = ['BaseModel', 'DirectoryModel', 'SingleModel', 'WandbKerasModel', 'ExternalCSVs', 'NumerBayCSVs', 'JoblibModel',
-           'CatBoostModel', 'LGBMModel', 'ConstantModel', 'RandomModel', 'ExamplePredictionsModel', 'AwesomeModel',
-           'AwesomeDirectoryModel']
+__all__ = ['ModelCache', 'BaseModel', 'DirectoryModel', 'SingleModel', 'WandbKerasModel', 'ExternalCSVs', 'NumerBayCSVs',
+           'JoblibModel', 'CatBoostModel', 'LGBMModel', 'ConstantModel', 'RandomModel', 'ExamplePredictionsModel',
+           'AwesomeModel', 'AwesomeDirectoryModel']
 
 # %% ../nbs/04_model.ipynb 4
 import os
 import gc
 import uuid
-import wandb
 import joblib
 import pickle
+import threading
 import numpy as np
 import pandas as pd
-import lightgbm as lgb
 from pathlib import Path
-from typing import Union
+from typing import Union, Iterator, Callable
 from tqdm.auto import tqdm
-from functools import partial
-from catboost import CatBoost
-from numerbay import NumerBay
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 from rich import print as rich_print
 from sklearn.dummy import DummyRegressor
 
 from .download import NumeraiClassicDownloader
 from .numerframe import NumerFrame, create_numerframe
-from .preprocessing import display_processor_info
+from .preprocessing import display_processor_info, _PANDAS_BLOCK_API
 
 # %% ../nbs/04_model.ipynb 8
+class ModelCache:
+    """
+    LRU cache for loaded models keyed by file path, modification time and file size.
+    Models only use a cache when one is passed to them. `ModelCache.shared()` returns a process-wide instance.
+
+    :param max_bytes: Memory budget in bytes. Memory of a model is estimated by its file size.
+    Least recently used models are evicted when the budget is exceeded. 2 GiB by default.
+    """
+    _shared_cache = None
+
+    def __init__(self, max_bytes: int = 2 * 1024 ** 3):
+        self.max_bytes = max_bytes
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits, self.misses = 0, 0
+
+    @classmethod
+    def shared(cls) -> "ModelCache":
+        """ Process-wide cache that models can opt into by passing it as model_cache. """
+        if cls._shared_cache is None:
+            cls._shared_cache = cls()
+        return cls._shared_cache
+
+    def load(self, path: Union[str, Path], loader: Callable, *args, **kwargs):
+        """
+        Return cached model for path or load it with loader(path, *args, **kwargs).
+        Older versions of the same file are dropped from the cache.
+        """
+        key = self._key(path)
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return self._models[key][0]
+        model = loader(path, *args, **kwargs)
+        with self._lock:
+            self.misses += 1
+            for stale_key in [k for k in self._models if k[0] == key[0] and k != key]:
+                del self._models[stale_key]
+            if key[2] <= self.max_bytes:
+                self._models[key] = (model, key[2])
+                self._evict()
+        return model
+
+    @property
+    def nbytes(self) -> int:
+        """ Estimated memory of all cached models. """
+        return sum(size for _, size in self._models.values())
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def _evict(self):
+        """ Remove least recently used models until cache fits in memory budget. """
+        while self.nbytes > self.max_bytes:
+            self._models.popitem(last=False)
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> tuple:
+        stat = os.stat(path)
+        return str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size
+
+# %% ../nbs/04_model.ipynb 12
 class BaseModel(ABC):
     """
     Setup for model prediction on a Dataset.
 
     :param model_directory: Main directory from which to read in models. \n
-    :param model_name: Name that will be used to create column names and for display purposes.
+    :param model_name: Name that will be used to create column names and for display purposes. \n
+    :param chunk_size: Number of rows to predict on at once. All rows in one call by default.
     """
     def __init__(self, model_directory: str,
                  model_name: str = None,
+                 chunk_size: int = None,
                  ):
         self.model_directory = Path(model_directory)
+        self.chunk_size = chunk_size
         self.model_name = model_name if model_name else uuid.uuid4().hex
         self.prediction_col_name = f"prediction_{self.model_name}"
         self.description = f"{self.__class__.__name__}: '{self.model_name}' prediction"
@@ -49,7 +117,7 @@ class BaseModel(ABC):
     def predict(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         """ Return NumerFrame with column added for prediction. """
         ...
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def get_prediction_col_names(self, pred_shape: tuple) -> list:
         """ Create multiple columns if predictions are multi-target. """
@@ -59,10 +127,62 @@ class BaseModel(ABC):
                 prediction_cols = [f"{self.prediction_col_name}_{i}" for i in range(pred_shape[1])]
         return prediction_cols
 
+    def _predict_in_chunks(self, predict: Callable, dataf: NumerFrame, feature_cols: list) -> np.ndarray:
+        """
+        Predict on at most `self.chunk_size` rows at a time and gather predictions in one array.
+        Every chunk is passed as a DataFrame with feature_cols as columns and the index of its rows,
+        so models get the same input as without chunking.
+        :param predict: Function that takes a (rows x features) DataFrame and returns predictions.
+        """
+        predictions = None
+        for start, features in self._feature_chunks(dataf, feature_cols):
+            # Wrapping the chunk array does not copy it.
+            features = pd.DataFrame(features, columns=feature_cols, index=dataf.index[start:start + len(features)], copy=False)
+            chunk_predictions = predict(features)
+            # Check for if model output is a Pandas DataFrame
+            chunk_predictions = chunk_predictions.values if isinstance(chunk_predictions, pd.DataFrame) else np.asarray(chunk_predictions)
+            if predictions is None:
+                predictions = np.empty((len(dataf),) + chunk_predictions.shape[1:], dtype=chunk_predictions.dtype)
+            predictions[start:start + len(chunk_predictions)] = chunk_predictions
+        return predictions if predictions is not None else np.empty(0)
+
+    def _feature_chunks(self, dataf: NumerFrame, feature_cols: list):
+        """
+        Yield (start row, C-contiguous feature array) for every chunk of rows.
+        If all features are stored next to each other in one block, chunks are sliced from a view on that block
+        and only copied when the view is not contiguous.
+        Otherwise only the rows of the chunk are copied. Features are never copied as a whole.
+        """
+        positions = dataf.columns.get_indexer(feature_cols)
+        block_view = self._feature_block_view(dataf, positions)
+        for start in range(0, len(dataf), self.chunk_size):
+            stop = start + self.chunk_size
+            if block_view is not None:
+                yield start, np.ascontiguousarray(block_view[start:stop])
+            else:
+                yield start, dataf.iloc[start:stop, positions].to_numpy()
+
+    @staticmethod
+    def _feature_block_view(dataf: pd.DataFrame, positions: np.ndarray) -> Union[np.ndarray, None]:
+        """
+        (rows x features) view on the pandas block that holds the columns at positions in order. None if there is none.
+        Always None on pandas versions without the block API, so chunks are copied with `iloc`.
+        """
+        if not _PANDAS_BLOCK_API:
+            return None
+        mgr = dataf._mgr
+        blknos, blklocs = mgr.blknos[positions], mgr.blklocs[positions]
+        if len(positions) == 0 or (blknos != blknos[0]).any() or (np.diff(blklocs) != 1).any():
+            return None
+        values = mgr.blocks[blknos[0]].values
+        if not isinstance(values, np.ndarray):
+            return None
+        return values[blklocs[0]:blklocs[-1] + 1].T
+
     def __call__(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         return self.predict(dataf=dataf)
 
-# %% ../nbs/04_model.ipynb 11
+# %% ../nbs/04_model.ipynb 15
 class DirectoryModel(BaseModel):
     """
     Base class implementation where predictions are averaged out from a directory of models. Walks through every file with given file_suffix in a directory.
@@ -72,15 +192,28 @@ class DirectoryModel(BaseModel):
     :param model_name: Name that will be used to create column names and for display purposes. \n
     :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
     :param combine_preds: Whether to average predictions along column axis. Only relevant for multi target models. \n
-    Convenient when you want to predict the main target by averaging a multi-target model.
+    Convenient when you want to predict the main target by averaging a multi-target model. \n
+    :param num_threads: Number of models that predict concurrently in a thread pool.
+    Useful for models that release the GIL during prediction, like LightGBM and CatBoost boosters. Sequential by default. \n
+    :param max_models_in_flight: Maximum number of models with pending predictions. Caps memory when predicting in parallel.
+    Equal to num_threads by default. \n
+    :param prefetch: Number of models to load ahead in a background thread while predicting. Models are loaded only when needed by default. \n
+    :param model_cache: Optional ModelCache to load models through (e.g. `ModelCache.shared()`). Models are not cached by default. \n
+    :param chunk_size: Number of rows every model predicts on at once. All rows in one call by default.
     """
     def __init__(self, model_directory: str, file_suffix: str,
                  model_name: str = None,
                  feature_cols: list = None,
                  combine_preds = True,
+                 num_threads: int = 1,
+                 max_models_in_flight: int = None,
+                 prefetch: int = 0,
+                 model_cache: ModelCache = None,
+                 chunk_size: int = None,
                  ):
         super().__init__(model_directory=model_directory,
                          model_name=model_name,
+                         chunk_size=chunk_size,
                          )
         self.file_suffix = file_suffix
         self.model_paths = list(self.model_directory.glob(f'*.{self.file_suffix}'))
@@ -89,6 +222,10 @@ class DirectoryModel(BaseModel):
         self.total_models = len(self.model_paths)
         self.feature_cols = feature_cols
         self.combine_preds = combine_preds
+        self.num_threads = num_threads
+        self.max_models_in_flight = max_models_in_flight if max_models_in_flight else num_threads
+        self.prefetch = prefetch
+        self.model_cache = model_cache
 
     @display_processor_info
     def predict(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
@@ -98,25 +235,87 @@ class DirectoryModel(BaseModel):
         *args, **kwargs will be parsed into the model.predict method.
         :return: A new dataset with prediction column added.
         """
-        dataf.loc[:, self.prediction_col_name] = np.zeros(len(dataf))
-        models = self.load_models()
         feature_cols = self.feature_cols if self.feature_cols else dataf.feature_cols
-        for model in tqdm(models, desc=self.description, position=1):
-            predictions = model.predict(dataf[feature_cols], *args, **kwargs)
+        # Predictions are summed in one float64 buffer and written to the NumerFrame once.
+        total_predictions = None
+        for predictions in tqdm(self._predict_models(self.load_models(), dataf, feature_cols, *args, **kwargs),
+                                total=self.total_models, desc=self.description, position=1):
             # Check for if model output is a Pandas DataFrame
             predictions = predictions.values if isinstance(predictions, pd.DataFrame) else predictions
             predictions = predictions.mean(axis=1) if self.combine_preds and len(predictions.shape) > 1 else predictions
-            prediction_cols = self.get_prediction_col_names(predictions.shape)
-            dataf.loc[:, prediction_cols] = dataf.loc[:, prediction_cols] + (predictions / self.total_models)
-        del models; gc.collect()
-        return NumerFrame(dataf)
+            if total_predictions is None:
+                total_predictions = np.zeros(predictions.shape, dtype=np.float64)
+            total_predictions += predictions
+        if total_predictions is None:
+            total_predictions = np.zeros(len(dataf), dtype=np.float64)
+        total_predictions /= max(self.total_models, 1)
+        prediction_cols = self.get_prediction_col_names(total_predictions.shape)
+        # Also adds multiple new prediction columns at once for multi-target models.
+        dataf[prediction_cols] = total_predictions
+        gc.collect()
+        return NumerFrame.wrap(dataf)
+
+    def _predict_models(self, models, dataf: NumerFrame, feature_cols: list, *args, **kwargs):
+        """
+        Yield predictions for every model in order.
+        With multiple threads, models predict concurrently and at most
+        `max_models_in_flight` models are kept alive by pending predictions.
+        """
+        features = None if self.chunk_size else dataf[feature_cols]
+
+        def predict(model):
+            if self.chunk_size:
+                return self._predict_in_chunks(lambda chunk: model.predict(chunk, *args, **kwargs), dataf, feature_cols)
+            return model.predict(features, *args, **kwargs)
+
+        if self.num_threads <= 1:
+            for model in models:
+                predictions = predict(model)
+                # Release model before the next one is loaded
+                del model
+                yield predictions
+            return
+        with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
+            pending = []
+            for model in models:
+                pending.append(executor.submit(predict, model))
+                del model
+                if len(pending) >= max(self.max_models_in_flight, 1):
+                    yield pending.pop(0).result()
+            for future in pending:
+                yield future.result()
+
+    def load_models(self) -> Iterator:
+        """
+        Lazily load models detected in self.model_paths one at a time through the model cache.
+        With prefetch, up to `self.prefetch` next models are loaded in a background thread.
+        """
+        if self.prefetch <= 0:
+            for path in self.model_paths:
+                yield self._load_cached(path)
+            return
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = []
+            for path in self.model_paths:
+                pending.append(executor.submit(self._load_cached, path))
+                if len(pending) > self.prefetch:
+                    yield pending.pop(0).result()
+            while pending:
+                yield pending.pop(0).result()
+
+    def _load_cached(self, path: Path):
+        """ Load model at path through the model cache if one is given. """
+        if self.model_cache is None:
+            return self.load_model(path)
+        return self.model_cache.load(path, self.load_model)
 
     @abstractmethod
-    def load_models(self) -> list:
-        """ Instantiate all models detected in self.model_paths. """
+    def load_model(self, path: Path):
+        """ Instantiate model saved at path. """
         ...
 
-# %% ../nbs/04_model.ipynb 16
+
+# %% ../nbs/04_model.ipynb 20
 class SingleModel(BaseModel):
     """
     Load single model from file and perform prediction logic.
@@ -129,47 +328,68 @@ class SingleModel(BaseModel):
     Will take the 3rd of tuple output in this case. Only relevant for NN models.
     More info on autoencoders:
     https://forum.numer.ai/t/autoencoder-and-multitask-mlp-on-new-dataset-from-kaggle-jane-street/4338 \n
-    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default.
+    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param model_cache: Optional ModelCache to load the model through (e.g. `ModelCache.shared()`). The model is not cached by default. \n
+    :param chunk_size: Number of rows to predict on at once. All rows in one call by default.
     """
     def __init__(self, model_file_path: str, model_name: str = None,
                  combine_preds = False, autoencoder_mlp = False,
-                 feature_cols: list = None
+                 feature_cols: list = None,
+                 model_cache: ModelCache = None,
+                 chunk_size: int = None
                  ):
-        import tensorflow as tf
         self.model_file_path = Path(model_file_path)
         assert self.model_file_path.exists(), f"File path '{self.model_file_path}' does not exist."
         assert self.model_file_path.is_file(), f"File path must point to file. Not valid for '{self.model_file_path}'."
         super().__init__(model_directory=str(self.model_file_path.parent),
                          model_name=model_name,
+                         chunk_size=chunk_size,
                          )
         self.model_suffix = self.model_file_path.suffix
         self.suffix_to_model_mapping = {".joblib": joblib.load,
-                                        ".cbm": CatBoost().load_model,
+                                        ".cbm": self._load_catboost_model,
                                         ".pkl": pickle.load,
                                         ".pickle": pickle.load,
-                                        ".h5": partial(tf.keras.models.load_model, compile=False)
+                                        ".h5": self._load_keras_model
                                         }
         self.__check_valid_suffix()
         self.combine_preds = combine_preds
         self.autoencoder_mlp = autoencoder_mlp
         self.feature_cols = feature_cols
+        self.model_cache = model_cache
 
     def predict(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
         model = self._load_model(*args, **kwargs)
         feature_cols = self.feature_cols if self.feature_cols else dataf.feature_cols
-        predictions = model.predict(dataf[feature_cols])
+        model_predict = (lambda features: model.predict(features)[2]) if self.autoencoder_mlp else model.predict
+        if self.chunk_size:
+            predictions = self._predict_in_chunks(model_predict, dataf, feature_cols)
+        else:
+            predictions = model_predict(dataf[feature_cols])
         # Check for if model output is a Pandas DataFrame
         predictions = predictions.values if isinstance(predictions, pd.DataFrame) else predictions
-        predictions = predictions[2] if self.autoencoder_mlp else predictions
         predictions = predictions.mean(axis=1) if self.combine_preds else predictions
         prediction_cols = self.get_prediction_col_names(predictions.shape)
         dataf.loc[:, prediction_cols] = predictions
         del model; gc.collect()
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def _load_model(self, *args, **kwargs):
-        """ Load arbitrary model from path using suffix to model mapping. """
-        return self.suffix_to_model_mapping[self.model_suffix](str(self.model_file_path), *args, **kwargs)
+        """ Load arbitrary model from path (or model cache) using suffix to model mapping. """
+        loader = self.suffix_to_model_mapping[self.model_suffix]
+        if self.model_cache is None:
+            return loader(str(self.model_file_path), *args, **kwargs)
+        return self.model_cache.load(str(self.model_file_path), loader, *args, **kwargs)
+
+    @staticmethod
+    def _load_catboost_model(path: str, *args, **kwargs):
+        from catboost import CatBoost
+        return CatBoost().load_model(path, *args, **kwargs)
+
+    @staticmethod
+    def _load_keras_model(path: str, *args, **kwargs):
+        import tensorflow as tf
+        return tf.keras.models.load_model(path, compile=False, *args, **kwargs)
 
     def __check_valid_suffix(self):
         """ Detailed message if model is not supported in this class. """
@@ -180,7 +400,7 @@ class SingleModel(BaseModel):
                 f"Format '{self.model_suffix}' is not available. Available versions are {list(self.suffix_to_model_mapping.keys())}"
             )
 
-# %% ../nbs/04_model.ipynb 21
+# %% ../nbs/04_model.ipynb 27
 class WandbKerasModel(SingleModel):
     """
     Download best .h5 model from Weights & Biases (W&B) run in local directory and make predictions.
@@ -198,7 +418,9 @@ class WandbKerasModel(SingleModel):
     More info on autoencoders:
     https://forum.numer.ai/t/autoencoder-and-multitask-mlp-on-new-dataset-from-kaggle-jane-street/4338 \n
     :param replace: Replace any model files saved under the same file name with downloaded W&B run model. WARNING: Setting to True may overwrite models in your local environment. \n
-    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default.
+    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param model_cache: Optional ModelCache to load the model through (e.g. `ModelCache.shared()`). The model is not cached by default. \n
+    :param chunk_size: Number of rows to predict on at once. All rows in one call by default.
     """
     def __init__(self,
                  run_path: str,
@@ -206,7 +428,9 @@ class WandbKerasModel(SingleModel):
                  combine_preds = False,
                  autoencoder_mlp = False,
                  replace = False,
-                 feature_cols: list = None
+                 feature_cols: list = None,
+                 model_cache: ModelCache = None,
+                 chunk_size: int = None
                  ):
         self.run_path = run_path
         self.file_name = file_name
@@ -217,7 +441,9 @@ class WandbKerasModel(SingleModel):
                          model_name=self.run_path,
                          combine_preds=combine_preds,
                          autoencoder_mlp=autoencoder_mlp,
-                         feature_cols=feature_cols
+                         feature_cols=feature_cols,
+                         model_cache=model_cache,
+                         chunk_size=chunk_size
                          )
 
     def _download_model(self):
@@ -231,11 +457,12 @@ class WandbKerasModel(SingleModel):
             consider moving it or set 'replace=True' at initialization to overwrite. [/red] :warning:")
         else:
             rich_print(f":page_facing_up: [green] Downloading '{self.file_name}' from '{self.run_path}' in W&B Cloud. [/green] :page_facing_up:")
+        import wandb
         run = wandb.Api().run(self.run_path)
         run.file(name=self.file_name).download(replace=self.replace)
         os.rename(self.file_name, f"{self.run_path.split('/')[-1]}_{self.file_name}")
 
-# %% ../nbs/04_model.ipynb 24
+# %% ../nbs/04_model.ipynb 30
 class ExternalCSVs(BaseModel):
     """
     Load external submissions and add to NumerFrame. \n
@@ -254,7 +481,7 @@ class ExternalCSVs(BaseModel):
         """ Return NumerFrame with added external predictions. """
         for path in tqdm(self.paths, desc="External submissions"):
             dataf.loc[:, f"prediction_{path.name}"] = self._get_preds(path)
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def _get_preds(self, path: Path) -> pd.Series:
         pred_col = pd.read_csv(path, index_col=0, header=0)['prediction']
@@ -262,7 +489,7 @@ class ExternalCSVs(BaseModel):
             raise ValueError(f"Prediction values must be between 0 and 1. Does not hold for '{path.name}'.")
         return pred_col
 
-# %% ../nbs/04_model.ipynb 31
+# %% ../nbs/04_model.ipynb 37
 class NumerBayCSVs(BaseModel):
     """
     Load NumerBay submissions and add to NumerFrame. \n
@@ -286,11 +513,16 @@ class NumerBayCSVs(BaseModel):
         self.numerbay_product_full_names = numerbay_product_full_names
         self.numerbay_key_path = numerbay_key_path
         self._api = None
-        self._get_api_func = lambda: NumerBay(username=numerbay_username, password=numerbay_password)
+        self._get_api_func = lambda: self._numerbay_api(username=numerbay_username, password=numerbay_password)
         self.ticker_col = ticker_col
         self.classic_number = 8
         self.signals_number = 11
 
+    @staticmethod
+    def _numerbay_api(*args, **kwargs):
+        from numerbay import NumerBay
+        return NumerBay(*args, **kwargs)
+
     def predict(self, dataf: NumerFrame) -> NumerFrame:
         """ Return NumerFrame with added NumerBay predictions. """
         for numerbay_product_full_name in tqdm(self.numerbay_product_full_names, desc="NumerBay submissions"):
@@ -302,7 +534,7 @@ class NumerBayCSVs(BaseModel):
                 dataf.loc[:, pred_name] = \
                     dataf.merge(self._get_preds(numerbay_product_full_name, tournament=self.signals_number),
                                 on=[self.ticker_col, dataf.meta.era_col], how='left')['signal']
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     @property
     def api(self):
@@ -350,7 +582,7 @@ class NumerBayCSVs(BaseModel):
             raise ValueError(f"Prediction values must be between 0 and 1. Does not hold for '{path.name}'.")
         return pred_col
 
-# %% ../nbs/04_model.ipynb 37
+# %% ../nbs/04_model.ipynb 43
 class JoblibModel(DirectoryModel):
     """
     Load and predict for arbitrary models in directory saved as .joblib.
@@ -359,72 +591,119 @@ class JoblibModel(DirectoryModel):
 
     :param model_directory: Main directory from which to read in models. \n
     :param model_name: Name that will be used to create column names and for display purposes. \n
-    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default.
+    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param num_threads: Number of models that predict concurrently. Sequential by default. \n
+    :param max_models_in_flight: Maximum number of models with pending predictions. Equal to num_threads by default. \n
+    :param prefetch: Number of models to load ahead while predicting. No prefetching by default. \n
+    :param model_cache: Optional ModelCache to load models through (e.g. `ModelCache.shared()`). Models are not cached by default. \n
+    :param chunk_size: Number of rows every model predicts on at once. All rows in one call by default.
     """
     def __init__(self,
                  model_directory: str,
                  model_name: str = None,
-                 feature_cols: list = None
+                 feature_cols: list = None,
+                 num_threads: int = 1,
+                 max_models_in_flight: int = None,
+                 prefetch: int = 0,
+                 model_cache: ModelCache = None,
+                 chunk_size: int = None,
                  ):
         file_suffix = 'joblib'
         super().__init__(model_directory=model_directory,
                          file_suffix=file_suffix,
                          model_name=model_name,
-                         feature_cols=feature_cols
+                         feature_cols=feature_cols,
+                         num_threads=num_threads,
+                         max_models_in_flight=max_models_in_flight,
+                         prefetch=prefetch,
+                         model_cache=model_cache,
+                         chunk_size=chunk_size,
                          )
 
-    def load_models(self) -> list:
-        return [joblib.load(path) for path in self.model_paths]
+    def load_model(self, path: Path):
+        return joblib.load(path)
 
-# %% ../nbs/04_model.ipynb 41
+# %% ../nbs/04_model.ipynb 47
 class CatBoostModel(DirectoryModel):
     """
     Load and predict with all .cbm models (CatBoostRegressor) in directory.
 
     :param model_directory: Main directory from which to read in models. \n
     :param model_name: Name that will be used to define column names and for display purposes. \n
-    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default.
+    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param num_threads: Number of models that predict concurrently. Sequential by default. \n
+    :param max_models_in_flight: Maximum number of models with pending predictions. Equal to num_threads by default. \n
+    :param prefetch: Number of models to load ahead while predicting. No prefetching by default. \n
+    :param model_cache: Optional ModelCache to load models through (e.g. `ModelCache.shared()`). Models are not cached by default. \n
+    :param chunk_size: Number of rows every model predicts on at once. All rows in one call by default.
     """
     def __init__(self,
                  model_directory: str,
                  model_name: str = None,
-                 feature_cols: list = None
+                 feature_cols: list = None,
+                 num_threads: int = 1,
+                 max_models_in_flight: int = None,
+                 prefetch: int = 0,
+                 model_cache: ModelCache = None,
+                 chunk_size: int = None,
                  ):
         file_suffix = 'cbm'
         super().__init__(model_directory=model_directory,
                          file_suffix=file_suffix,
                          model_name=model_name,
-                         feature_cols=feature_cols
+                         feature_cols=feature_cols,
+                         num_threads=num_threads,
+                         max_models_in_flight=max_models_in_flight,
+                         prefetch=prefetch,
+                         model_cache=model_cache,
+                         chunk_size=chunk_size,
                          )
 
-    def load_models(self) -> list:
-        return [CatBoost().load_model(path) for path in self.model_paths]
+    def load_model(self, path: Path):
+        from catboost import CatBoost
+        return CatBoost().load_model(str(path))
 
-# %% ../nbs/04_model.ipynb 45
+# %% ../nbs/04_model.ipynb 51
 class LGBMModel(DirectoryModel):
     """
     Load and predict with all .lgb models (LightGBM) in directory.
 
     :param model_directory: Main directory from which to read in models. \n
     :param model_name: Name that will be used to define column names and for display purposes. \n
-    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default.
+    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param num_threads: Number of models that predict concurrently. Sequential by default. \n
+    :param max_models_in_flight: Maximum number of models with pending predictions. Equal to num_threads by default. \n
+    :param prefetch: Number of models to load ahead while predicting. No prefetching by default. \n
+    :param model_cache: Optional ModelCache to load models through (e.g. `ModelCache.shared()`). Models are not cached by default. \n
+    :param chunk_size: Number of rows every model predicts on at once. All rows in one call by default.
     """
     def __init__(self,
                  model_directory: str,
                  model_name: str = None,
-                 feature_cols: list = None
+                 feature_cols: list = None,
+                 num_threads: int = 1,
+                 max_models_in_flight: int = None,
+                 prefetch: int = 0,
+                 model_cache: ModelCache = None,
+                 chunk_size: int = None,
                  ):
         file_suffix = 'lgb'
         super().__init__(model_directory=model_directory,
                          file_suffix=file_suffix,
                          model_name=model_name,
-                         feature_cols=feature_cols
+                         feature_cols=feature_cols,
+                         num_threads=num_threads,
+                         max_models_in_flight=max_models_in_flight,
+                         prefetch=prefetch,
+                         model_cache=model_cache,
+                         chunk_size=chunk_size,
                          )
 
-    def load_models(self) -> list:
-        return [lgb.Booster(model_file=str(path)) for path in self.model_paths]
+    def load_model(self, path: Path):
+        import lightgbm as lgb
+        return lgb.Booster(model_file=str(path))
 
-# %% ../nbs/04_model.ipynb 51
+# %% ../nbs/04_model.ipynb 59
 class ConstantModel(BaseModel):
     """
     WARNING: Only use this Model for testing purposes. \n
@@ -442,10 +721,11 @@ class ConstantModel(BaseModel):
         self.clf = DummyRegressor(strategy='constant', constant=constant).fit([0.], [0.])
 
     def predict(self, dataf: NumerFrame) -> NumerFrame:
-        dataf.loc[:, self.prediction_col_name] = self.clf.predict(dataf.get_feature_data)
-        return NumerFrame(dataf)
+        # Constant predictions only depend on the number of rows, so feature data is not copied.
+        dataf.loc[:, self.prediction_col_name] = self.clf.predict(np.empty((len(dataf), 0)))
+        return NumerFrame.wrap(dataf)
 
-# %% ../nbs/04_model.ipynb 55
+# %% ../nbs/04_model.ipynb 63
 class RandomModel(BaseModel):
     """
     WARNING: Only use this Model for testing purposes. \n
@@ -461,9 +741,9 @@ class RandomModel(BaseModel):
 
     def predict(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         dataf.loc[:, self.prediction_col_name] = np.random.uniform(size=len(dataf))
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
-# %% ../nbs/04_model.ipynb 59
+# %% ../nbs/04_model.ipynb 67
 class ExamplePredictionsModel(BaseModel):
     """
     Load example predictions and add to NumerFrame. \n
@@ -489,7 +769,7 @@ class ExamplePredictionsModel(BaseModel):
         example_preds = self._load_example_preds()
         dataf.loc[:, self.prediction_col_name] = dataf.merge(example_preds, on='id', how='left')['prediction']
         self.downloader.remove_base_directory()
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def _download_example_preds(self):
         self.downloader = NumeraiClassicDownloader(directory_path=self.data_directory)
@@ -501,7 +781,7 @@ class ExamplePredictionsModel(BaseModel):
     def _load_example_preds(self, *args, **kwargs):
         return pd.read_parquet(self.dest_path, *args, **kwargs)
 
-# %% ../nbs/04_model.ipynb 65
+# %% ../nbs/04_model.ipynb 73
 class AwesomeModel(BaseModel):
     """
     TEMPLATE - Predict with arbitrary prediction logic and model formats.
@@ -526,9 +806,9 @@ class AwesomeModel(BaseModel):
         # Predict and add to new column
         ...
         # Parse all contents of NumerFrame to the next pipeline step
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
-# %% ../nbs/04_model.ipynb 68
+# %% ../nbs/04_model.ipynb 76
 class AwesomeDirectoryModel(DirectoryModel):
     """
     TEMPLATE - Load in all models of arbitrary file format and predict for all.
@@ -549,6 +829,6 @@ class AwesomeDirectoryModel(DirectoryModel):
                          feature_cols=feature_cols
                          )
 
-    def load_models(self) -> list:
-        """ Instantiate all models and return as a list. (abstract method) """
+    def load_model(self, path: Path):
+        """ Instantiate model saved at path. (abstract method) """
         ...
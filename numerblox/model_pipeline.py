@@ -50,7 +50,7 @@ class ModelPipeline:
                                  position=0):
             rich_print(f":construction: Applying preprocessing: '[bold]{preprocessor.__class__.__name__}[/bold]' :construction:")
             dataf = preprocessor(dataf)
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def postprocess(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         """ Run all postprocessing steps. Standardizes model prediction by default. """
@@ -61,7 +61,7 @@ class ModelPipeline:
                                   position=0):
             rich_print(f":construction: Applying postprocessing: '[bold]{postprocessor.__class__.__name__}[/bold]' :construction:")
             dataf = postprocessor(dataf)
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def process_models(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         """ Run all models. """
@@ -70,7 +70,7 @@ class ModelPipeline:
                                   position=0):
             rich_print(f":robot: Generating model predictions with '[bold]{model.__class__.__name__}[/bold]'. :robot:")
             dataf = model(dataf)
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def pipeline(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         """ Process full pipeline and return resulting NumerFrame. """
@@ -83,7 +83,7 @@ class ModelPipeline:
     def __call__(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         return self.pipeline(dataf)
 
-# %% ../nbs/06_modelpipeline.ipynb 15
+# %% ../nbs/06_modelpipeline.ipynb 17
 class ModelPipelineCollection:
     """
     Execute multiple initialized ModelPipelines in a sequence.
@@ -107,7 +107,7 @@ class ModelPipelineCollection:
         rich_print(f":construction_worker: [bold green]Processing model pipeline:[/bold green] '{pipeline_name}' :construction_worker:")
         pipeline = self.get_pipeline(pipeline_name)
         dataf = pipeline(dataf)
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def get_pipeline(self, pipeline_name: str) -> ModelPipeline:
         """ Retrieve model pipeline for given name. """
@@ -1,14 +1,15 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_numerframe.ipynb.
 
 # %% auto 0
-__all__ = ['NumerFrame', 'create_numerframe']
+__all__ = ['NumerFrame', 'create_numerframe', 'iter_numerframe_eras', 'write_numerframe_cache', 'load_numerframe_cache']
 
 # %% ../nbs/02_numerframe.ipynb 4
 import uuid
+import json
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Union, Tuple, Any, List
+from typing import Union, Tuple, Any, List, Iterator
 
 from .misc import AttrDict
 
@@ -18,31 +19,117 @@ class NumerFrame(pd.DataFrame):
     Data structure which extends Pandas DataFrames and
     allows for additional Numerai specific functionality.
     """
-    _metadata = ["meta", "feature_cols", "target_cols",
-                 "prediction_cols", "not_aux_cols", "aux_cols"]
-
+    _metadata = ["meta", "_column_groups"]
+    # Column groups are carried over to derived NumerFrames and only recomputed when columns change.
+    _column_groups = None
+    # Era index is not part of _metadata so it is never carried over to frames with different rows.
+    _era_index_cache = None
+    _column_prefixes = ("feature", "target", "prediction")
+    # Column groups were stored as instance attributes in pickles from numerblox <= 0.5.9.
+    _legacy_state_keys = ("feature_cols", "target_cols", "prediction_cols", "not_aux_cols", "aux_cols")
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        data = args[0] if args else kwargs.get("data")
+        if isinstance(data, NumerFrame):
+            object.__setattr__(self, "_column_groups", data._column_groups)
         self.meta = AttrDict()
         self.__set_era_col()
-        self.__init_meta_attrs()
-        
+
+    @classmethod
+    def wrap(cls, dataf: pd.DataFrame) -> "NumerFrame":
+        """
+        Wrap DataFrame as NumerFrame without copying or consolidating any data.
+        The new NumerFrame shares the column arrays of `dataf`, so in place changes to values are reflected in both objects
+        (unless pandas Copy-on-Write is enabled). \n
+        Cached column groups and era index are carried over when `dataf` is a NumerFrame. \n
+        :param dataf: DataFrame or NumerFrame to wrap.
+        """
+        nf = cls(dataf, copy=False)
+        nf.attrs = dict(dataf.attrs)
+        if isinstance(dataf, NumerFrame):
+            object.__setattr__(nf, "_era_index_cache", dataf._era_index_cache)
+        return nf
+
     @property
     def _constructor(self):
         return NumerFrame
 
-    def __init_meta_attrs(self):
-        """ Dynamically track column groups. """
-        self.feature_cols = [col for col in self.columns if str(col).startswith("feature")]
-        self.target_cols = [col for col in self.columns if str(col).startswith("target")]
-        self.prediction_cols = [
-            col for col in self.columns if str(col).startswith("prediction")
-        ]
-        self.not_aux_cols = self.feature_cols + self.target_cols + self.prediction_cols
-        self.aux_cols = [
-            col for col in self.columns if col not in self.not_aux_cols
-        ]
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.invalidate_era_index()
+
+    def _clear_item_cache(self) -> None:
+        # Pandas clears the item cache whenever data is mutated in place.
+        super()._clear_item_cache()
+        self.invalidate_era_index()
+
+    def _maybe_cache_changed(self, item, value: pd.Series, inplace: bool) -> None:
+        # Called by pandas when a column Series is modified in place.
+        super()._maybe_cache_changed(item, value, inplace)
+        self.invalidate_era_index()
+
+    def __setstate__(self, state):
+        # Drop legacy column group attributes so old pickles load. Column groups are recomputed lazily.
+        if isinstance(state, dict):
+            state = {k: v for k, v in state.items() if k not in self._legacy_state_keys}
+        super().__setstate__(state)
+
+    @property
+    def feature_cols(self) -> list:
+        """ All columns for which name starts with 'feature'. """
+        return list(self._get_column_groups().feature)
+
+    @property
+    def target_cols(self) -> list:
+        """ All columns for which name starts with 'target'. """
+        return list(self._get_column_groups().target)
+
+    @property
+    def prediction_cols(self) -> list:
+        """ All columns for which name starts with 'prediction'. """
+        return list(self._get_column_groups().prediction)
+
+    @property
+    def not_aux_cols(self) -> list:
+        """ All feature, target and prediction columns. """
+        groups = self._get_column_groups()
+        return groups.feature + groups.target + groups.prediction
+
+    @property
+    def aux_cols(self) -> list:
+        """ All columns that are not features, targets or predictions. """
+        return list(self._get_column_groups().aux)
+
+    def _get_column_groups(self) -> AttrDict:
+        """
+        Dynamically track column groups.
+        Groups are computed once per set of columns. When columns are added or removed,
+        group membership of existing columns is looked up and only new columns are classified.
+        """
+        groups, columns = self._column_groups, self.columns
+        if groups is not None and groups.columns is columns:
+            return groups
+        n_old = len(groups.columns) if groups is not None else 0
+        if groups is not None and len(columns) >= n_old and columns[:n_old].equals(groups.columns):
+            # Columns were only appended.
+            new_groups = AttrDict({name: list(groups[name]) for name in self._column_prefixes + ("aux",)})
+            group_of = dict(groups.group_of)
+            new_columns = columns[n_old:]
+        else:
+            new_groups = AttrDict({name: [] for name in self._column_prefixes + ("aux",)})
+            group_of = dict(groups.group_of) if groups is not None else {}
+            new_columns = columns
+        for col in new_columns:
+            group = group_of.get(col)
+            if group is None:
+                group = next((prefix for prefix in self._column_prefixes if str(col).startswith(prefix)), "aux")
+                group_of[col] = group
+            new_groups[group].append(col)
+        new_groups.columns = columns
+        new_groups.group_of = group_of
+        object.__setattr__(self, "_column_groups", new_groups)
+        return new_groups
 
     def __set_era_col(self):
         """ Each NumerFrame should have an era column to benefit from all functionality. """
@@ -55,6 +142,93 @@ class NumerFrame(pd.DataFrame):
         else:
             self.meta.era_col = None
 
+    @property
+    def era_index(self) -> AttrDict:
+        """
+        Era index that is built lazily by sorting rows by era once. Cached until the NumerFrame is mutated. \n
+        eras: pd.Index with unique eras in sorted order. \n
+        order: Row positions sorted by era. Rows within an era keep their original order. \n
+        starts / stops: Offsets of every era in `order`. \n
+        counts: Number of rows for every era. \n
+        Rows with a missing era are not included.
+        """
+        assert self.meta.era_col is not None, "No era column found. Era column should be 'era', 'friday_date' or 'date'."
+        key = (self.meta.era_col, len(self), id(self.index))
+        if self._era_index_cache is None or self._era_index_cache.key != key:
+            index = self.build_era_index(self[self.meta.era_col])
+            index.key = key
+            object.__setattr__(self, "_era_index_cache", index)
+        return self._era_index_cache
+
+    @staticmethod
+    def build_era_index(eras: Union[pd.Series, np.ndarray]) -> AttrDict:
+        """ Sort era values once and compute start and stop offsets for every era. See `NumerFrame.era_index`. """
+        codes, uniques = pd.factorize(eras, sort=True)
+        order = np.argsort(codes, kind="stable")
+        # Missing eras have code -1 and are sorted first.
+        order = order[np.count_nonzero(codes < 0):]
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        stops = np.cumsum(counts)
+        return AttrDict(eras=pd.Index(uniques), order=order, starts=stops - counts, stops=stops, counts=counts)
+
+    def invalidate_era_index(self):
+        """ Drop cached era index. Only needed when era values are changed in place through the underlying NumPy array. """
+        object.__setattr__(self, "_era_index_cache", None)
+
+    def era_positions(self, eras: List[Any]) -> np.ndarray:
+        """
+        Row positions for a selection of eras in original row order.
+        :param eras: Selection of era names that should be present in era_col.
+        """
+        index = self.era_index
+        positions = []
+        for era in eras:
+            assert era in index.eras, f"Era '{era}' not found in era column ({self.meta.era_col})"
+            i = index.eras.get_loc(era)
+            positions.append(index.order[index.starts[i]:index.stops[i]])
+        positions = np.concatenate(positions) if positions else np.array([], dtype=np.int64)
+        return positions if len(eras) <= 1 else np.sort(positions)
+
+    def era_slice(self, era: Any) -> "NumerFrame":
+        """
+        Rows of a single era.
+        Returns a zero-copy view when the rows of the era are stored contiguously (as in Numerai datasets).
+        :param era: Era name that should be present in era_col.
+        """
+        return self._take_positions(self.era_positions([era]))
+
+    def iter_eras(self, eras: List[Any] = None) -> Iterator[Tuple[Any, "NumerFrame"]]:
+        """
+        Iterate over (era, NumerFrame) pairs in sorted era order without scanning the era column for every era.
+        Slices are zero-copy views when the rows of an era are stored contiguously.
+        :param eras: Selection of eras to iterate over. All eras by default.
+        """
+        index = self.era_index
+        eras = index.eras if eras is None else eras
+        for era in eras:
+            i = index.eras.get_loc(era)
+            yield era, self._take_positions(index.order[index.starts[i]:index.stops[i]])
+
+    def iter_era_values(self, columns: list, era_index: AttrDict = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Iterate over (row positions, values) of columns for every era in sorted era order.
+        Values keep their stored dtype (for example int8 features) and only one era is copied at a time,
+        so computations can upcast small per era blocks instead of all data. \n
+        :param columns: Columns to get values for. \n
+        :param era_index: Era index to iterate over. `era_index` of this NumerFrame by default.
+        """
+        index = self.era_index if era_index is None else era_index
+        for start, stop in zip(index.starts, index.stops):
+            positions = index.order[start:stop]
+            yield positions, self._take_positions(positions)[columns].to_numpy()
+
+    def _take_positions(self, positions: np.ndarray) -> "NumerFrame":
+        """ Select rows by increasing positions. Slices instead of copies if positions are contiguous. """
+        if len(positions) == 0 or positions[-1] - positions[0] + 1 == len(positions):
+            start = positions[0] if len(positions) else 0
+            return self.iloc[start:start + len(positions)]
+        return self.take(positions)
+
     def get_column_selection(self, cols: Union[str, list]):
         """ Return NumerFrame from selection of columns. """
         return self.loc[:, cols if isinstance(cols, list) else [cols]]
@@ -122,14 +296,11 @@ class NumerFrame(pd.DataFrame):
         :param targets: List of targets to select. All by default. \n
         *args, **kwargs are passed to initialization of Tensor.
         """
-        valid_eras = []
-        for era in eras:
-            assert era in self[self.meta.era_col].unique(), f"Era '{era}' not found in era column ({self.meta.era_col})"
-            valid_eras.append(era)
         features = features if features else self.feature_cols
         targets = targets if targets else self.target_cols
-        X = self.loc[self[self.meta.era_col].isin(valid_eras)][features].values
-        y = self.loc[self[self.meta.era_col].isin(valid_eras)][targets].values
+        batch = self._take_positions(self.era_positions(eras))
+        X = batch[features].values
+        y = batch[targets].values
         if aemlp_batch:
             y = [X.copy(), y.copy(), y.copy()]
 
@@ -153,7 +324,11 @@ def create_numerframe(file_path: str, columns: list = None, *args, **kwargs) ->
     :param file_path: Relative or absolute path to data file. \n
     :param columns: Which columns to read (All by default). \n
     *args, **kwargs will be passed to Pandas loading function.
+    Use `iter_numerframe_eras` to stream large parquet files era by era.
+    Directories written with `write_numerframe_cache` are loaded with memory mapping.
     """
+    if (Path(file_path) / _CACHE_META_FILE).is_file():
+        return load_numerframe_cache(file_path, columns=columns, *args, **kwargs)
     assert Path(file_path).is_file(), f"{file_path} does not point to file."
     suffix = Path(file_path).suffix
     if suffix in [".csv"]:
@@ -169,3 +344,193 @@ def create_numerframe(file_path: str, columns: list = None, *args, **kwargs) ->
         raise NotImplementedError(f"Suffix '{suffix}' is not supported.")
     num_frame = NumerFrame(df)
     return num_frame
+
+# %% ../nbs/02_numerframe.ipynb 12
+def iter_numerframe_eras(file_path: str, columns: list = None, eras: List[Any] = None,
+                         era_chunk_size: int = 1, era_col: str = None) -> Iterator[NumerFrame]:
+    """
+    Stream parquet file as NumerFrames containing `era_chunk_size` eras each.
+    Columns are projected and eras are pushed down to row group selection, so only the needed data is read.
+    Every row group is read once. Rows of eras that continue in later row groups (or of chunks that come later in `eras`)
+    are kept in memory until their chunk is complete. \n
+    :param file_path: Relative or absolute path to parquet file. \n
+    :param columns: Which columns to read (All by default). The era column is always included. \n
+    :param eras: Which eras to read and in which order (All eras in sorted order by default). \n
+    :param era_chunk_size: Number of eras in each yielded NumerFrame. \n
+    :param era_col: Era column name. Detected from file schema by default ('era', 'friday_date' or 'date').
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    assert Path(file_path).is_file(), f"{file_path} does not point to file."
+    assert Path(file_path).suffix == ".parquet", f"Streaming is only supported for .parquet files. Got '{file_path}'."
+    parquet_file = pq.ParquetFile(file_path)
+    if era_col is None:
+        era_col = next((col for col in ["era", "friday_date", "date"] if col in parquet_file.schema_arrow.names), None)
+        assert era_col, f"No era column found in '{file_path}'. Specify one with 'era_col'."
+    # Map every era to the row groups it occurs in by only reading the era column.
+    era_row_groups = {}
+    for i in range(parquet_file.num_row_groups):
+        row_group_eras = parquet_file.read_row_group(i, columns=[era_col]).column(era_col)
+        for era in pc.unique(row_group_eras).to_pylist():
+            era_row_groups.setdefault(era, []).append(i)
+    eras = sorted(era_row_groups) if eras is None else [era for era in eras if era in era_row_groups]
+    if columns is not None and era_col not in columns:
+        columns = list(columns) + [era_col]
+    era_type = parquet_file.schema_arrow.field(era_col).type
+    # Categorical eras are stored dictionary encoded. They are compared on their decoded values.
+    if pa.types.is_dictionary(era_type):
+        era_type = era_type.value_type
+    chunks = [eras[start:start + era_chunk_size] for start in range(0, len(eras), era_chunk_size)]
+    # Row group after which all rows of a chunk have been read.
+    chunk_ends = [max(era_row_groups[era][-1] for era in chunk_eras) for chunk_eras in chunks]
+    row_groups = sorted({i for era in eras for i in era_row_groups[era]})
+    def era_mask(table, selected_eras: list):
+        return pc.is_in(table.column(era_col).cast(era_type), value_set=pa.array(selected_eras, type=era_type))
+    buffered, next_chunk = [], 0
+    for i in row_groups:
+        # Pandas metadata restores the index (e.g. 'id') that was stored with the DataFrame.
+        table = parquet_file.read_row_group(i, columns=columns, use_pandas_metadata=True)
+        buffered.append(table.filter(era_mask(table, eras)))
+        while next_chunk < len(chunks) and chunk_ends[next_chunk] <= i:
+            table = pa.concat_tables(buffered)
+            in_chunk = era_mask(table, chunks[next_chunk])
+            buffered = [table.filter(pc.invert(in_chunk))]
+            yield NumerFrame(table.filter(in_chunk).to_pandas())
+            next_chunk += 1
+
+# %% ../nbs/02_numerframe.ipynb 16
+_CACHE_META_FILE = "numerframe.json"
+
+def write_numerframe_cache(dataf: pd.DataFrame, cache_dir: str) -> Path:
+    """
+    Write DataFrame to a NumerFrame cache directory that can be loaded with memory mapping.
+    Rows are stored sorted by era (rows without era last), so every era is a contiguous slice.
+    The original position of every row is stored as well, so `load_numerframe_cache` can restore the original order.
+    :param dataf: DataFrame or NumerFrame to cache. \n
+    :param cache_dir: Directory to write cache to. Created if it does not exist.
+    :return: Path to cache directory.
+    """
+    import pyarrow as pa
+    dataf = NumerFrame.wrap(dataf)
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    era_col = dataf.meta.era_col
+    era_file, row_order_file = None, None
+    if era_col is not None:
+        index = dataf.era_index
+        missing = np.flatnonzero(dataf[era_col].isna().values)
+        order = np.concatenate([index.order, missing])
+        if not (order == np.arange(len(dataf))).all():
+            row_order_file = "row_order.npy"
+            np.save(cache_dir / row_order_file, order)
+            dataf = NumerFrame.wrap(dataf.take(order))
+            index = dataf.era_index
+        era_file = "eras.arrow"
+        eras = pa.Table.from_pandas(pd.DataFrame({"era": index.eras, "start": index.starts, "stop": index.stops}),
+                                    preserve_index=False)
+        _write_arrow(eras, cache_dir / era_file)
+    groups = dataf._get_column_groups()
+    # Split columns in runs of adjacent columns with the same group and NumPy dtype.
+    blocks = []
+    for col, dtype in zip(dataf.columns, dataf.dtypes):
+        kind = "npy" if isinstance(dtype, np.dtype) and dtype.kind in "biuf" else "arrow"
+        key = (groups.group_of[col], kind, str(dtype) if kind == "npy" else None)
+        if blocks and blocks[-1]["key"] == key:
+            blocks[-1]["columns"].append(col)
+        else:
+            blocks.append({"key": key, "columns": [col]})
+    block_meta = []
+    for i, block in enumerate(blocks):
+        group, kind, _ = block["key"]
+        file = f"{group}_{i}.{kind}"
+        if kind == "npy":
+            # Stored as (columns, rows) so memory layout equals a Pandas block.
+            np.save(cache_dir / file, np.ascontiguousarray(dataf[block["columns"]].to_numpy().T))
+        else:
+            _write_arrow(pa.Table.from_pandas(dataf[block["columns"]], preserve_index=False), cache_dir / file)
+        block_meta.append({"file": file, "columns": block["columns"]})
+    _write_arrow(pa.Table.from_pandas(pd.DataFrame(index=dataf.index)), cache_dir / "index.arrow")
+    meta = {"n_rows": len(dataf), "era_col": era_col, "era_file": era_file, "row_order_file": row_order_file,
+            "blocks": block_meta,
+            "column_groups": {name: groups[name] for name in NumerFrame._column_prefixes + ("aux",)}}
+    with open(cache_dir / _CACHE_META_FILE, "w") as f:
+        json.dump(meta, f)
+    return cache_dir
+
+def load_numerframe_cache(cache_dir: str, columns: list = None, mmap_mode: str = "c",
+                          original_order: bool = False) -> NumerFrame:
+    """
+    Load NumerFrame from directory written with `write_numerframe_cache`.
+    Numeric columns are memory mapped without copying. Column groups and era index are restored from the cache.
+    Rows are sorted by era unless `original_order` is set.
+    :param cache_dir: Cache directory. \n
+    :param columns: Which columns to load (All by default).
+    Numeric columns are only memory mapped if the selected columns of every stored block are adjacent
+    and selected in stored order. Other selections copy the numeric columns into memory. \n
+    :param mmap_mode: Memory map mode for numeric columns. 'c' (copy-on-write) by default.
+    'r' maps read-only and None reads all data in memory. \n
+    :param original_order: Return rows in the order they were passed to `write_numerframe_cache`.
+    This copies all loaded columns into memory.
+    """
+    cache_dir = Path(cache_dir)
+    with open(cache_dir / _CACHE_META_FILE) as f:
+        meta = json.load(f)
+    index = _read_arrow(cache_dir / "index.arrow").index
+    wanted = set(columns) if columns is not None else None
+    pieces = []
+    for block in meta["blocks"]:
+        positions = [i for i, col in enumerate(block["columns"]) if wanted is None or col in wanted]
+        if not positions:
+            continue
+        block_cols = [block["columns"][i] for i in positions]
+        if block["file"].endswith(".npy"):
+            values = np.load(cache_dir / block["file"], mmap_mode=mmap_mode)
+            if len(positions) < len(block["columns"]):
+                contiguous = positions[-1] - positions[0] + 1 == len(positions)
+                values = values[positions[0]:positions[-1] + 1] if contiguous else values[positions]
+            pieces.append(pd.DataFrame(values.T, index=index, columns=block_cols, copy=False))
+        else:
+            piece = _read_arrow(cache_dir / block["file"], columns=block_cols)
+            piece.index = index
+            pieces.append(piece)
+    dataf = pd.concat(pieces, axis=1, copy=False) if pieces else pd.DataFrame(index=index)
+    if columns is not None and list(dataf.columns) != list(columns):
+        dataf = dataf.loc[:, columns]
+    row_order = None
+    if original_order and meta.get("row_order_file") is not None:
+        # Stored row i is row row_order[i] of the original DataFrame.
+        row_order = np.load(cache_dir / meta["row_order_file"])
+        dataf = dataf.take(np.argsort(row_order))
+    dataf = NumerFrame.wrap(dataf)
+    group_of = {col: name for name, cols in meta["column_groups"].items() for col in cols}
+    if all(col in group_of for col in dataf.columns):
+        groups = AttrDict({name: [col for col in dataf.columns if group_of[col] == name]
+                           for name in NumerFrame._column_prefixes + ("aux",)})
+        groups.columns = dataf.columns
+        groups.group_of = group_of
+        object.__setattr__(dataf, "_column_groups", groups)
+    if meta["era_file"] is not None and dataf.meta.era_col == meta["era_col"]:
+        eras = _read_arrow(cache_dir / meta["era_file"])
+        stops = eras["stop"].values
+        era_index = AttrDict(eras=pd.Index(eras["era"]), order=np.arange(stops[-1] if len(stops) else 0),
+                             starts=eras["start"].values, stops=stops, counts=stops - eras["start"].values)
+        if original_order and row_order is not None:
+            era_index.order = row_order[:len(era_index.order)]
+        era_index.key = (dataf.meta.era_col, len(dataf), id(dataf.index))
+        object.__setattr__(dataf, "_era_index_cache", era_index)
+    return dataf
+
+def _write_arrow(table, path: Path):
+    import pyarrow as pa
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+def _read_arrow(path: Path, columns: list = None) -> pd.DataFrame:
+    import pyarrow as pa
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas()
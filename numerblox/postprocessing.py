@@ -2,15 +2,20 @@
 
 # %% auto 0
 __all__ = ['BasePostProcessor', 'Standardizer', 'MeanEnsembler', 'DonateWeightedEnsembler', 'GeometricMeanEnsembler',
-           'FeatureNeutralizer', 'FeaturePenalizer', 'AwesomePostProcessor']
+           'ExposureCache', 'FeatureNeutralizer', 'FeaturePenalizer', 'AwesomePostProcessor']
 
 # %% ../nbs/05_postprocessing.ipynb 5
+import re
 import scipy
+import hashlib
 import numpy as np
 import pandas as pd
 import scipy.stats as sp
 from tqdm.auto import tqdm
 from rich import print as rich_print
+from pathlib import Path
+from collections import OrderedDict
+from typing import Union, List, Callable, Optional
 from scipy.stats.mstats import gmean
 from sklearn.preprocessing import MinMaxScaler
 
@@ -50,7 +55,7 @@ class Standardizer(BasePostProcessor):
     def transform(self, dataf: NumerFrame) -> NumerFrame:
         cols = dataf.prediction_cols if not self.cols else self.cols
         dataf.loc[:, cols] = dataf.groupby(dataf.meta.era_col)[cols].rank(pct=True)
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
 # %% ../nbs/05_postprocessing.ipynb 20
 class MeanEnsembler(BasePostProcessor):
@@ -81,7 +86,7 @@ class MeanEnsembler(BasePostProcessor):
         rich_print(
             f":stew: Ensembled [blue]'{cols}'[blue] with simple mean and saved in [bold]'{self.final_col_name}'[bold] :stew:"
         )
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
 # %% ../nbs/05_postprocessing.ipynb 23
 class DonateWeightedEnsembler(BasePostProcessor):
@@ -111,7 +116,7 @@ class DonateWeightedEnsembler(BasePostProcessor):
         rich_print(
             f":stew: Ensembled [blue]'{cols}'[/blue] with [bold]{self.__class__.__name__}[/bold] and saved in [bold]'{self.final_col_name}'[bold] :stew:"
         )
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def _get_weights(self) -> list:
         """Exponential weights."""
@@ -143,100 +148,255 @@ class GeometricMeanEnsembler(BasePostProcessor):
         rich_print(
             f":stew: Ensembled [blue]'{cols}'[/blue] with [bold]{self.__class__.__name__}[/bold] and saved in [bold]'{self.final_col_name}'[bold] :stew:"
         )
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
 # %% ../nbs/05_postprocessing.ipynb 34
+class ExposureCache:
+    """
+    LRU cache for per era factorizations of feature exposure matrices.
+    Factorizations take about as much memory as the float64 feature values of an era,
+    so choose max_memory_mb large enough to hold all eras that are reused. Otherwise every era is evicted before it is needed again.
+
+    :param max_memory_mb: Memory budget in MB for factorizations kept in memory. \n
+    :param cache_dir: Optional directory where evicted factorizations are stored as .npy files.
+    Factorizations in this directory are reused by every cache that points to it.
+    """
+    def __init__(self, max_memory_mb: float = 1024, cache_dir: str = None):
+        self.max_bytes = int(max_memory_mb * 1024 ** 2)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._store = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(era, feature_names: list, exposures: np.ndarray) -> str:
+        """
+        Key based on era, feature set hash and a hash of the shape, dtype and all values of the exposure matrix.
+        :param era: Era label. \n
+        :param feature_names: Feature columns that make up the exposure matrix. \n
+        :param exposures: Feature values for the era.
+        """
+        feature_hash = hashlib.blake2b("\x1f".join(map(str, feature_names)).encode(), digest_size=8)
+        data_hash = hashlib.blake2b(f"{exposures.shape}{exposures.dtype}".encode(), digest_size=16)
+        data_hash.update(np.ascontiguousarray(exposures).data)
+        era = re.sub(r"[^\w\-]", "_", str(era))
+        return f"{era}_{feature_hash.hexdigest()}_{data_hash.hexdigest()}"
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """ Get factorization from memory or disk. Returns None if key is not cached. """
+        if key in self._store:
+            self._store.move_to_end(key)
+            self.hits += 1
+            return self._store[key]
+        if self.cache_dir and self._path(key).is_file():
+            value = np.load(self._path(key))
+            self.hits += 1
+            self.put(key, value)
+            return value
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: np.ndarray):
+        """ Store factorization in memory and evict least recently used entries if over budget. """
+        if key in self._store:
+            self.nbytes -= self._store.pop(key).nbytes
+        self._store[key] = value
+        self.nbytes += value.nbytes
+        while self.nbytes > self.max_bytes and self._store:
+            old_key, old_value = self._store.popitem(last=False)
+            self.nbytes -= old_value.nbytes
+            if self.cache_dir and not self._path(old_key).is_file():
+                np.save(self._path(old_key), old_value)
+
+    def get_or_compute(self, key: str, compute_func: Callable[[], np.ndarray]) -> np.ndarray:
+        """ Get factorization for key or compute and store it. """
+        value = self.get(key)
+        if value is None:
+            value = compute_func()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """ Remove all factorizations from memory. Spilled files in cache_dir are kept. """
+        self._store.clear()
+        self.nbytes = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npy"
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._store or bool(self.cache_dir and self._path(key).is_file())
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+# %% ../nbs/05_postprocessing.ipynb 37
 class FeatureNeutralizer(BasePostProcessor):
     """
     Classic feature neutralization by subtracting linear model.
 
+    The exposure matrix of every era is factorized once (SVD), after which all
+    prediction columns are neutralized with all proportions in one matrix product.
+
     :param feature_names: List of column names to neutralize against. Uses all feature columns by default. \n
-    :param pred_name: Prediction column to neutralize. \n
-    :param proportion: Number in range [0...1] indicating how much to neutralize. \n
+    :param pred_name: Prediction column or list of prediction columns to neutralize. \n
+    :param proportion: Number or list of numbers in range [0...1] indicating how much to neutralize. \n
+    A new column is created for every combination of pred_name and proportion. \n
     :param suffix: Optional suffix that is added to new column name. \n
     :param cuda: Do neutralization on the GPU \n
     Make sure you have CuPy installed when setting cuda to True. \n
-    Installation docs: docs.cupy.dev/en/stable/install.html
+    Installation docs: docs.cupy.dev/en/stable/install.html \n
+    :param cache: Optional ExposureCache to reuse per era factorizations across calls.
+    Pass the same cache to evaluators so a feature set is factorized only once per dataset.
     """
     def __init__(
         self,
         feature_names: list = None,
-        pred_name: str = "prediction",
-        proportion: float = 0.5,
+        pred_name: Union[str, List[str]] = "prediction",
+        proportion: Union[float, List[float]] = 0.5,
         suffix: str = None,
         cuda = False,
+        cache: "ExposureCache" = None,
     ):
         self.pred_name = pred_name
         self.proportion = proportion
-        assert (
-            0.0 <= proportion <= 1.0
-        ), f"'proportion' should be a float in range [0...1]. Got '{proportion}'."
-        self.new_col_name = (
-            f"{self.pred_name}_neutralized_{self.proportion}_{suffix}"
-            if suffix
-            else f"{self.pred_name}_neutralized_{self.proportion}"
-        )
+        self.pred_names = pred_name if isinstance(pred_name, list) else [pred_name]
+        self.proportions = proportion if isinstance(proportion, list) else [proportion]
+        for prop in self.proportions:
+            assert (
+                0.0 <= prop <= 1.0
+            ), f"'proportion' should be a float in range [0...1]. Got '{prop}'."
+        self.new_col_names = [
+            f"{pred}_neutralized_{prop}_{suffix}" if suffix else f"{pred}_neutralized_{prop}"
+            for pred in self.pred_names for prop in self.proportions
+        ]
+        self.new_col_name = self.new_col_names[0]
         super().__init__(final_col_name=self.new_col_name)
         self.feature_names = feature_names
         self.cuda = cuda
+        self.cache = cache
 
     @display_processor_info
     def transform(self, dataf: NumerFrame) -> NumerFrame:
         feature_names = self.feature_names if self.feature_names else dataf.feature_cols
-        neutralized_preds = dataf.groupby(dataf.meta.era_col).apply(
-            lambda x: self.normalize_and_neutralize(x, [self.pred_name], feature_names)
-        )
-        dataf.loc[:, self.new_col_name] = MinMaxScaler().fit_transform(
-            neutralized_preds
-        )
+        pred_values = dataf[self.pred_names].to_numpy()
+        neutralized_preds = np.full((len(dataf), len(self.new_col_names)), np.nan)
+        era_index = dataf.era_index
+        # Features are read in their stored dtype (e.g. int8) and upcast one era at a time.
+        for era, (rows, exposures) in zip(era_index.eras, dataf.iter_era_values(feature_names)):
+            float_exposures = exposures.astype(np.float64)
+            basis = None
+            if self.cache is not None:
+                key = self.cache.make_key(era=era, feature_names=feature_names, exposures=exposures)
+                basis = self.cache.get_or_compute(key, lambda: self._exposure_basis(float_exposures))
+            neutralized_preds[rows] = self.neutralize_era(
+                exposures=float_exposures,
+                scores=self.normalize_array(pred_values[rows]),
+                basis=basis,
+            )
+        dataf[self.new_col_names] = MinMaxScaler().fit_transform(neutralized_preds)
         rich_print(
-            f":robot: Neutralized [bold blue]'{self.pred_name}'[bold blue] with proportion [bold]'{self.proportion}'[/bold] :robot:"
+            f":robot: Neutralized [bold blue]'{self.pred_names}'[bold blue] with proportion(s) [bold]'{self.proportions}'[/bold] :robot:"
         )
         rich_print(
-            f"New neutralized column = [bold green]'{self.new_col_name}'[/bold green]."
+            f"New neutralized column(s) = [bold green]'{self.new_col_names}'[/bold green]."
         )
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
+
+    def neutralize_era(self, exposures: np.ndarray, scores: np.ndarray, basis: np.ndarray = None, xp=None) -> np.ndarray:
+        """
+        Neutralize all prediction columns with all proportions for one era.
+        The left singular vectors of the exposure matrix span the same space as
+        exposures @ pinv(exposures), so the linear model for all columns and
+        proportions is subtracted with one matrix product. \n
+        :param exposures: Feature values for one era. \n
+        :param scores: Normalized prediction values for one era. \n
+        :param basis: Precomputed basis from _exposure_basis. Computed from exposures if not given. \n
+        :param xp: Array module (NumPy or CuPy) to compute with. Follows `cuda` by default. \n
+        :return: Array with a column for every (pred_name, proportion) combination.
+        """
+        xp = self._array_module() if xp is None else xp
+        scores = xp.asarray(scores, dtype=xp.float64)
+        if basis is None:
+            basis = self._exposure_basis(xp.asarray(exposures), xp=xp)
+        basis = xp.asarray(basis)
+        projection = basis @ (basis.T @ scores)
+        proportions = xp.asarray(self.proportions, dtype=xp.float64)[:, None, None]
+        neutralized = scores[None] - proportions * projection[None]
+        neutralized /= neutralized.std(axis=1, ddof=1, keepdims=True)
+        # Order columns by prediction column first and proportion second.
+        neutralized = neutralized.transpose(1, 2, 0).reshape(len(scores), -1)
+        return neutralized if xp is np else xp.asnumpy(neutralized)
 
     def neutralize(self, dataf: pd.DataFrame, columns: list, by: list) -> pd.DataFrame:
         """ Neutralize on CPU. """
-        scores = dataf[columns]
-        exposures = dataf[by].values
-        scores = scores - self.proportion * exposures.dot(
-            np.linalg.pinv(exposures).dot(scores)
-        )
-        return scores / scores.std()
+        return self._neutralize_frame(dataf, dataf[columns].to_numpy(dtype=np.float64), columns, by, xp=np)
 
     def neutralize_cuda(self, dataf: pd.DataFrame, columns: list, by: list) -> np.ndarray:
         """ Neutralize on GPU. """
+        xp = self._array_module(cuda=True)
+        return self._neutralize_frame(dataf, dataf[columns].to_numpy(dtype=np.float64), columns, by, xp=xp).to_numpy()
+
+    def normalize_and_neutralize(self, dataf: pd.DataFrame, columns: list, by: list) -> pd.DataFrame:
+        """ Gaussianize and neutralize columns for one era. """
+        scores = self.normalize_array(dataf[columns].to_numpy())
+        return self._neutralize_frame(dataf, scores, columns, by, xp=self._array_module())
+
+    def _neutralize_frame(self, dataf: pd.DataFrame, scores: np.ndarray, columns: list, by: list, xp) -> pd.DataFrame:
+        """
+        Neutralize scores for the rows of dataf against columns `by` with neutralize_era.
+        Columns keep their names for a single proportion.
+        With several proportions a column is returned for every (column, proportion) combination.
+        """
+        exposures = xp.asarray(dataf[by].to_numpy(dtype=np.float64))
+        neutralized = self.neutralize_era(exposures, scores, basis=self._exposure_basis(exposures, xp=xp), xp=xp)
+        names = columns if len(self.proportions) == 1 else \
+            [f"{col}_neutralized_{prop}" for col in columns for prop in self.proportions]
+        return pd.DataFrame(neutralized, index=dataf.index, columns=names)
+
+    @staticmethod
+    def _exposure_basis(exposures, xp=np):
+        """
+        Orthonormal basis for the column space of the exposure matrix.
+        Uses the same singular value cutoff as np.linalg.pinv.
+        """
+        u, s, _ = xp.linalg.svd(exposures, full_matrices=False)
+        return u[:, s > 1e-15 * s.max(initial=0)]
+
+    def _array_module(self, cuda: bool = None):
+        """ NumPy for CPU or CuPy for GPU computations. Follows `cuda` of the processor by default. """
+        if not (self.cuda if cuda is None else cuda):
+            return np
         try:
             import cupy
         except ImportError:
             raise ImportError("CuPy not installed. Set cuda=False or install CuPy. Installation docs: docs.cupy.dev/en/stable/install.html")
-        scores = cupy.array(dataf[columns].values)
-        exposures = cupy.array(dataf[by].values)
-        scores = scores - self.proportion * exposures.dot(
-            cupy.linalg.pinv(exposures).dot(scores)
-        )
-        return cupy.asnumpy(scores / scores.std())
+        return cupy
+
+    @staticmethod
+    def normalize_array(scores: np.ndarray) -> np.ndarray:
+        """ Gaussianize 2D array column-wise. Equivalent to normalize for NumPy arrays. """
+        normalized_ranks = (sp.rankdata(scores, method="ordinal", axis=0) - 0.5) / len(scores)
+        return sp.norm.ppf(normalized_ranks)
 
     @staticmethod
     def normalize(dataf: pd.DataFrame) -> np.ndarray:
         normalized_ranks = (dataf.rank(method="first") - 0.5) / len(dataf)
         return sp.norm.ppf(normalized_ranks)
 
-    def normalize_and_neutralize(
-        self, dataf: pd.DataFrame, columns: list, by: list
-    ) -> pd.DataFrame:
-        dataf[columns] = self.normalize(dataf[columns])
-        neutralization_func = self.neutralize if not self.cuda else self.neutralize_cuda
-        dataf[columns] = neutralization_func(dataf, columns, by)
-        return dataf[columns]
-
-# %% ../nbs/05_postprocessing.ipynb 44
-import tensorflow as tf
+# %% ../nbs/05_postprocessing.ipynb 54
 class FeaturePenalizer(BasePostProcessor):
     """
-    Feature penalization with TensorFlow.
+    Feature penalization. Reduces the exposure of predictions to every feature to at most `max_exposure` per era.
+
+    The default NumPy backend solves the exposure-clipping problem per era with L-BFGS-B.
+    All exposures are computed from the feature Gram matrix, so each solver step costs O(n_features^2) independent of the number of rows.
+    The solution of the previous era is used as a warm start for the next era.
+
+    The original TensorFlow implementation is available with `backend="tensorflow"`. TensorFlow is only imported when this backend is used.
 
     Source (by jrb): https://github.com/jonrtaylor/twitch/blob/master/FE_Clipping_Script.ipynb
 
@@ -244,7 +404,10 @@ class FeaturePenalizer(BasePostProcessor):
 
     :param feature_names: List of column names to reduce feature exposure. Uses all feature columns by default. \n
     :param pred_name: Prediction column to neutralize. \n
-    :param max_exposure: Number in range [0...1] indicating how much to reduce max feature exposure to.
+    :param max_exposure: Number in range [0...1] indicating how much to reduce max feature exposure to. \n
+    :param backend: Solver to use. "numpy" (default) or "tensorflow". \n
+    :param max_iter: Maximum number of L-BFGS-B iterations per era (only used for NumPy backend). \n
+    :param warm_start: Initialize the solver for each era with the weights of the previous era (only used for NumPy backend).
     """
     def __init__(
         self,
@@ -252,12 +415,19 @@ class FeaturePenalizer(BasePostProcessor):
         feature_names: list = None,
         pred_name: str = "prediction",
         suffix: str = None,
+        backend: str = "numpy",
+        max_iter: int = 1000,
+        warm_start: bool = True,
     ):
         self.pred_name = pred_name
         self.max_exposure = max_exposure
         assert (
             0.0 <= max_exposure <= 1.0
         ), f"'max_exposure' should be a float in range [0...1]. Got '{max_exposure}'."
+        assert backend in (
+            "numpy",
+            "tensorflow",
+        ), f"'backend' should be 'numpy' or 'tensorflow'. Got '{backend}'."
         self.new_col_name = (
             f"{self.pred_name}_penalized_{self.max_exposure}_{suffix}"
             if suffix
@@ -266,6 +436,9 @@ class FeaturePenalizer(BasePostProcessor):
         super().__init__(final_col_name=self.new_col_name)
 
         self.feature_names = feature_names
+        self.backend = backend
+        self.max_iter = max_iter
+        self.warm_start = warm_start
 
     @display_processor_info
     def transform(self, dataf: NumerFrame) -> NumerFrame:
@@ -276,7 +449,7 @@ class FeaturePenalizer(BasePostProcessor):
             dataf=dataf, column=self.pred_name, neutralizers=feature_names
         )
         dataf.loc[:, self.new_col_name] = penalized_data[self.pred_name]
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
     def reduce_all_exposures(
         self,
@@ -288,48 +461,103 @@ class FeaturePenalizer(BasePostProcessor):
     ) -> pd.DataFrame:
         if neutralizers is None:
             neutralizers = [x for x in dataf.columns if x.startswith("feature")]
-        neutralized = []
+        # Eras are processed in sorted order so warm starts carry over between adjacent eras.
+        era_index = dataf.era_index
+        all_scores = dataf[column].to_numpy()
+        penalized = np.empty(len(dataf), dtype=np.float64)
 
-        for era in tqdm(dataf[dataf.meta.era_col].unique()):
-            dataf_era = dataf[dataf[dataf.meta.era_col] == era]
-            scores = dataf_era[[column]].values
-            exposure_values = dataf_era[neutralizers].values
+        weights = None
+        # Features are read in their stored dtype (e.g. int8) and upcast one era at a time.
+        for idx, exposure_values in tqdm(dataf.iter_era_values(neutralizers), total=len(era_index.eras)):
+            scores = all_scores[idx]
 
             if normalize:
-                scores2 = []
-                for x in scores.T:
-                    x = (scipy.stats.rankdata(x, method="ordinal") - 0.5) / len(x)
-                    if gaussianize:
-                        x = scipy.stats.norm.ppf(x)
-                    scores2.append(x)
-                scores = np.array(scores2)[0]
-
-            scores, weights = self._reduce_exposure(
-                scores, exposure_values, len(neutralizers), None
-            )
-
-            scores /= tf.math.reduce_std(scores)
-            scores -= tf.reduce_min(scores)
-            scores /= tf.reduce_max(scores)
-            neutralized.append(scores.numpy())
+                scores = (scipy.stats.rankdata(scores, method="ordinal") - 0.5) / len(scores)
+                if gaussianize:
+                    scores = scipy.stats.norm.ppf(scores)
+
+            if self.backend == "tensorflow":
+                scores, _ = self._reduce_exposure_tf(
+                    scores, exposure_values, len(neutralizers), None
+                )
+                scores = scores.numpy()[:, 0]
+            else:
+                scores, weights = self._reduce_exposure(
+                    scores, exposure_values, weights if self.warm_start else None
+                )
+
+            scores = scores / np.std(scores)
+            scores -= np.min(scores)
+            scores /= np.max(scores)
+            penalized[idx] = scores
+
+        predictions = pd.DataFrame(penalized, columns=[column], index=dataf.index)
+        return predictions
 
-        predictions = pd.DataFrame(
-            np.concatenate(neutralized), columns=[column], index=dataf.index
+    def _reduce_exposure(self, prediction: np.ndarray, features: np.ndarray, weights: np.ndarray = None):
+        """
+        Solve for linear weights w so that all feature exposures of (prediction - features @ w) are clipped to max_exposure.
+        :param prediction: Normalized predictions for one era of shape (n_rows,). \n
+        :param features: Feature values for one era of shape (n_rows, n_features). \n
+        :param weights: Optional initial guess for w (for example the solution of the previous era).
+        :return: Tuple of penalized predictions and the fitted weights.
+        """
+        feats = np.asarray(features, dtype=np.float64) - 0.5
+        pred = np.asarray(prediction, dtype=np.float64)
+        feats_centered = feats - feats.mean(axis=0)
+        pred_centered = pred - pred.mean()
+        # Sufficient statistics. Exposures of (pred - feats @ w) only depend on these.
+        gram = feats_centered.T @ feats_centered
+        cross = feats_centered.T @ pred_centered
+        pred_sq = pred_centered @ pred_centered
+        norms = np.sqrt(np.diag(gram))
+        # Constant features have no exposure.
+        norms[norms == 0] = np.inf
+
+        start_exps = cross / (norms * np.sqrt(pred_sq))
+        target_exps = np.clip(start_exps, -self.max_exposure, self.max_exposure)
+        lower, upper = np.minimum(target_exps, 0), np.maximum(target_exps, 0)
+
+        def excess(w):
+            residual = cross - gram @ w
+            res_sq = max(pred_sq - cross @ w - w @ residual, 1e-300)
+            exps = residual / (norms * np.sqrt(res_sq))
+            return np.maximum(exps - upper, 0) - np.maximum(lower - exps, 0), exps, residual, res_sq
+
+        def objective(w):
+            exc, exps, residual, res_sq = excess(w)
+            grad_exps = 2 * exc
+            grad = -(gram @ (grad_exps / norms)) / np.sqrt(res_sq) + (grad_exps @ exps) * residual / res_sq
+            return exc @ exc, grad
+
+        w0 = np.zeros(len(norms))
+        if np.abs(excess(w0)[0]).sum() < 1e-7:
+            return pred, w0
+        if weights is not None and objective(weights)[0] < objective(w0)[0]:
+            w0 = weights
+        result = scipy.optimize.minimize(
+            objective,
+            w0,
+            jac=True,
+            method="L-BFGS-B",
+            options={"maxiter": self.max_iter, "ftol": 1e-15, "gtol": 1e-12},
         )
-        return predictions
+        return pred - feats @ result.x, result.x
+
+    def _reduce_exposure_tf(self, prediction, features, input_size=50, weights=None):
+        import tensorflow as tf
 
-    def _reduce_exposure(self, prediction, features, input_size=50, weights=None):
         model = tf.keras.models.Sequential(
             [
-                tf.keras.layers.Input(input_size),
-                tf.keras.experimental.LinearModel(use_bias=False),
+                tf.keras.layers.Input((input_size,)),
+                tf.keras.layers.Dense(1, use_bias=False, kernel_initializer="zeros"),
             ]
         )
         feats = tf.convert_to_tensor(features - 0.5, dtype=tf.float32)
         pred = tf.convert_to_tensor(prediction, dtype=tf.float32)
         if weights is None:
             optimizer = tf.keras.optimizers.Adamax()
-            start_exp = self.__exposures(feats, pred[:, None])
+            start_exp = self._tf_functions()["exposures"](feats, pred[:, None])
             target_exps = tf.clip_by_value(
                 start_exp, -self.max_exposure, self.max_exposure
             )
@@ -339,32 +567,40 @@ class FeaturePenalizer(BasePostProcessor):
         return pred[:, None] - model(feats), model.get_weights()
 
     def _train_loop(self, model, optimizer, feats, pred, target_exps):
+        train_loop_body = self._tf_functions()["train_loop_body"]
         for i in range(1000000):
-            loss, grads = self.__train_loop_body(model, feats, pred, target_exps)
+            loss, grads = train_loop_body(model, feats, pred, target_exps)
             optimizer.apply_gradients(zip(grads, model.trainable_variables))
             if loss < 1e-7:
                 break
 
-    @tf.function(experimental_relax_shapes=True)
-    def __train_loop_body(self, model, feats, pred, target_exps):
-        with tf.GradientTape() as tape:
-            exps = self.__exposures(feats, pred[:, None] - model(feats, training=True))
-            loss = tf.reduce_sum(
-                tf.nn.relu(tf.nn.relu(exps) - tf.nn.relu(target_exps))
-                + tf.nn.relu(tf.nn.relu(-exps) - tf.nn.relu(-target_exps))
-            )
-        return loss, tape.gradient(loss, model.trainable_variables)
-
-    @staticmethod
-    @tf.function(experimental_relax_shapes=True, experimental_compile=True)
-    def __exposures(x, y):
-        x = x - tf.math.reduce_mean(x, axis=0)
-        x = x / tf.norm(x, axis=0)
-        y = y - tf.math.reduce_mean(y, axis=0)
-        y = y / tf.norm(y, axis=0)
-        return tf.matmul(x, y, transpose_a=True)
-
-# %% ../nbs/05_postprocessing.ipynb 54
+    def _tf_functions(self) -> dict:
+        """ Build compiled TensorFlow functions on first use so TensorFlow is only imported for the TensorFlow backend. """
+        if getattr(self, "_tf_funcs", None) is None:
+            import tensorflow as tf
+
+            @tf.function(reduce_retracing=True, jit_compile=True)
+            def exposures(x, y):
+                x = x - tf.math.reduce_mean(x, axis=0)
+                x = x / tf.norm(x, axis=0)
+                y = y - tf.math.reduce_mean(y, axis=0)
+                y = y / tf.norm(y, axis=0)
+                return tf.matmul(x, y, transpose_a=True)
+
+            @tf.function(reduce_retracing=True)
+            def train_loop_body(model, feats, pred, target_exps):
+                with tf.GradientTape() as tape:
+                    exps = exposures(feats, pred[:, None] - model(feats, training=True))
+                    loss = tf.reduce_sum(
+                        tf.nn.relu(tf.nn.relu(exps) - tf.nn.relu(target_exps))
+                        + tf.nn.relu(tf.nn.relu(-exps) - tf.nn.relu(-target_exps))
+                    )
+                return loss, tape.gradient(loss, model.trainable_variables)
+
+            self._tf_funcs = {"exposures": exposures, "train_loop_body": train_loop_body}
+        return self._tf_funcs
+
+# %% ../nbs/05_postprocessing.ipynb 65
 class AwesomePostProcessor(BasePostProcessor):
     """
     TEMPLATE - Do some awesome postprocessing.
@@ -383,4 +619,4 @@ class AwesomePostProcessor(BasePostProcessor):
         dataf.loc[:, self.final_col_name] = ...
         ...
         # Parse all contents to the next pipeline step
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
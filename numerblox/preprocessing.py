@@ -3,31 +3,45 @@
 # %% auto 0
 __all__ = ['BaseProcessor', 'display_processor_info', 'CopyPreProcessor', 'FeatureSelectionPreProcessor',
            'TargetSelectionPreProcessor', 'ReduceMemoryProcessor', 'UMAPFeatureGenerator', 'BayesianGMMTargetProcessor',
-           'KatsuFeatureGenerator', 'EraQuantileProcessor', 'TickerMapper', 'SignalsTargetProcessor', 'LagPreProcessor',
-           'DifferencePreProcessor', 'PandasTaFeatureGenerator', 'AwesomePreProcessor']
+           'TickerPanelPool', 'KatsuFeatureGenerator', 'EraQuantileProcessor', 'TickerMapper', 'SignalsTargetProcessor',
+           'LagPreProcessor', 'DifferencePreProcessor', 'PandasTaFeatureGenerator', 'AwesomePreProcessor']
 
 # %% ../nbs/03_preprocessing.ipynb 4
 import os
+import re
+import joblib
 import time
+import weakref
 import warnings
 import numpy as np
 import pandas as pd
 import datetime as dt
-from umap import UMAP
-import pandas_ta as ta
 from tqdm.auto import tqdm
-from functools import wraps
+from functools import wraps, partial
 from scipy.stats import rankdata
+from scipy.signal import lfilter
 from abc import ABC, abstractmethod
 from rich import print as rich_print
 from typing import Union, Tuple, List
 from multiprocessing.pool import Pool
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
 from sklearn.linear_model import Ridge
 from sklearn.mixture import BayesianGaussianMixture
 from sklearn.preprocessing import QuantileTransformer, MinMaxScaler
 
 from .numerframe import NumerFrame, create_numerframe
 
+# Block level fast paths build pandas blocks directly so data is not copied or consolidated again.
+# They rely on pandas internals and are only used on the pandas versions they are tested with.
+# Other versions go through public pandas APIs.
+def _has_pandas_block_api(version: str) -> bool:
+    """ Whether the block level fast paths are tested with this pandas version (1.3 up to, but not including, 3.0). """
+    major, minor = (int(part) for part in re.match(r"(\d+)\.(\d+)", version).groups())
+    return (1, 3) <= (major, minor) < (3, 0)
+
+_PANDAS_BLOCK_API = _has_pandas_block_api(pd.__version__)
+
 # %% ../nbs/03_preprocessing.ipynb 9
 class BaseProcessor(ABC):
     """Common functionality for preprocessors and postprocessors."""
@@ -93,7 +107,7 @@ class FeatureSelectionPreProcessor(BaseProcessor):
             + dataf.aux_cols
         )
         dataf = dataf.loc[:, keep_cols]
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
 # %% ../nbs/03_preprocessing.ipynb 26
 class TargetSelectionPreProcessor(BaseProcessor):
@@ -114,33 +128,83 @@ class TargetSelectionPreProcessor(BaseProcessor):
             + dataf.aux_cols
         )
         dataf = dataf.loc[:, keep_cols]
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
 # %% ../nbs/03_preprocessing.ipynb 29
+def _frame_from_blocks(blocks: tuple, axes: list) -> pd.DataFrame:
+    """ DataFrame from pandas blocks without copying or consolidating. Only use if `_PANDAS_BLOCK_API`. """
+    from pandas.core.internals import BlockManager
+    mgr = BlockManager(tuple(blocks), axes)
+    if hasattr(pd.DataFrame, "_from_mgr"):
+        # Passing a BlockManager to the DataFrame constructor is deprecated from pandas 2.1.
+        return pd.DataFrame._from_mgr(mgr, axes=mgr.axes)
+    return pd.DataFrame(mgr)
+
+
 class ReduceMemoryProcessor(BaseProcessor):
     """
     Reduce memory usage as much as possible.
 
+    Numeric columns are processed per dtype block. Minimum and maximum values of all columns in a block
+    are computed in one NumPy reduction, after which the smallest dtype is chosen for every column and
+    all columns with the same new dtype are written to one consolidated array.
+    On pandas versions without a tested block API, columns are grouped by dtype and cast with `DataFrame.astype`.
+
     Credits to kainsama and others for writing about memory usage reduction for Numerai data:
     https://forum.numer.ai/t/reducing-memory/313
 
     :param deep_mem_inspect: Introspect the data deeply by interrogating object dtypes.
-    Yields a more accurate representation of memory usage if you have complex object columns.
+    Yields a more accurate representation of memory usage if you have complex object columns. \n
+    :param float_mode: How float columns are downcast. \n
+    'range': Smallest float dtype for which the range of values fits (float16 for most Numerai data). \n
+    'safe': Never picks float16 when values would lose resolution. Columns that are not exactly
+    representable in float16 are cast to float32 instead. \n
+    :param dry_run: Only report projected memory savings without modifying data.
+    The report is printed and stored in the `report` attribute.
     """
 
-    def __init__(self, deep_mem_inspect=False):
+    def __init__(self, deep_mem_inspect=False, float_mode: str = "range", dry_run: bool = False):
         super().__init__()
+        assert float_mode in ["range", "safe"], f"float_mode should be 'range' or 'safe'. Got '{float_mode}'."
         self.deep_mem_inspect = deep_mem_inspect
+        self.float_mode = float_mode
+        self.dry_run = dry_run
+        self.report = None
 
     @display_processor_info
     def transform(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
+        if self.dry_run:
+            self.report = self.memory_report(dataf)
+            rich_print(self.report)
+            return NumerFrame.wrap(dataf)
         dataf = self._reduce_mem_usage(dataf)
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
+
+    def memory_report(self, dataf: pd.DataFrame) -> pd.DataFrame:
+        """
+        Projected memory savings without modifying data.
+        :return: DataFrame with number of columns, current and projected memory usage in MB
+        for every combination of current and new dtype.
+        """
+        rows = []
+        for values, _, new_dtypes in self._numeric_groups(dataf):
+            for new_dtype in new_dtypes:
+                rows.append({"dtype": str(values.dtype), "new_dtype": str(new_dtype),
+                             "memory_mb": len(dataf) * values.dtype.itemsize / 1024**2,
+                             "new_memory_mb": len(dataf) * new_dtype.itemsize / 1024**2})
+        report = pd.DataFrame(rows, columns=["dtype", "new_dtype", "memory_mb", "new_memory_mb"])
+        report = report.groupby(["dtype", "new_dtype"]).agg(n_columns=("memory_mb", "size"),
+                                                            memory_mb=("memory_mb", "sum"),
+                                                            new_memory_mb=("new_memory_mb", "sum"))
+        report.loc[("total", ""), :] = report.sum()
+        report["n_columns"] = report["n_columns"].astype(int)
+        report["saved_pct"] = (100 * (1 - report["new_memory_mb"] / report["memory_mb"])).round(2)
+        return report
 
     def _reduce_mem_usage(self, dataf: pd.DataFrame) -> pd.DataFrame:
         """
-        Iterate through all columns and modify the numeric column types
-        to reduce memory usage.
+        Downcast numeric columns per dtype block and rebuild the DataFrame
+        with one consolidated array per new dtype.
         """
         start_memory_usage = (
             dataf.memory_usage(deep=self.deep_mem_inspect).sum() / 1024**2
@@ -148,49 +212,16 @@ class ReduceMemoryProcessor(BaseProcessor):
         rich_print(
             f"Memory usage of DataFrame is [bold]{round(start_memory_usage, 2)} MB[/bold]"
         )
-
-        for col in dataf.columns:
-            col_type = dataf[col].dtype.name
-
-            if col_type not in [
-                "object",
-                "category",
-                "datetime64[ns, UTC]",
-                "datetime64[ns]",
-            ]:
-                c_min = dataf[col].min()
-                c_max = dataf[col].max()
-                if str(col_type)[:3] == "int":
-                    if c_min > np.iinfo(np.int8).min and c_max < np.iinfo(np.int8).max:
-                        dataf[col] = dataf[col].astype(np.int16)
-                    elif (
-                        c_min > np.iinfo(np.int16).min
-                        and c_max < np.iinfo(np.int16).max
-                    ):
-                        dataf[col] = dataf[col].astype(np.int16)
-                    elif (
-                        c_min > np.iinfo(np.int32).min
-                        and c_max < np.iinfo(np.int32).max
-                    ):
-                        dataf[col] = dataf[col].astype(np.int32)
-                    elif (
-                        c_min > np.iinfo(np.int64).min
-                        and c_max < np.iinfo(np.int64).max
-                    ):
-                        dataf[col] = dataf[col].astype(np.int64)
-                else:
-                    if (
-                        c_min > np.finfo(np.float16).min
-                        and c_max < np.finfo(np.float16).max
-                    ):
-                        dataf[col] = dataf[col].astype(np.float16)
-                    elif (
-                        c_min > np.finfo(np.float32).min
-                        and c_max < np.finfo(np.float32).max
-                    ):
-                        dataf[col] = dataf[col].astype(np.float32)
-                    else:
-                        dataf[col] = dataf[col].astype(np.float64)
+        groups = self._numeric_groups(dataf)
+        meta = getattr(dataf, "meta", None)
+        if _PANDAS_BLOCK_API:
+            dataf = self._rebuild_blocks(dataf, groups)
+        else:
+            dataf = dataf.astype({dataf.columns[position]: new_dtype for _, positions, new_dtypes in groups
+                                  for position, new_dtype in zip(positions, new_dtypes)})
+        dataf = NumerFrame.wrap(dataf)
+        if meta is not None:
+            dataf.meta = meta
 
         end_memory_usage = (
             dataf.memory_usage(deep=self.deep_mem_inspect).sum() / 1024**2
@@ -203,16 +234,108 @@ class ReduceMemoryProcessor(BaseProcessor):
         )
         return dataf
 
-# %% ../nbs/03_preprocessing.ipynb 34
+    @staticmethod
+    def _rebuild_blocks(dataf: pd.DataFrame, groups: list) -> pd.DataFrame:
+        """ Keep non numeric blocks and write all columns with the same new dtype to one block. """
+        from pandas.core.internals.api import make_block
+        reduced = {id(values) for values, _, _ in groups}
+        new_blocks = [block for block in dataf._mgr.blocks if id(block.values) not in reduced]
+        # Gather (values, rows, placement) parts for every new dtype.
+        parts = {}
+        for block_values, positions, new_dtypes in groups:
+            for dtype in set(new_dtypes):
+                rows = np.flatnonzero(np.array([d == dtype for d in new_dtypes]))
+                parts.setdefault(dtype, []).append((block_values, rows, positions[rows]))
+        for dtype, dtype_parts in parts.items():
+            n_cols = sum(len(rows) for _, rows, _ in dtype_parts)
+            values = np.empty((n_cols, len(dataf)), dtype=dtype)
+            offset = 0
+            for block_values, rows, _ in dtype_parts:
+                values[offset:offset + len(rows)] = block_values[rows]
+                offset += len(rows)
+            placement = np.concatenate([locs for _, _, locs in dtype_parts])
+            new_blocks.append(make_block(values, placement=placement))
+        return _frame_from_blocks(new_blocks, dataf._mgr.axes)
+
+    def _numeric_groups(self, dataf: pd.DataFrame) -> List[Tuple[np.ndarray, np.ndarray, List[np.dtype]]]:
+        """
+        (values, column positions, new dtypes) for every group of numeric NumPy columns with the same dtype.
+        Values are (columns x rows). With the pandas block API groups are the blocks of dataf, so values are not copied.
+        """
+        if _PANDAS_BLOCK_API:
+            groups = [(block.values, block.mgr_locs.as_array) for block in dataf._mgr.blocks]
+        else:
+            dtypes = dataf.dtypes.to_numpy()
+            groups = [(dataf.iloc[:, positions].to_numpy().T, positions)
+                      for positions in (np.flatnonzero(dtypes == dtype) for dtype in dict.fromkeys(dtypes))
+                      if isinstance(dtypes[positions[0]], np.dtype)]
+        numeric_groups = []
+        for values, positions in groups:
+            if not isinstance(values, np.ndarray) or values.dtype.kind not in "iuf" or values.shape[1] == 0:
+                continue
+            if values.dtype.kind == "f":
+                new_dtypes = self._float_dtypes(values)
+            else:
+                new_dtypes = self._int_dtypes(values)
+            numeric_groups.append((values, positions, new_dtypes))
+        return numeric_groups
+
+    @staticmethod
+    def _int_dtypes(values: np.ndarray) -> List[np.dtype]:
+        """ Smallest integer dtype (with the same signedness) that holds the values of every column. """
+        mins, maxs = values.min(axis=1), values.max(axis=1)
+        candidates = [np.uint8, np.uint16, np.uint32, np.uint64] if values.dtype.kind == "u" else [np.int8, np.int16, np.int32, np.int64]
+        new_dtypes = []
+        for c_min, c_max in zip(mins, maxs):
+            new_dtype = next(dtype for dtype in candidates
+                             if np.iinfo(dtype).min <= c_min and c_max <= np.iinfo(dtype).max)
+            new_dtypes.append(np.dtype(new_dtype))
+        return new_dtypes
+
+    def _float_dtypes(self, values: np.ndarray, chunk_size: int = 256) -> List[np.dtype]:
+        """ Smallest float dtype for every column according to float_mode. """
+        with warnings.catch_warnings():
+            # All NaN columns
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            mins, maxs = np.nanmin(values, axis=1), np.nanmax(values, axis=1)
+        fits16 = np.isnan(mins) | ((mins >= np.finfo(np.float16).min) & (maxs <= np.finfo(np.float16).max))
+        fits32 = np.isnan(mins) | ((mins >= np.finfo(np.float32).min) & (maxs <= np.finfo(np.float32).max))
+        if self.float_mode == "safe":
+            exact16 = np.zeros(len(values), dtype=bool)
+            # Column chunks keep temporary arrays small.
+            for start in range(0, len(values), chunk_size):
+                chunk = values[start:start + chunk_size]
+                with np.errstate(over="ignore"):
+                    exact16[start:start + chunk_size] = ((chunk.astype(np.float16) == chunk) | np.isnan(chunk)).all(axis=1)
+            fits16 &= exact16
+        itemsize = values.dtype.itemsize
+        return [np.dtype(np.float16) if f16 and itemsize > 2 else
+                np.dtype(np.float32) if f32 and itemsize > 4 else values.dtype
+                for f16, f32 in zip(fits16, fits32)]
+
+
+# %% ../nbs/03_preprocessing.ipynb 36
 class UMAPFeatureGenerator(BaseProcessor):
     """
     Generate new Numerai features using UMAP. Uses umap-learn under the hood: \n
     https://pypi.org/project/umap-learn/
+
+    UMAP and the MinMaxScaler for its output are fitted once on a stratified subsample of rows per era.
+    `transform` embeds new data in batches with the fitted model. \n
+    If the generator is not fitted yet, `transform` first fits it on the given data.
+    When it is fitted on all rows, the embedding from `fit_transform` is used instead of embedding the same rows again.
+
     :param n_components: How many new features to generate.
     :param n_neighbors: Number of neighboring points used in local approximations of manifold structure.
     :param min_dist: How tightly the embedding is allows to compress points together.
     :param metric: Metric to measure distance in input space. Correlation by default.
     :param feature_names: Selection of features used to perform UMAP on. All features by default.
+    :param rows_per_era: Maximum number of rows sampled from every era for fitting. All rows by default. \n
+    :param model_path: File to save the fitted UMAP model and scaler to (.joblib).
+    Loaded on initialization if the file already exists. \n
+    :param batch_size: Number of rows embedded at once in `transform`. \n
+    :param num_cores: Number of threads for `transform`. Single threaded by default. \n
+    :param random_state: Seed for sampling rows per era.
     *args, **kwargs will be passed to initialization of UMAP.
     """
 
@@ -223,6 +346,11 @@ class UMAPFeatureGenerator(BaseProcessor):
         min_dist: float = 0.0,
         metric: str = "correlation",
         feature_names: list = None,
+        rows_per_era: int = None,
+        model_path: str = None,
+        batch_size: int = 50_000,
+        num_cores: int = 1,
+        random_state: int = None,
         *args,
         **kwargs,
     ):
@@ -232,6 +360,12 @@ class UMAPFeatureGenerator(BaseProcessor):
         self.min_dist = min_dist
         self.feature_names = feature_names
         self.metric = metric
+        self.rows_per_era = rows_per_era
+        self.model_path = model_path
+        self.batch_size = batch_size
+        self.num_cores = num_cores
+        self.random_state = random_state
+        from umap import UMAP
         self.umap = UMAP(
             n_components=self.n_components,
             n_neighbors=self.n_neighbors,
@@ -240,25 +374,126 @@ class UMAPFeatureGenerator(BaseProcessor):
             *args,
             **kwargs,
         )
+        self.scaler = MinMaxScaler()
+        self.fitted_feature_names = None
+        if self.model_path and os.path.exists(self.model_path):
+            self.load(self.model_path)
 
-    def transform(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
+    @property
+    def is_fitted(self) -> bool:
+        return self.fitted_feature_names is not None
+
+    @property
+    def umap_feature_names(self) -> List[str]:
+        return [f"feature_umap_{i}" for i in range(self.n_components)]
+
+    def fit(self, dataf: NumerFrame, *args, **kwargs) -> "UMAPFeatureGenerator":
+        """
+        Fit UMAP and MinMaxScaler on a stratified subsample of every era.
+        Saves the fitted models to `model_path` if given.
+        """
+        self._fit(dataf)
+        return self
+
+    def _fit(self, dataf: NumerFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """ Fit on sampled rows. :return: Sampled row positions and their UMAP embedding. """
         feature_names = self.feature_names if self.feature_names else dataf.feature_cols
-        new_feature_data = self.umap.fit_transform(dataf[feature_names])
-        umap_feature_names = [f"feature_umap_{i}" for i in range(self.n_components)]
-        norm_new_feature_data = MinMaxScaler().fit_transform(new_feature_data)
-        dataf.loc[:, umap_feature_names] = norm_new_feature_data
-        return NumerFrame(dataf)
+        positions = self._sample_positions(dataf)
+        # Select rows first so only the sampled rows are copied.
+        sample = dataf.take(positions)[feature_names].to_numpy()
+        embedding = self.umap.fit_transform(sample)
+        self.scaler.fit(embedding)
+        self.fitted_feature_names = list(feature_names)
+        if self.model_path:
+            self.save(self.model_path)
+        return positions, embedding
 
-# %% ../nbs/03_preprocessing.ipynb 42
+    def transform(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
+        new_feature_data = None
+        if not self.is_fitted:
+            positions, embedding = self._fit(dataf)
+            if len(positions) == len(dataf):
+                new_feature_data = embedding
+        if new_feature_data is None:
+            new_feature_data = np.empty((len(dataf), self.n_components), dtype=np.float32)
+            for start, embedding in self._embed_batches(dataf):
+                new_feature_data[start:start + len(embedding)] = embedding
+        norm_new_feature_data = self.scaler.transform(new_feature_data)
+        dataf.loc[:, self.umap_feature_names] = norm_new_feature_data
+        return NumerFrame.wrap(dataf)
+
+    def save(self, path: str):
+        """ Persist fitted UMAP model, MinMaxScaler and used features with joblib. """
+        joblib.dump({"umap": self.umap, "scaler": self.scaler,
+                     "feature_names": self.fitted_feature_names}, path)
+
+    def load(self, path: str) -> "UMAPFeatureGenerator":
+        """ Load UMAP model, MinMaxScaler and used features saved with `save`. """
+        fitted = joblib.load(path)
+        self.umap, self.scaler = fitted["umap"], fitted["scaler"]
+        self.fitted_feature_names = fitted["feature_names"]
+        return self
+
+    def _sample_positions(self, dataf: NumerFrame) -> np.ndarray:
+        """ Sorted row positions of at most `rows_per_era` random rows of every era. """
+        if not self.rows_per_era:
+            return np.arange(len(dataf))
+        rng = np.random.default_rng(self.random_state)
+        era_index = dataf.era_index
+        positions = [rng.choice(era_index.order[start:stop], size=min(stop - start, self.rows_per_era), replace=False)
+                     for start, stop in zip(era_index.starts, era_index.stops)]
+        return np.sort(np.concatenate(positions))
+
+    def _batches(self, dataf: NumerFrame):
+        """ Copy features of one batch of rows at a time. The feature columns are never copied as a whole. """
+        for start in range(0, len(dataf), self.batch_size):
+            yield start, dataf.iloc[start:start + self.batch_size][self.fitted_feature_names].to_numpy()
+
+    def _embed_batches(self, dataf: NumerFrame):
+        """
+        Yield (start row, embedding) for all batches.
+        The first batch is embedded right away, which also prepares the nearest neighbor search index of UMAP.
+        With multiple cores the other batches are embedded by a thread pool (UMAP's numba kernels release the GIL)
+        and at most two batches per thread are in flight. After the search index is prepared, `UMAP.transform`
+        only reads the fitted model and seeds its optimization with `transform_seed`,
+        so batches give the same embedding for any number of threads.
+        """
+        batches = self._batches(dataf)
+        first = next(batches, None)
+        if first is not None:
+            yield first[0], self.umap.transform(first[1])
+        if self.num_cores <= 1:
+            for start, values in batches:
+                yield start, self.umap.transform(values)
+            return
+        with ThreadPoolExecutor(max_workers=self.num_cores) as executor:
+            pending = []
+            for start, values in batches:
+                pending.append((start, executor.submit(self.umap.transform, values)))
+                if len(pending) >= 2 * self.num_cores:
+                    start, future = pending.pop(0)
+                    yield start, future.result()
+            for start, future in pending:
+                yield start, future.result()
+
+
+# %% ../nbs/03_preprocessing.ipynb 46
 class BayesianGMMTargetProcessor(BaseProcessor):
     """
     Generate synthetic (fake) target using a Bayesian Gaussian Mixture model. \n
     Based on Michael Oliver's GitHub Gist implementation: \n
     https://gist.github.com/the-moliver/dcdd2862dc2c78dda600f1b449071c93
 
+    Per era ridge coefficients are solved in one batch from Gram matrices (XᵀX and Xᵀy)
+    that are accumulated in a single pass over the era sorted data. \n
+
     :param target_col: Column from which to create fake target. \n
     :param feature_names: Selection of features used for Bayesian GMM. All features by default.
-    :param n_components: Number of components for fitting Bayesian Gaussian Mixture Model.
+    :param n_components: Number of components for fitting Bayesian Gaussian Mixture Model. \n
+    :param n_targets: Number of fake targets to generate from the same coefficients.
+    The first is named "{target_col}_fake" and the others "{target_col}_fake_{i}". \n
+    :param num_cores: Number of threads that process eras in parallel. Single threaded by default. \n
+    :param alpha: Ridge regularization strength.
     """
 
     def __init__(
@@ -266,36 +501,64 @@ class BayesianGMMTargetProcessor(BaseProcessor):
         target_col: str = "target",
         feature_names: list = None,
         n_components: int = 6,
+        n_targets: int = 1,
+        num_cores: int = 1,
+        alpha: float = 1.0,
     ):
         super().__init__()
         self.target_col = target_col
         self.feature_names = feature_names
         self.n_components = n_components
-        self.ridge = Ridge(fit_intercept=False)
+        self.n_targets = n_targets
+        self.num_cores = num_cores
+        self.alpha = alpha
         self.bins = [0, 0.05, 0.25, 0.75, 0.95, 1]
 
     @display_processor_info
     def transform(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
-        all_eras = dataf[dataf.meta.era_col].unique()
-        coefs = self._get_coefs(dataf=dataf, all_eras=all_eras)
+        feature_names = self.feature_names if self.feature_names else dataf.feature_cols
+        era_index = dataf.era_index
+        grams, moments = self._get_gram_matrices(dataf=dataf, feature_names=feature_names, era_index=era_index)
+        coefs = self._solve_coefs(grams=grams, moments=moments)
         bgmm = self._fit_bgmm(coefs=coefs)
-        fake_target = self._generate_target(dataf=dataf, bgmm=bgmm, all_eras=all_eras)
-        dataf[f"{self.target_col}_fake"] = fake_target
-        return NumerFrame(dataf)
-
-    def _get_coefs(self, dataf: NumerFrame, all_eras: list) -> np.ndarray:
+        fake_targets = self._generate_targets(dataf=dataf, feature_names=feature_names,
+                                              bgmm=bgmm, era_index=era_index)
+        for name, fake_target in zip(self.fake_target_names, fake_targets):
+            dataf[name] = fake_target
+        return NumerFrame.wrap(dataf)
+
+    @property
+    def fake_target_names(self) -> List[str]:
+        """ Names of generated fake target columns. """
+        return [f"{self.target_col}_fake"] + [f"{self.target_col}_fake_{i}" for i in range(1, self.n_targets)]
+
+    def _get_gram_matrices(self, dataf: NumerFrame, feature_names: list, era_index) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Generate coefficients for BGMM.
+        Accumulate XᵀX (eras x features x features) and Xᵀy (eras x features)
+        of centered features and target in one pass over the era sorted data.
         Data should already be scaled between 0 and 1
         (Already done with Numerai Classic data)
         """
-        coefs = []
-        for era in all_eras:
-            features, target = self.__get_features_target(dataf=dataf, era=era)
-            self.ridge.fit(features, target)
-            coefs.append(self.ridge.coef_)
-        stacked_coefs = np.vstack(coefs)
-        return stacked_coefs
+        n_eras, n_features = len(era_index.eras), len(feature_names)
+        grams = np.empty((n_eras, n_features, n_features))
+        moments = np.empty((n_eras, n_features))
+
+        def accumulate(i: int, positions: np.ndarray, values: np.ndarray):
+            values = values.astype(np.float64) - 0.5
+            features, target = values[:, :-1], values[:, -1]
+            grams[i] = features.T @ features
+            moments[i] = features.T @ target
+
+        self._map_eras(accumulate, dataf.iter_era_values(feature_names + [self.target_col], era_index))
+        return grams, moments
+
+    def _solve_coefs(self, grams: np.ndarray, moments: np.ndarray) -> np.ndarray:
+        """
+        Solve ridge regression without intercept for all eras at once.
+        Equivalent to fitting sklearn's Ridge(fit_intercept=False) on every era.
+        """
+        regularization = self.alpha * np.eye(grams.shape[-1])
+        return np.linalg.solve(grams + regularization, moments[..., None])[..., 0]
 
     def _fit_bgmm(self, coefs: np.ndarray) -> BayesianGaussianMixture:
         """
@@ -307,32 +570,395 @@ class BayesianGMMTargetProcessor(BaseProcessor):
         bgmm.weights_[:] = 1 / self.n_components
         return bgmm
 
-    def _generate_target(
-        self, dataf: NumerFrame, bgmm: BayesianGaussianMixture, all_eras: list
-    ) -> np.ndarray:
-        """Generate fake target using Bayesian Gaussian Mixture model."""
-        fake_target = []
-        for era in tqdm(all_eras, desc="Generating fake target"):
-            features, _ = self.__get_features_target(dataf=dataf, era=era)
-            # Sample a set of weights from GMM
-            beta, _ = bgmm.sample(1)
-            # Create fake continuous target
-            fake_targ = features @ beta[0]
-            # Bin fake target like real target
-            fake_targ = (rankdata(fake_targ) - 0.5) / len(fake_targ)
-            fake_targ = (np.digitize(fake_targ, self.bins) - 1) / 4
-            fake_target.append(fake_targ)
-        return np.concatenate(fake_target)
-
-    def __get_features_target(self, dataf: NumerFrame, era) -> tuple:
-        """Get features and target for one era and center data."""
-        sub_df = dataf[dataf[dataf.meta.era_col] == era]
-        features = self.feature_names if self.feature_names else sub_df.feature_cols
-        target = sub_df[self.target_col].values - 0.5
-        features = sub_df[features].values - 0.5
-        return features, target
-
-# %% ../nbs/03_preprocessing.ipynb 45
+    def _sample_betas(self, bgmm: BayesianGaussianMixture, n_eras: int) -> np.ndarray:
+        """
+        Sample weights for every era and fake target (eras x features x targets).
+        BayesianGaussianMixture.sample returns samples grouped by component, so they are shuffled over eras.
+        """
+        betas, _ = bgmm.sample(n_eras * self.n_targets)
+        betas = betas[np.random.permutation(len(betas))]
+        return betas.reshape(self.n_targets, n_eras, -1).transpose(1, 2, 0)
+
+    def _generate_targets(self, dataf: NumerFrame, feature_names: list,
+                          bgmm: BayesianGaussianMixture, era_index) -> np.ndarray:
+        """Generate fake targets (targets x rows) using Bayesian Gaussian Mixture model."""
+        betas = self._sample_betas(bgmm=bgmm, n_eras=len(era_index.eras))
+        fake_targets = np.full((self.n_targets, len(dataf)), np.nan)
+
+        def generate(i: int, positions: np.ndarray, values: np.ndarray):
+            # Create fake continuous targets for all samples of weights at once
+            fake_targ = (values.astype(np.float64) - 0.5) @ betas[i]
+            # Bin fake targets like real target
+            fake_targ = (rankdata(fake_targ, axis=0) - 0.5) / len(fake_targ)
+            fake_targets[:, positions] = ((np.digitize(fake_targ, self.bins) - 1) / 4).T
+
+        self._map_eras(generate, tqdm(dataf.iter_era_values(feature_names, era_index),
+                                      total=len(era_index.eras), desc="Generating fake target"))
+        return fake_targets
+
+    def _map_eras(self, func, era_values):
+        """
+        Call func(era number, positions, values) for every era.
+        With multiple cores eras are processed by a thread pool (NumPy releases the GIL)
+        and only a few eras are copied ahead of the threads.
+        """
+        if self.num_cores <= 1:
+            for i, (positions, values) in enumerate(era_values):
+                func(i, positions, values)
+            return
+        with ThreadPoolExecutor(max_workers=self.num_cores) as executor:
+            futures = []
+            for i, (positions, values) in enumerate(era_values):
+                futures.append(executor.submit(func, i, positions, values))
+                if len(futures) >= 2 * self.num_cores:
+                    futures.pop(0).result()
+            for future in futures:
+                future.result()
+
+
+# %% ../nbs/03_preprocessing.ipynb 50
+def _create_shared_array(shape: tuple, dtype) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """ Allocate a NumPy array in shared memory so pool workers can read and write it without pickling. """
+    dtype = np.dtype(dtype)
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _attach_shared_array(name: str, shape: tuple, dtype) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """ Attach to an array created with `_create_shared_array` in another process. """
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+def _release_shared_arrays(*shms: shared_memory.SharedMemory):
+    """ Close and free shared memory blocks owned by this process. """
+    for shm in shms:
+        shm.close()
+        shm.unlink()
+
+# %% ../nbs/03_preprocessing.ipynb 51
+class _TickerFrameCodec:
+    """
+    Stores the index and all columns of a DataFrame in one float64 panel, so ticker frames can be rebuilt
+    from shared memory in worker processes. Numeric columns are stored as values.
+    Other columns and the index are stored as codes into their unique values, which are sent along with the codec.
+    """
+    def __init__(self, columns: pd.Index, dtypes: list, index_names: list, uniques: dict):
+        self.columns = columns
+        self.dtypes = dtypes
+        self.index_names = index_names
+        # Position in the panel -> (sorted codes, unique values for these codes)
+        self.uniques = uniques
+
+    @classmethod
+    def encode(cls, dataf: pd.DataFrame) -> Tuple["_TickerFrameCodec", np.ndarray]:
+        """ :return: Codec and (rows x columns + 1) panel with the index in the last column. """
+        fields = [dataf.iloc[:, position] for position in range(dataf.shape[1])] + [dataf.index]
+        panel = np.empty((len(dataf), len(fields)))
+        uniques = {}
+        for position, field in enumerate(fields):
+            numeric = isinstance(field.dtype, np.dtype) and field.dtype.kind in "biuf"
+            if numeric and field.dtype.kind in "iu" and len(field):
+                # Larger integers are not exact in float64.
+                numeric = np.abs(field.to_numpy(dtype=np.float64)).max() < 2 ** 53
+            if numeric:
+                panel[:, position] = field.to_numpy(dtype=np.float64)
+            else:
+                panel[:, position], field_uniques = pd.factorize(field)
+                uniques[position] = (np.arange(len(field_uniques)), field_uniques)
+        codec = cls(dataf.columns, [field.dtype for field in fields], list(dataf.index.names), uniques)
+        return codec, panel
+
+    def subset(self, panel: np.ndarray) -> "_TickerFrameCodec":
+        """ Codec with only the unique values that occur in `panel`, which keeps pickled tasks small. """
+        uniques = {}
+        for position, (codes, field_uniques) in self.uniques.items():
+            used = np.unique(panel[:, position])
+            positions = np.searchsorted(codes, used[used >= 0])
+            uniques[position] = (codes[positions], field_uniques.take(positions))
+        return _TickerFrameCodec(self.columns, self.dtypes, self.index_names, uniques)
+
+    def decode(self, panel: np.ndarray) -> pd.DataFrame:
+        """ Rebuild the DataFrame with original dtypes, index and column names from panel rows. """
+        fields = []
+        for position, dtype in enumerate(self.dtypes):
+            if position not in self.uniques:
+                fields.append(panel[:, position].astype(dtype))
+                continue
+            codes, field_uniques = self.uniques[position]
+            missing = panel[:, position] < 0
+            positions = np.where(missing, -1, np.searchsorted(codes, panel[:, position]))
+            if isinstance(field_uniques, pd.MultiIndex):
+                fields.append(field_uniques.take(positions))
+            else:
+                fields.append(pd.Index(field_uniques).array.take(positions, allow_fill=True))
+        index = fields.pop()
+        index = (index if isinstance(index, pd.MultiIndex) else pd.Index(index)).set_names(self.index_names)
+        ticker_df = pd.DataFrame(dict(enumerate(fields)), index=index)
+        ticker_df.columns = self.columns
+        return ticker_df
+
+
+def _apply_ticker_segments(func, values: np.ndarray, build_frame, out: np.ndarray,
+                           output_cols: list, segments: List[Tuple[int, int]]):
+    """
+    Apply per-ticker function to (start, stop) segments of a ticker-sorted panel.
+    :param build_frame: Function that builds the DataFrame which is passed to `func` from panel rows.
+    """
+    for start, stop in segments:
+        out[start:stop] = func(build_frame(values[start:stop])).reindex(columns=output_cols).to_numpy(dtype=np.float64)
+
+def _ticker_panel_worker(args: tuple):
+    """ Process a chunk of ticker segments from a shared panel into shared output. """
+    (func, in_name, in_shape, build_frame, out_name, output_cols, segments) = args
+    in_shm, values = _attach_shared_array(in_name, in_shape, np.float64)
+    out_shm, out = _attach_shared_array(out_name, (in_shape[0], len(output_cols)), np.float64)
+    try:
+        _apply_ticker_segments(func, values, build_frame, out, output_cols, segments)
+    finally:
+        del values, out
+        in_shm.close()
+        out_shm.close()
+
+
+class TickerPanelPool:
+    """
+    Persistent process pool for per-ticker feature generation on a Numerai Signals price panel.
+    Workers are shut down with `close`, when the pool is garbage collected or when the interpreter exits. \n
+    :param num_cores: Number of worker processes. All available cores by default.
+    """
+    _shared_pools = {}
+
+    def __init__(self, num_cores: int = None):
+        self.num_cores = num_cores if num_cores else os.cpu_count()
+        self._pool = None
+        self._pool_finalizer = None
+
+    @classmethod
+    def shared(cls, num_cores: int = None) -> "TickerPanelPool":
+        """ Process-wide pool for a number of cores that is reused across processors. """
+        num_cores = num_cores if num_cores else os.cpu_count()
+        if num_cores not in cls._shared_pools:
+            cls._shared_pools[num_cores] = cls(num_cores)
+        return cls._shared_pools[num_cores]
+
+    def map(self, func, dataf: pd.DataFrame, ticker_col: str, input_cols: list, output_cols: list,
+            chunk_size: int = 64, desc: str = "Generating features") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply `func` to every ticker. \n
+        :param func: Picklable function that takes a float64 DataFrame with `input_cols` for one ticker
+        and returns a DataFrame with `output_cols`. Missing output columns are filled with NaN. \n
+        :param dataf: DataFrame with data for all tickers. \n
+        :param ticker_col: Column with tickers. \n
+        :param input_cols: Numeric columns that are passed to `func`. \n
+        :param output_cols: Columns that are collected from the result of `func`. \n
+        :param chunk_size: Number of tickers that are sent to a worker at once. \n
+        :param desc: Progress bar description. \n
+        :return: Row positions of dataf sorted by ticker and (rows x output_cols) results in the same order.
+        """
+        values = dataf[input_cols].to_numpy(dtype=np.float64)
+        build_frame = partial(pd.DataFrame, columns=input_cols)
+        return self._map_panel(func, dataf[ticker_col], values, lambda panel: build_frame, output_cols, chunk_size, desc)
+
+    def map_frames(self, func, dataf: pd.DataFrame, ticker_col: str, output_cols: list,
+                   chunk_size: int = 64, desc: str = "Generating features") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply `func` to the DataFrame of every ticker, with its index and all (also non-numeric) columns.
+        The panel is shared with the workers like in `map`. Non-numeric columns and the index are stored as codes
+        and ticker DataFrames are rebuilt with their original dtypes in the workers,
+        so only the unique values that occur in a chunk of tickers are pickled. \n
+        :param func: Picklable function that takes the DataFrame of one ticker and returns a DataFrame with `output_cols`.
+        Missing output columns are filled with NaN. \n
+        Other parameters and the return value are the same as for `map`.
+        """
+        codec, values = _TickerFrameCodec.encode(dataf)
+        return self._map_panel(func, dataf[ticker_col], values, lambda panel: codec.subset(panel).decode,
+                               output_cols, chunk_size, desc)
+
+    def _map_panel(self, func, tickers: pd.Series, values: np.ndarray, frame_builder, output_cols: list,
+                   chunk_size: int, desc: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sort panel by ticker and process chunks of tickers in shared memory.
+        :param frame_builder: Function that takes the panel rows of a chunk and returns a picklable `build_frame`
+        function for `_apply_ticker_segments`.
+        """
+        ticker_index = NumerFrame.build_era_index(tickers)
+        segments = list(zip(ticker_index.starts, ticker_index.stops))
+        chunks = [segments[i:i + chunk_size] for i in range(0, len(segments), chunk_size)]
+        shape = (len(ticker_index.order), values.shape[1])
+        if self.num_cores <= 1 or len(chunks) <= 1:
+            values = values[ticker_index.order]
+            out = np.empty((shape[0], len(output_cols)))
+            build_frame = frame_builder(values)
+            for chunk in tqdm(chunks, desc=desc):
+                _apply_ticker_segments(func, values, build_frame, out, output_cols, chunk)
+            return ticker_index.order, out
+        in_shm, shared_values = _create_shared_array(shape, np.float64)
+        out_shm, shared_out = _create_shared_array((shape[0], len(output_cols)), np.float64)
+        try:
+            np.take(values, ticker_index.order, axis=0, out=shared_values)
+            del values
+            tasks = [(func, in_shm.name, shape, frame_builder(shared_values[chunk[0][0]:chunk[-1][1]]),
+                      out_shm.name, output_cols, chunk) for chunk in chunks]
+            for _ in tqdm(self.pool.imap_unordered(_ticker_panel_worker, tasks), desc=desc, total=len(tasks)):
+                pass
+            return ticker_index.order, shared_out.copy()
+        finally:
+            del shared_values, shared_out
+            _release_shared_arrays(in_shm, out_shm)
+
+    @property
+    def pool(self) -> Pool:
+        """ Worker pool that is created on first use. """
+        if self._pool is None:
+            self._pool = Pool(self.num_cores)
+            # Shared pools are never garbage collected, so this also runs at interpreter exit.
+            self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def close(self):
+        """ Shut down worker pool. """
+        if self._pool is not None:
+            self._pool_finalizer()
+            self._pool, self._pool_finalizer = None, None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pool"], state["_pool_finalizer"] = None, None
+        return state
+
+# %% ../nbs/03_preprocessing.ipynb 53
+def _segment_rows(starts: np.ndarray, stops: np.ndarray) -> tuple:
+    """ Start and stop offset of the segment of every row for rows sorted by segment. """
+    counts = stops - starts
+    return np.repeat(starts, counts), np.repeat(stops, counts)
+
+def _segmented_shift(values: np.ndarray, periods: int, segment_start: np.ndarray) -> np.ndarray:
+    """ Shift values by `periods` rows within every segment (like groupby shift). """
+    shifted = np.full(len(values), np.nan)
+    if periods < len(values):
+        shifted[periods:] = values[:len(values) - periods]
+    shifted[np.arange(len(values)) - segment_start < periods] = np.nan
+    return shifted
+
+def _segmented_ffill(values: np.ndarray, segment_start: np.ndarray) -> np.ndarray:
+    """ Forward fill NaNs within every segment. """
+    rows = np.arange(len(values))
+    last_valid = np.maximum.accumulate(np.where(np.isnan(values), -1, rows))
+    return np.where(last_valid >= segment_start, values[np.maximum(last_valid, 0)], np.nan)
+
+def _segmented_bfill(values: np.ndarray, segment_stop: np.ndarray) -> np.ndarray:
+    """ Backward fill NaNs within every segment. Works on columns of a 2D array. """
+    rows = np.arange(len(values))
+    if values.ndim == 2:
+        rows = rows[:, None]
+        segment_stop = segment_stop[:, None]
+    next_valid = np.minimum.accumulate(np.where(np.isnan(values), len(values), rows)[::-1], axis=0)[::-1]
+    filled = np.take_along_axis(values, np.minimum(next_valid, len(values) - 1), axis=0) if values.ndim == 2 \
+        else values[np.minimum(next_valid, len(values) - 1)]
+    return np.where(next_valid < segment_stop, filled, np.nan)
+
+def _segmented_pct_change(values: np.ndarray, periods: int, segment_start: np.ndarray) -> np.ndarray:
+    """ pandas pct_change (NaNs are padded first) within every segment. """
+    filled = _segmented_ffill(values, segment_start)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return filled / _segmented_shift(filled, periods, segment_start) - 1
+
+def _equal_run_lengths(values: np.ndarray, segment_start: np.ndarray) -> np.ndarray:
+    """ Number of consecutive equal values ending at every row within every segment. """
+    rows = np.arange(len(values))
+    new_run = np.ones(len(values), dtype=bool)
+    new_run[1:] = values[1:] != values[:-1]
+    new_run |= rows == segment_start
+    return rows - np.maximum.accumulate(np.where(new_run, rows, 0)) + 1
+
+def _segmented_rolling(values: np.ndarray, window: int, segment_start: np.ndarray, std: bool = False) -> np.ndarray:
+    """
+    Rolling mean (or sample standard deviation) with min_periods=window within every segment, computed with cumulative sums.
+    Windows of identical values return the exact value (or 0) like pandas.
+    """
+    rows = np.arange(len(values))
+    missing = np.isnan(values)
+    clean = np.where(missing, 0., values)
+    def window_sum(x: np.ndarray) -> np.ndarray:
+        cumulative = np.concatenate([[0], np.cumsum(x)])
+        return cumulative[rows + 1] - cumulative[np.maximum(rows + 1 - window, 0)]
+    valid = (rows - segment_start >= window - 1) & (window_sum(missing) == 0)
+    same = _equal_run_lengths(values, segment_start) >= window
+    sums = window_sum(clean)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if std:
+            result = np.sqrt(np.maximum(window_sum(clean ** 2) - sums * sums / window, 0) / (window - 1))
+            result[same] = 0. if window > 1 else np.nan
+        else:
+            result = sums / window
+            result[same] = values[same]
+    result[~valid] = np.nan
+    return result
+
+def _segmented_ewm_sums(values: np.ndarray, alpha: float, segment_start: np.ndarray, initial: np.ndarray = None) -> np.ndarray:
+    """
+    State of pandas ewm(alpha=alpha, adjust=True, ignore_na=False) within every segment.
+    Weighted sums are computed with a linear filter over all rows. Carry-over from the previous segment is removed.
+    :param initial: Optional (rows x 3) state carried into the segment of every row (from rows that are not included).
+    :return: (rows x 3) array with weighted sum, sum of weights and number of observations up to every row.
+    """
+    decay = 1 - alpha
+    decays = decay ** (np.arange(len(values)) - segment_start + 1)
+    initial = np.zeros((len(values), 3)) if initial is None else initial
+    observed = ~np.isnan(values)
+    def decayed_sum(x: np.ndarray, carry_in: np.ndarray) -> np.ndarray:
+        total = lfilter([1.], [1., -decay], x)
+        carry = np.where(segment_start > 0, total[np.maximum(segment_start - 1, 0)], 0.)
+        return total + decays * (carry_in - carry)
+    weighted = decayed_sum(np.where(observed, values, 0.), initial[:, 0])
+    weights = decayed_sum(observed.astype(np.float64), initial[:, 1])
+    cumulative = np.cumsum(observed)
+    n_obs = cumulative - np.where(segment_start > 0, cumulative[np.maximum(segment_start - 1, 0)], 0) + initial[:, 2]
+    return np.column_stack([weighted, weights, n_obs])
+
+def _ewm_mean_from_sums(sums: np.ndarray, min_periods: int = 0) -> np.ndarray:
+    """ Exponential moving average from `_segmented_ewm_sums` state. """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = sums[:, 0] / sums[:, 1]
+    result[sums[:, 2] < max(min_periods, 1)] = np.nan
+    return result
+
+def _segmented_ewm_mean(values: np.ndarray, alpha: float, segment_start: np.ndarray, min_periods: int = 0) -> np.ndarray:
+    """ pandas ewm(alpha=alpha, adjust=True, ignore_na=False).mean() within every segment. """
+    return _ewm_mean_from_sums(_segmented_ewm_sums(values, alpha, segment_start), min_periods)
+
+def _combine_with_history(history: pd.DataFrame, dataf: pd.DataFrame, columns: list) -> Tuple[pd.DataFrame, int]:
+    """
+    Stack rows kept from previous incremental transforms on top of new rows.
+    :return: Combined DataFrame and number of history rows at the top.
+    """
+    new = dataf[columns].reset_index(drop=True)
+    if history is None:
+        return new, 0
+    return pd.concat([history, new], ignore_index=True), len(history)
+
+def _history_tail(combined: pd.DataFrame, ticker_col: str, n_rows: int) -> pd.DataFrame:
+    """ Last `n_rows` rows of every ticker to keep for the next incremental transform. """
+    return combined.groupby(ticker_col, sort=False).tail(n_rows).reset_index(drop=True)
+
+def _add_columns(dataf: pd.DataFrame, block: np.ndarray, columns: list) -> pd.DataFrame:
+    """
+    Add new columns at once from a (columns x rows) array. Existing columns with the same names are replaced.
+    With the pandas block API the array is added as a single block, so neither existing data nor the new values are copied.
+    Otherwise the columns are added with `pd.concat`.
+    """
+    existing = dataf.columns.intersection(columns)
+    if len(existing):
+        dataf = dataf.drop(columns=existing)
+    if not _PANDAS_BLOCK_API:
+        new_columns = pd.DataFrame(block.T, index=dataf.index, columns=columns, copy=False)
+        return pd.concat([dataf, new_columns], axis=1, copy=False)
+    from pandas.core.internals.api import make_block
+    n_columns = dataf.shape[1]
+    new_block = make_block(block, placement=np.arange(n_columns, n_columns + len(columns)))
+    return _frame_from_blocks(tuple(dataf._mgr.blocks) + (new_block,),
+                              [dataf.columns.append(pd.Index(columns)), dataf.index])
+
+# %% ../nbs/03_preprocessing.ipynb 54
 class KatsuFeatureGenerator(BaseProcessor):
     """
     Effective feature engineering setup based on Katsu's starter notebook.
@@ -343,7 +969,18 @@ class KatsuFeatureGenerator(BaseProcessor):
     2. Volatility \n
     3. Moving Average gap \n
     :param ticker_col: Columns with tickers to iterate over. \n
-    :param close_col: Column name where you have closing price stored.
+    :param close_col: Column name where you have closing price stored. \n
+    :param num_cores: Number of worker processes. All available cores by default. \n
+    :param chunk_size: Number of tickers that are sent to a worker at once. \n
+    :param pool: TickerPanelPool to run on. Shared pool for `num_cores` by default. \n
+    :param engine: 'numpy' computes features for all tickers at once on one ticker-sorted array
+    with segmented rolling windows and exponential moving averages. No worker processes are used. \n
+    'pandas' runs `feature_engineering` for every ticker on `pool`. Both engines give the same features. \n
+    :param incremental: Only compute features for new rows on every transform (requires engine='numpy').
+    The last closes and the RSI and MACD moving average state of every ticker are kept on the processor
+    (`history_` and `ewm_state_`), so the processor can be pickled to persist state between runs.
+    Rows of every ticker should be passed in date order and only once.
+    New rows get the same features as a transform on the full history, but they are not backfilled with later data.
     """
 
     warnings.filterwarnings("ignore")
@@ -354,28 +991,73 @@ class KatsuFeatureGenerator(BaseProcessor):
         ticker_col: str = "ticker",
         close_col: str = "close",
         num_cores: int = None,
+        chunk_size: int = 64,
+        pool: TickerPanelPool = None,
+        engine: str = "numpy",
+        incremental: bool = False,
     ):
         super().__init__()
+        assert engine in ("numpy", "pandas"), f"Invalid engine '{engine}'. Options are 'numpy' and 'pandas'."
+        assert not incremental or engine == "numpy", "Incremental feature generation requires engine='numpy'."
+        self.engine = engine
+        self.incremental = incremental
+        self.history_ = None
+        self.ewm_state_ = None
         self.windows = windows
         self.ticker_col = ticker_col
         self.close_col = close_col
         self.num_cores = num_cores if num_cores else os.cpu_count()
+        self.chunk_size = chunk_size
+        self.pool = pool if pool is not None else TickerPanelPool.shared(self.num_cores)
 
     @display_processor_info
     def transform(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         """Multiprocessing feature engineering."""
         tickers = dataf.loc[:, self.ticker_col].unique().tolist()
-        rich_print(
-            f"Feature engineering for {len(tickers)} tickers using {self.num_cores} CPU cores."
-        )
-        dataf_list = [
-            x
-            for _, x in tqdm(
-                dataf.groupby(self.ticker_col), desc="Generating ticker DataFrames"
+        if self.incremental:
+            rich_print(f"Incremental feature engineering for {len(dataf)} new rows of {len(tickers)} tickers.")
+            return self._transform_incremental(dataf)
+        if self.engine == "numpy":
+            rich_print(f"Feature engineering for {len(tickers)} tickers (vectorized).")
+            order, features = self._vectorized_features(dataf)
+        else:
+            rich_print(
+                f"Feature engineering for {len(tickers)} tickers using {self.num_cores} CPU cores."
             )
-        ]
-        dataf = self._generate_features(dataf_list=dataf_list)
-        return NumerFrame(dataf)
+            order, features = self.pool.map(self.feature_engineering, dataf, self.ticker_col,
+                                            input_cols=[self.close_col], output_cols=self.feature_names,
+                                            chunk_size=self.chunk_size)
+        dataf = dataf.take(order)
+        dataf[self.feature_names] = features
+        return NumerFrame.wrap(dataf)
+
+    def _transform_incremental(self, dataf: pd.DataFrame) -> NumerFrame:
+        """ Features for new rows using stored history and moving average state. """
+        history_rows = max(self.windows) + 1
+        columns = [self.ticker_col, self.close_col]
+        combined, n_history = _combine_with_history(self.history_, dataf, columns)
+        order, features, self.ewm_state_ = self._vectorized_features(
+            combined, ewm_state=self.ewm_state_, history_rows=history_rows
+        )
+        self.history_ = _history_tail(combined, self.ticker_col, history_rows)
+        is_new = order >= n_history
+        dataf = dataf.take(order[is_new] - n_history)
+        dataf[self.feature_names] = features[is_new]
+        return NumerFrame.wrap(dataf)
+
+    def reset_state(self):
+        """ Forget history of incremental transforms. """
+        self.history_ = None
+        self.ewm_state_ = None
+
+    @property
+    def feature_names(self) -> List[str]:
+        """ Names of generated features. """
+        names = []
+        for x in self.windows:
+            names += [f"feature_{self.close_col}_ROCP_{x}", f"feature_{self.close_col}_VOL_{x}",
+                      f"feature_{self.close_col}_MA_gap_{x}"]
+        return names + ["feature_RSI", "feature_MACD", "feature_MACD_signal"]
 
     def feature_engineering(self, dataf: pd.DataFrame) -> pd.DataFrame:
         """Feature engineering for single ticker."""
@@ -399,17 +1081,63 @@ class KatsuFeatureGenerator(BaseProcessor):
         dataf.loc[:, "feature_MACD_signal"] = macd_signal
         return dataf.bfill()
 
-    def _generate_features(self, dataf_list: list) -> pd.DataFrame:
-        """Add features for list of ticker DataFrames and concatenate."""
-        with Pool(self.num_cores) as p:
-            feature_datafs = list(
-                tqdm(
-                    p.imap(self.feature_engineering, dataf_list),
-                    desc="Generating features",
-                    total=len(dataf_list),
-                )
-            )
-        return pd.concat(feature_datafs)
+    _ewm_names = ["gain", "loss", "ema_fast", "ema_slow", "signal"]
+
+    def _vectorized_features(self, dataf: pd.DataFrame, ewm_state: pd.DataFrame = None, history_rows: int = None):
+        """
+        Features for all tickers at once. Equivalent to `feature_engineering` for every ticker.
+        :param ewm_state: Previous close and moving average state per ticker from rows before dataf (incremental mode). \n
+        :param history_rows: Number of last rows per ticker that are kept as history (incremental mode). \n
+        :return: Row positions of dataf sorted by ticker and (rows x features) in the same order.
+        With `history_rows` also previous close and moving average state per ticker just before the kept history rows.
+        """
+        ticker_index = NumerFrame.build_era_index(dataf[self.ticker_col])
+        close = dataf[self.close_col].to_numpy(dtype=np.float64)[ticker_index.order]
+        segment_start, segment_stop = _segment_rows(ticker_index.starts, ticker_index.stops)
+        state_columns = [f"{name}_{part}" for name in self._ewm_names for part in ("weighted", "weights", "n_obs")]
+        initial = np.zeros((len(ticker_index.eras), len(state_columns)))
+        previous_close = np.full(len(ticker_index.eras), np.nan)
+        if ewm_state is not None:
+            ewm_state = ewm_state.reindex(ticker_index.eras)
+            initial = ewm_state[state_columns].fillna(0).to_numpy()
+            previous_close = ewm_state["previous_close"].to_numpy()
+        ewm_sums = {}
+        def ewm(name: str, values: np.ndarray, alpha: float, min_periods: int = 0) -> np.ndarray:
+            i = self._ewm_names.index(name)
+            carried = np.repeat(initial[:, 3 * i:3 * i + 3], ticker_index.counts, axis=0)
+            ewm_sums[name] = _segmented_ewm_sums(values, alpha, segment_start, carried)
+            return _ewm_mean_from_sums(ewm_sums[name], min_periods)
+        log_returns = _segmented_pct_change(np.log1p(close), 1, segment_start)
+        features = []
+        for x in self.windows:
+            features.append(_segmented_pct_change(close, x, segment_start))
+            features.append(_segmented_rolling(log_returns, x, segment_start, std=True))
+            features.append(close / _segmented_rolling(close, x, segment_start))
+        # RSI (period 14)
+        previous = _segmented_shift(close, 1, segment_start)
+        previous[ticker_index.starts] = previous_close
+        delta = close - previous
+        gain = ewm("gain", np.where(delta < 0, 0, delta), 1 / 14, min_periods=14)
+        loss = ewm("loss", np.abs(np.where(delta > 0, 0, delta)), 1 / 14, min_periods=14)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            features.append(100 - (100 / (1 + gain / loss)))
+        # MACD (spans 12, 26 and 9)
+        exp1 = ewm("ema_fast", close, 2 / 13)
+        exp2 = ewm("ema_slow", close, 2 / 27)
+        macd = 100 * (exp1 - exp2) / exp2
+        features += [macd, ewm("signal", macd, 2 / 10)]
+        features = _segmented_bfill(np.column_stack(features), segment_stop)
+        if history_rows is None:
+            return ticker_index.order, features
+        # State just before the rows that are kept as history. Unchanged for tickers without dropped rows.
+        cut = ticker_index.stops - history_rows
+        dropped = cut > ticker_index.starts
+        state = initial.copy()
+        state[dropped] = np.column_stack([ewm_sums[name] for name in self._ewm_names])[cut[dropped] - 1]
+        previous_close[dropped] = close[cut[dropped] - 1]
+        state = pd.DataFrame(state, index=ticker_index.eras, columns=state_columns)
+        state["previous_close"] = previous_close
+        return ticker_index.order, features, state
 
     @staticmethod
     def _rsi(close: pd.Series, period: int = 14) -> pd.Series:
@@ -444,19 +1172,101 @@ class KatsuFeatureGenerator(BaseProcessor):
         a = 2 / (span + 1)
         return series.ewm(alpha=a).mean()
 
-# %% ../nbs/03_preprocessing.ipynb 55
+# %% ../nbs/03_preprocessing.ipynb 70
+def _era_quantiles(values: np.ndarray, num_quantiles: int) -> np.ndarray:
+    """
+    Uniform quantile transform of all rows of one era.
+    Gives the same result as fitting a QuantileTransformer per feature without subsampling.
+    NaNs are ignored for fitting and stay NaN.
+    :param values: Array of shape (n_features, n_rows).
+    :param num_quantiles: Maximum number of quantiles.
+    :return: Float64 array of shape (n_features, n_rows).
+    """
+    n_features, n_rows = values.shape
+    if n_rows == 0 or n_features == 0:
+        return np.empty(values.shape)
+    # Like QuantileTransformer the number of quantiles is capped by the number of rows (including NaNs).
+    n_quantiles = max(1, min(num_quantiles, n_rows))
+    references = np.linspace(0, 1, n_quantiles, endpoint=True)
+    # Single sort per era. NaNs are sorted to the end of every row.
+    order = np.argsort(values, axis=1)
+    sorted_values = np.take_along_axis(values, order, axis=1).astype(np.float64, copy=False)
+    n_valid = np.full(n_features, n_rows) if values.dtype.kind != "f" else n_rows - np.isnan(sorted_values).sum(axis=1)
+    quantiles = np.full((n_features, n_quantiles), np.nan)
+    complete = n_valid == n_rows
+    if complete.any():
+        quantiles[complete] = np.percentile(sorted_values[complete], references * 100, axis=1).T
+    for i in np.flatnonzero(~complete & (n_valid > 0)):
+        quantiles[i] = np.percentile(sorted_values[i, :n_valid[i]], references * 100)
+    np.maximum.accumulate(quantiles, axis=1, out=quantiles)
+    # For every quantile the number of values smaller (left) and smaller or equal (right).
+    # Cumulative counts give the number of quantiles strictly below / below or equal to every sorted value.
+    offsets = np.arange(n_features)[:, None] * (n_rows + 1)
+    left, right = np.empty_like(quantiles, dtype=np.int64), np.empty_like(quantiles, dtype=np.int64)
+    for i in range(n_features):
+        left[i] = np.searchsorted(sorted_values[i, :n_valid[i]], quantiles[i], side="left")
+        right[i] = np.searchsorted(sorted_values[i, :n_valid[i]], quantiles[i], side="right")
+    def _cumulative_counts(bounds: np.ndarray) -> np.ndarray:
+        counts = np.bincount((bounds + offsets).ravel(), minlength=n_features * (n_rows + 1))
+        return counts.reshape(n_features, n_rows + 1).cumsum(axis=1)[:, :n_rows]
+    n_quantiles_le = _cumulative_counts(left)
+    n_quantiles_lt = _cumulative_counts(right)
+    sorted_result = np.zeros(values.shape)
+    if n_quantiles > 1:
+        # Interpolate forward and backward (np.interp) and average them like QuantileTransformer.
+        flat_quantiles = quantiles.ravel()
+        flat_offsets = np.arange(n_features)[:, None] * n_quantiles
+        with np.errstate(divide="ignore", invalid="ignore"):
+            j = np.clip(n_quantiles_le - 1, 0, n_quantiles - 2)
+            lower = flat_quantiles.take(j + flat_offsets)
+            upper = flat_quantiles.take(j + 1 + flat_offsets)
+            forward = (references[j + 1] - references[j]) / (upper - lower) * (sorted_values - lower) + references[j]
+            k = np.clip(n_quantiles_lt, 1, n_quantiles - 1)
+            lower = flat_quantiles.take(k - 1 + flat_offsets)
+            upper = flat_quantiles.take(k + flat_offsets)
+            backward = (references[k] - references[k - 1]) / (upper - lower) * (upper - sorted_values) - references[k]
+        forward[n_quantiles_le == 0] = references[0]
+        forward[n_quantiles_le == n_quantiles] = references[-1]
+        backward[n_quantiles_lt == 0] = -references[0]
+        backward[n_quantiles_lt == n_quantiles] = -references[-1]
+        sorted_result = 0.5 * (forward - backward)
+    sorted_result[sorted_values == quantiles[:, -1:]] = 1.
+    sorted_result[sorted_values == quantiles[:, :1]] = 0.
+    sorted_result[np.arange(n_rows) >= n_valid[:, None]] = np.nan
+    result = np.empty(values.shape)
+    np.put_along_axis(result, order, sorted_result, axis=1)
+    return result
+
+def _era_quantiles_worker(args: tuple):
+    """ Quantile transform a chunk of eras from shared input into shared output. """
+    (in_name, out_name, shape, dtype, bounds, num_quantiles) = args
+    in_shm, values = _attach_shared_array(in_name, shape, dtype)
+    out_shm, out = _attach_shared_array(out_name, shape, np.float64)
+    try:
+        for start, stop in bounds:
+            out[:, start:stop] = _era_quantiles(values[:, start:stop], num_quantiles)
+    finally:
+        del values, out
+        in_shm.close()
+        out_shm.close()
+
+# %% ../nbs/03_preprocessing.ipynb 71
 class EraQuantileProcessor(BaseProcessor):
     """
-    Transform features into quantiles on a per-era basis
+    Transform features into quantiles on a per-era basis.
+    Every era is sorted once and all features of a batch are interpolated at the same time.
+    Results are equal to fitting a QuantileTransformer for every era and feature on all rows (no subsampling).
 
     :param num_quantiles: Number of buckets to split data into. \n
     :param era_col: Era column name in the dataframe to perform each transformation. \n
     :param features: All features that you want quantized. All feature cols by default. \n
-    :param num_cores: CPU cores to allocate for quantile transforming. All available cores by default. \n
-    :param random_state: Seed for QuantileTransformer. \n
-    :param batch_size: How many feature to process at the same time.
-    For Numerai Signals scale data it is advisable to process features one by one. 
-    This is the default setting.
+    :param num_cores: CPU cores to allocate for quantile transforming. All available cores by default.
+    With more than 1 core a process pool is kept alive between transforms and eras are shared through shared memory.
+    The pool is shut down with `close`, when the processor is garbage collected or when the interpreter exits. \n
+    :param random_state: Deprecated and ignored. Quantiles are computed exactly, so no random subsampling is done. \n
+    :param batch_size: How many features to process at the same time. One by one by default, which keeps memory usage low
+    on Numerai Signals scale data. Larger batches (or None for all features at once) are faster,
+    but hold a copy of all features of a batch in memory.
     """
 
     def __init__(
@@ -465,7 +1275,7 @@ class EraQuantileProcessor(BaseProcessor):
         era_col: str = "friday_date",
         features: list = None,
         num_cores: int = None,
-        random_state: int = 0,
+        random_state: int = None,
         batch_size: int = 1
     ):
         super().__init__()
@@ -473,48 +1283,84 @@ class EraQuantileProcessor(BaseProcessor):
         self.era_col = era_col
         self.num_cores = num_cores if num_cores else os.cpu_count()
         self.features = features 
+        if random_state is not None:
+            warnings.warn("'random_state' is deprecated and ignored by EraQuantileProcessor, "
+                          "because quantiles are computed exactly without subsampling.", DeprecationWarning)
         self.random_state = random_state
-        self.batch_size = batch_size 
-
-    def _process_eras(self, groupby_object):
-        quantizer = QuantileTransformer(
-            n_quantiles=self.num_quantiles, random_state=self.random_state
-        )
-        qt = lambda x: quantizer.fit_transform(x.values.reshape(-1, 1)).ravel()
-
-        column = groupby_object.transform(qt)
-        return column
+        self.batch_size = batch_size
+        self._pool = None
+        self._pool_finalizer = None
 
     @display_processor_info
     def transform(
         self,
         dataf: Union[pd.DataFrame, NumerFrame],
     ) -> NumerFrame:
-        """Multiprocessing quantile transforms by era."""
+        """Quantile transform features by era."""
         features = self.features if self.features else dataf.feature_cols
         rich_print(
             f"Quantiling for {len(features)} features using {self.num_cores} CPU cores."
         )
-
-        date_groups = dataf.groupby(self.era_col)
-        for batch_start in tqdm(range(0, len(features), self.batch_size), total=len(features)):
-            # Create batch of features. Default is to process features on by one.
-            batch_end = min(batch_start + self.batch_size, len(features))
-            batch_features = features[batch_start:batch_end]
-            groupby_objects = [date_groups[feature] for feature in batch_features]
-
-            with Pool() as p:
-                results = list(
-                        p.imap(self._process_eras, groupby_objects),
-                )
-
-            quantiles = pd.concat(results, axis=1)
+        if isinstance(dataf, NumerFrame) and dataf.meta.era_col == self.era_col:
+            era_index = dataf.era_index
+        else:
+            era_index = NumerFrame.build_era_index(dataf[self.era_col])
+        batch_size = self.batch_size if self.batch_size else max(len(features), 1)
+        for batch_start in tqdm(range(0, len(features), batch_size), desc="Quantile batches"):
+            batch_features = features[batch_start:batch_start + batch_size]
+            # Features x rows in era order. Values keep their stored dtype until an era is processed.
+            values = np.ascontiguousarray(dataf[batch_features].to_numpy().T[:, era_index.order])
+            quantiles = np.full((len(dataf), len(batch_features)), np.nan)
+            quantiles[era_index.order] = self._quantile_eras(values, era_index).T
             dataf[
                 [f"{feature}_quantile{self.num_quantiles}" for feature in batch_features]
             ] = quantiles
-            return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
+
+    def _quantile_eras(self, values: np.ndarray, era_index) -> np.ndarray:
+        """ Quantile transform (features x rows) values sorted by era. """
+        bounds = list(zip(era_index.starts, era_index.stops))
+        if self.num_cores <= 1 or len(bounds) <= 1:
+            out = np.empty(values.shape)
+            for start, stop in bounds:
+                out[:, start:stop] = _era_quantiles(values[:, start:stop], self.num_quantiles)
+            return out
+        in_shm, shared_values = _create_shared_array(values.shape, values.dtype)
+        out_shm, shared_out = _create_shared_array(values.shape, np.float64)
+        try:
+            shared_values[:] = values
+            chunks = np.array_split(np.arange(len(bounds)), min(len(bounds), self.num_cores * 4))
+            tasks = [(in_shm.name, out_shm.name, values.shape, values.dtype.str,
+                      [bounds[i] for i in chunk], self.num_quantiles) for chunk in chunks]
+            for _ in self.pool.imap_unordered(_era_quantiles_worker, tasks):
+                pass
+            return shared_out.copy()
+        finally:
+            del shared_values, shared_out
+            _release_shared_arrays(in_shm, out_shm)
+
+    @property
+    def pool(self) -> Pool:
+        """ Worker pool that is created on first use and reused for every transform. """
+        if self._pool is None:
+            self._pool = Pool(self.num_cores)
+            # Also runs at interpreter exit, so worker processes never outlive the processor.
+            self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def close(self):
+        """ Shut down worker pool. """
+        if self._pool is not None:
+            self._pool_finalizer()
+            self._pool, self._pool_finalizer = None, None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pool"], state["_pool_finalizer"] = None, None
+        return state
+
 
-# %% ../nbs/03_preprocessing.ipynb 59
+# %% ../nbs/03_preprocessing.ipynb 76
 class TickerMapper(BaseProcessor):
     """
     Map ticker from one format to another. \n
@@ -552,9 +1398,9 @@ class TickerMapper(BaseProcessor):
         self, dataf: Union[pd.DataFrame, NumerFrame], *args, **kwargs
     ) -> NumerFrame:
         dataf[self.target_ticker_format] = dataf[self.ticker_col].map(self.mapping)
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)
 
-# %% ../nbs/03_preprocessing.ipynb 66
+# %% ../nbs/03_preprocessing.ipynb 83
 class SignalsTargetProcessor(BaseProcessor):
     """
     Engineer targets for Numerai Signals. \n
@@ -564,7 +1410,8 @@ class SignalsTargetProcessor(BaseProcessor):
     :param price_col: Column from which target will be derived. \n
     :param windows: Timeframes to use for engineering targets. 10 and 20-day by default. \n
     :param bins: Binning used to create group targets. Nomi binning by default. \n
-    :param labels: Scaling for binned target. Must be same length as resulting bins (bins-1). Numerai labels by default.
+    :param labels: Scaling for binned target. Must be same length as resulting bins (bins-1). Numerai labels by default. \n
+    :param ticker_col: Column with tickers. Forward returns are computed within every ticker (rows in date order).
     """
 
     def __init__(
@@ -573,34 +1420,67 @@ class SignalsTargetProcessor(BaseProcessor):
         windows: list = None,
         bins: list = None,
         labels: list = None,
+        ticker_col: str = "ticker",
     ):
         super().__init__()
         self.price_col = price_col
         self.windows = windows if windows else [10, 20]
         self.bins = bins if bins else [0, 0.05, 0.25, 0.75, 0.95, 1]
         self.labels = labels if labels else [0, 0.25, 0.50, 0.75, 1]
+        self.ticker_col = ticker_col
 
     @display_processor_info
     def transform(self, dataf: NumerFrame) -> NumerFrame:
-        for window in tqdm(self.windows, desc="Signals target engineering windows"):
-            dataf.loc[:, f"target_{window}d_raw"] = (
-                dataf[self.price_col].pct_change(periods=window).shift(-window)
-            )
-            era_groups = dataf.groupby(dataf.meta.era_col)
-
-            dataf.loc[:, f"target_{window}d_rank"] = era_groups[
-                f"target_{window}d_raw"
-            ].rank(pct=True, method="first")
-            dataf.loc[:, f"target_{window}d_group"] = era_groups[
-                f"target_{window}d_rank"
-            ].transform(
-                lambda group: pd.cut(
-                    group, bins=self.bins, labels=self.labels, include_lowest=True
-                )
-            )
-        return NumerFrame(dataf)
+        n_rows = len(dataf)
+        if self.ticker_col in dataf.columns:
+            ticker_index = NumerFrame.build_era_index(dataf[self.ticker_col])
+        else:
+            rich_print(f":warning: WARNING: Ticker column '{self.ticker_col}' not found. Forward returns are computed over all rows. :warning:")
+            ticker_index = NumerFrame.build_era_index(np.zeros(n_rows))
+        order = ticker_index.order
+        segment_start, segment_stop = _segment_rows(ticker_index.starts, ticker_index.stops)
+        # pct_change pads missing prices within a ticker.
+        prices = _segmented_ffill(dataf[self.price_col].to_numpy(dtype=np.float64)[order], segment_start)
+        era_codes, _ = pd.factorize(dataf[dataf.meta.era_col])
+        sorted_rows = np.arange(len(order))
+        targets = np.full((len(self.windows), 3, n_rows), np.nan)
+        for i, window in enumerate(self.windows):
+            # Forward return within every ticker.
+            valid = sorted_rows + window < segment_stop
+            raw = targets[i, 0]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                raw[order[valid]] = prices[sorted_rows[valid] + window] / prices[sorted_rows[valid]] - 1
+            targets[i, 1] = self._era_rank(raw, era_codes)
+            targets[i, 2] = self._bin(targets[i, 1])
+        names = [f"target_{window}d_{kind}" for window in self.windows for kind in ("raw", "rank", "group")]
+        return NumerFrame.wrap(_add_columns(dataf, targets.reshape(-1, n_rows), names))
 
-# %% ../nbs/03_preprocessing.ipynb 70
+    @staticmethod
+    def _era_rank(values: np.ndarray, era_codes: np.ndarray) -> np.ndarray:
+        """
+        Percentile rank within every era with one sort. Same as groupby(era).rank(pct=True, method="first").
+        Ties are ranked in order of appearance and NaNs are not ranked.
+        """
+        rows = np.flatnonzero(~np.isnan(values) & (era_codes >= 0))
+        # Stable sort by era, then by value. Ties keep their original row order.
+        rows = rows[np.lexsort((values[rows], era_codes[rows]))]
+        codes = era_codes[rows]
+        counts = np.bincount(codes)
+        starts = np.cumsum(counts) - counts
+        ranks = np.full(len(values), np.nan)
+        ranks[rows] = (np.arange(len(rows)) - starts[codes] + 1) / counts[codes]
+        return ranks
+
+    def _bin(self, ranks: np.ndarray) -> np.ndarray:
+        """ Map ranks to labels. Same as pd.cut(ranks, bins, labels=labels, include_lowest=True). """
+        bins = np.asarray(self.bins, dtype=np.float64)
+        bin_ids = np.digitize(ranks, bins, right=True)
+        bin_ids[ranks == bins[0]] = 1
+        labels = np.append(np.asarray(self.labels, dtype=np.float64), np.nan)
+        valid = (bin_ids >= 1) & (bin_ids < len(bins))
+        return np.where(valid, labels[np.where(valid, bin_ids - 1, -1)], np.nan)
+
+# %% ../nbs/03_preprocessing.ipynb 88
 class LagPreProcessor(BaseProcessor):
     """
     Add lag features based on given windows.
@@ -608,7 +1488,10 @@ class LagPreProcessor(BaseProcessor):
     :param windows: All lag windows to process for all features. \n
     [5, 10, 15, 20] by default (4 weeks lookback) \n
     :param ticker_col: Column name for grouping by tickers. \n
-    :param feature_names: All features for which you want to create lags. All features by default.
+    :param feature_names: All features for which you want to create lags. All features by default. \n
+    :param incremental: Only compute lags for new rows on every transform.
+    The last `max(windows)` rows of every ticker are kept on the processor (`history_`).
+    Rows of every ticker should be passed in date order and only once.
     """
 
     def __init__(
@@ -616,24 +1499,55 @@ class LagPreProcessor(BaseProcessor):
         windows: list = None,
         ticker_col: str = "bloomberg_ticker",
         feature_names: list = None,
+        incremental: bool = False,
     ):
         super().__init__()
         self.windows = windows if windows else [5, 10, 15, 20]
         self.ticker_col = ticker_col
         self.feature_names = feature_names
+        self.incremental = incremental
+        self.history_ = None
 
     @display_processor_info
     def transform(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
-        feature_names = self.feature_names if self.feature_names else dataf.feature_cols
-        ticker_groups = dataf.groupby(self.ticker_col)
-        for feature in tqdm(feature_names, desc="Lag feature generation"):
-            feature_group = ticker_groups[feature]
-            for day in self.windows:
-                shifted = feature_group.shift(day, axis=0)
-                dataf.loc[:, f"{feature}_lag{day}"] = shifted
-        return NumerFrame(dataf)
-
-# %% ../nbs/03_preprocessing.ipynb 76
+        feature_names = list(self.feature_names if self.feature_names else dataf.feature_cols)
+        combined, n_history = dataf, 0
+        if self.incremental:
+            combined, n_history = _combine_with_history(self.history_, dataf, [self.ticker_col] + feature_names)
+            self.history_ = _history_tail(combined, self.ticker_col, max(self.windows))
+        lags = self._lag_block(combined, feature_names)[:, n_history:]
+        lag_names = [f"{feature}_lag{day}" for feature in feature_names for day in self.windows]
+        return NumerFrame.wrap(_add_columns(dataf, lags, lag_names))
+
+    def _lag_block(self, dataf: pd.DataFrame, feature_names: list) -> np.ndarray:
+        """
+        Lags for all features and windows in one pass.
+        Rows are sorted by ticker once and every window gathers all features with one shifted row index.
+        :return: ((features * windows) x rows) array in original row order. Features are the outer dimension.
+        """
+        ticker_index = NumerFrame.build_era_index(dataf[self.ticker_col])
+        order = ticker_index.order
+        n_rows = len(dataf)
+        values = dataf[feature_names].to_numpy().T
+        # Extra NaN column that rows without a lagged value point to.
+        padded = np.empty((len(feature_names), n_rows + 1), dtype=values.dtype if values.dtype.kind == "f" else np.float64)
+        padded[:, :n_rows] = values
+        padded[:, n_rows] = np.nan
+        segment_start, _ = _segment_rows(ticker_index.starts, ticker_index.stops)
+        sorted_rows = np.arange(len(order))
+        lags = np.empty((len(feature_names), len(self.windows), n_rows), dtype=padded.dtype)
+        for i, day in enumerate(self.windows):
+            source = np.full(n_rows, n_rows)
+            valid = sorted_rows - segment_start >= day
+            source[order[valid]] = order[sorted_rows[valid] - day]
+            padded.take(source, axis=1, out=lags[:, i, :])
+        return lags.reshape(-1, n_rows)
+
+    def reset_state(self):
+        """ Forget history of incremental transforms. """
+        self.history_ = None
+
+# %% ../nbs/03_preprocessing.ipynb 95
 class DifferencePreProcessor(BaseProcessor):
     """
     Add difference features based on given windows. Run LagPreProcessor first.
@@ -642,6 +1556,7 @@ class DifferencePreProcessor(BaseProcessor):
     :param feature_names: All features for which you want to create differences. All features that also have lags by default. \n
     :param pct_change: Method to calculate differences. If True, will calculate differences with a percentage change. Otherwise calculates a simple difference. Defaults to False \n
     :param abs_diff: Whether to also calculate the absolute value of all differences. Defaults to True \n
+    Differences only use values of the same row, so new rows from an incremental `LagPreProcessor` can be passed directly.
     """
 
     def __init__(
@@ -660,27 +1575,39 @@ class DifferencePreProcessor(BaseProcessor):
     @display_processor_info
     def transform(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
         feature_names = self.feature_names if self.feature_names else dataf.feature_cols
-        for feature in tqdm(feature_names, desc="Difference feature generation"):
-            lag_columns = dataf.get_pattern_data(f"{feature}_lag").columns
-            if not lag_columns.empty:
-                for day in self.windows:
-                    differenced_values = (
-                        (dataf[feature] / dataf[f"{feature}_lag{day}"]) - 1
-                        if self.pct_diff
-                        else dataf[feature] - dataf[f"{feature}_lag{day}"]
-                    )
-                    dataf[f"{feature}_diff{day}"] = differenced_values
-                    if self.abs_diff:
-                        dataf[f"{feature}_absdiff{day}"] = np.abs(
-                            dataf[f"{feature}_diff{day}"]
-                        )
+        columns = set(dataf.columns)
+        features, lag_columns = [], []
+        for feature in feature_names:
+            feature_lags = [f"{feature}_lag{day}" for day in self.windows]
+            if all(col in columns for col in feature_lags):
+                features.append(feature)
+                lag_columns += feature_lags
             else:
                 rich_print(
                     f":warning: WARNING: Skipping {feature}. Lag features for feature: {feature} were not detected. Have you already run LagPreProcessor? :warning:"
                 )
-        return NumerFrame(dataf)
-
-# %% ../nbs/03_preprocessing.ipynb 81
+        if not features:
+            return NumerFrame.wrap(dataf)
+        # Current values (features x 1 x rows) broadcast against the (features x windows x rows) lag block.
+        current = dataf[features].to_numpy().T[:, None, :]
+        lags = dataf[lag_columns].to_numpy().T.reshape(len(features), len(self.windows), len(dataf))
+        dtype = np.result_type(current.dtype, lags.dtype)
+        diffs = np.empty((len(features), len(self.windows), 2 if self.abs_diff else 1, len(dataf)),
+                         dtype=dtype if dtype.kind == "f" else np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.pct_diff:
+                np.divide(current, lags, out=diffs[:, :, 0])
+                diffs[:, :, 0] -= 1
+            else:
+                np.subtract(current, lags, out=diffs[:, :, 0])
+        names = [f"{feature}_diff{day}" for feature in features for day in self.windows]
+        if self.abs_diff:
+            np.abs(diffs[:, :, 0], out=diffs[:, :, 1])
+            names = [name for feature in features for day in self.windows
+                     for name in (f"{feature}_diff{day}", f"{feature}_absdiff{day}")]
+        return NumerFrame.wrap(_add_columns(dataf, diffs.reshape(-1, len(dataf)), names))
+
+# %% ../nbs/03_preprocessing.ipynb 101
 class PandasTaFeatureGenerator:
     """
     Generate features with pandas-ta.
@@ -693,15 +1620,34 @@ class PandasTaFeatureGenerator:
     :param ticker_col: Column name for grouping by tickers. \n
     :param num_cores: Number of cores to use for multiprocessing. \n
     By default, all available cores are used. \n
+    :param chunk_size: Number of tickers that are sent to a worker at once. \n
+    :param pool: TickerPanelPool to run on. Shared pool for `num_cores` by default. \n
+    :param incremental: Only compute features for new rows on every transform.
+    The last `lookback` rows of every ticker are kept on the processor (`history_`) and the strategy
+    is applied to these rows together with the new rows.
+    Rows of every ticker should be passed in date order and only once. \n
+    :param lookback: Number of rows per ticker to keep in incremental mode.
+    Should be larger than the longest indicator window. Indicators with infinite memory (like EMA based RSI)
+    converge to the full history result for long lookbacks. \n
     """
     def __init__(self, 
-                 strategy: ta.Strategy = None,
+                 strategy: "ta.Strategy" = None,
                  ticker_col: str = "ticker",
                  num_cores: int = None,
+                 chunk_size: int = 64,
+                 pool: TickerPanelPool = None,
+                 incremental: bool = False,
+                 lookback: int = 300,
     ):
         super().__init__()
+        import pandas_ta as ta
+        self.incremental = incremental
+        self.lookback = lookback
+        self.history_ = None
         self.ticker_col = ticker_col
         self.num_cores = num_cores if num_cores else os.cpu_count()
+        self.chunk_size = chunk_size
+        self.pool = pool if pool is not None else TickerPanelPool.shared(self.num_cores)
         standard_strategy = ta.Strategy(name="standard", 
                                         ta=[{"kind": "rsi", "length": 14, "col_names": ("feature_RSI_14")},
                                             {"kind": "rsi", "length": 60, "col_names": ("feature_RSI_60")}])
@@ -714,30 +1660,34 @@ class PandasTaFeatureGenerator:
         :param dataf: DataFrame with columns: [ticker, date, open, high, low, close, volume] \n
         :return: DataFrame with features added.
         """
-        dataf_list = [
-            x
-            for _, x in tqdm(
-                dataf.groupby(self.ticker_col), desc="Generating ticker DataFrames"
-            )
-        ]
-        dataf = self._generate_features(dataf_list=dataf_list)
-        return NumerFrame(dataf)
-    
-    def _generate_features(self, dataf_list: List[pd.DataFrame]) -> pd.DataFrame:
-        """
-        Add features for list of ticker DataFrames and concatenate.
-        :param dataf_list: List of DataFrames for each ticker.
-        :return: Concatenated DataFrame for all full list with features added.
-        """
-        with Pool(self.num_cores) as p:
-            feature_datafs = list(
-                tqdm(
-                    p.imap(self.add_features, dataf_list),
-                    desc="Generating pandas-ta features",
-                    total=len(dataf_list),
-                )
-            )
-        return pd.concat(feature_datafs)
+        combined, n_history = dataf, 0
+        if self.incremental and self.history_ is not None:
+            # History rows keep their original index and columns, so the strategy sees the same ticker frames.
+            combined, n_history = pd.concat([self.history_, dataf]), len(self.history_)
+        if self.incremental:
+            self.history_ = combined.groupby(self.ticker_col, sort=False).tail(self.lookback)
+        output_cols = self._feature_names(combined)
+        # The strategy gets the original ticker frames (index and all columns), as pandas-ta may need a DatetimeIndex.
+        order, features = self.pool.map_frames(self.add_features, combined, self.ticker_col, output_cols=output_cols,
+                                               chunk_size=self.chunk_size, desc="Generating pandas-ta features")
+        is_new = order >= n_history
+        dataf = dataf.take(order[is_new] - n_history)
+        dataf[output_cols] = features[is_new]
+        return NumerFrame.wrap(dataf)
+
+    def reset_state(self):
+        """ Forget history of incremental transforms. """
+        self.history_ = None
+
+    def _feature_names(self, dataf: pd.DataFrame) -> List[str]:
+        """
+        Columns added by the strategy, so all tickers return the same output columns.
+        Strategy is applied to the ticker with the longest history.
+        """
+        counts = dataf[self.ticker_col].value_counts()
+        ticker_df = dataf[dataf[self.ticker_col] == counts.index[0]].copy()
+        input_cols = ticker_df.columns.tolist()
+        return [col for col in self.add_features(ticker_df).columns if col not in input_cols]
 
     def add_features(self, ticker_df: pd.DataFrame) -> pd.DataFrame:
         """ 
@@ -745,12 +1695,14 @@ class PandasTaFeatureGenerator:
         :param ticker_df: DataFrame for a single ticker.
         :return: DataFrame with features added.
         """
+        # Importing pandas_ta registers the DataFrame.ta accessor (also needed in worker processes).
+        import pandas_ta
         # We use a different multiprocessing engine so shutting off pandas_ta's multiprocessing
         ticker_df.ta.cores = 0
         ticker_df.ta.strategy(self.strategy)
         return ticker_df
 
-# %% ../nbs/03_preprocessing.ipynb 90
+# %% ../nbs/03_preprocessing.ipynb 111
 class AwesomePreProcessor(BaseProcessor):
     """ TEMPLATE - Do some awesome preprocessing. """
     def __init__(self):
@@ -761,4 +1713,4 @@ class AwesomePreProcessor(BaseProcessor):
         # Do processing
         ...
         # Parse all contents of NumerFrame to the next pipeline step
-        return NumerFrame(dataf)
+        return NumerFrame.wrap(dataf)